@@ -6,6 +6,7 @@ import io
 import os
 import secrets
 import shlex
+import signal
 import sys
 import tempfile
 import time
@@ -19,8 +20,8 @@ import shutil
 import subprocess
 import threading
 import zipfile
-from collections import deque
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from functools import wraps
 from pathlib import Path
 from typing import Any
@@ -28,10 +29,11 @@ from typing import Any
 from mnemonic import Mnemonic
 from flask import (
     Flask, render_template, request, redirect,
-    url_for, flash, session, jsonify, send_file
+    url_for, flash, session, jsonify, send_file, g
 )
 from flask_wtf.csrf import CSRFProtect
 from werkzeug.middleware.proxy_fix import ProxyFix
+from requests.exceptions import Timeout as RequestTimeout
 from tunnel_utils import (
     build_connect_script,
     choose_invoice_action,
@@ -56,6 +58,25 @@ from recovery_utils import (
     validate_manifest_files,
     write_json_file,
 )
+from metrics_store import MetricsStore
+from stats_utils import (
+    ColumnarHistory, ProbeScheduler, SingleFlight, StaleWhileRevalidate, gather_sections,
+    parse_duration,
+)
+from systemd_utils import UNIT_PROPERTIES, UnitStateCache
+from process_utils import ProcessSampler
+from storage_utils import DiskIOSampler, fill_eta, parse_pressure, sqlite_file_sizes
+from openmetrics import CONTENT_TYPE as OPENMETRICS_CONTENT_TYPE, Histogram, MetricsWriter
+from perf_utils import CallRecorder, LatencyWindow, health_state, server_timing_header
+from command_utils import CommandRunner
+from http_utils import CircuitOpenError, UpstreamClients
+from funding_clients import ArkadeClient, EventLoopThread, PhoenixdClient, SparkClient, gather_funding
+from supervisor_utils import LeaderLock, Supervisor, Worker
+from job_utils import JobConflictError, JobQueue
+from netlink_utils import NetlinkMonitor, NetworkState, ReachabilityProbe
+from asset_utils import ASSET_BUNDLES, ASSET_TYPES, load_manifest
+from file_utils import FileCache
+from server_utils import WaitressRunner
 
 app = Flask(__name__, static_url_path="/box/static")
 app.secret_key = os.urandom(24)
@@ -171,15 +192,117 @@ RECOVERY_DESTINATIONS = {
     },
 }
 
-# Stats history — 2 hours at 30s intervals = 240 data points
-STATS_INTERVAL = 30
+# Stats collection — the collector ticks every 5s and each probe runs on its own
+# interval (see stats_probes). History keeps 2 hours at 30s intervals = 240 data points
+STATS_TICK_INTERVAL = 5
+stats_wakeup = threading.Event()
+STATS_HISTORY_INTERVAL = 30
 STATS_HISTORY_SIZE = 240
-stats_history = deque(maxlen=STATS_HISTORY_SIZE)
+STATS_STALE_AFTER = STATS_TICK_INTERVAL * 3
+# Probes run concurrently; a cycle waits at most this long before serving late probes' last values
+STATS_PROBE_DEADLINE = 4
+STATS_PROBE_WORKERS = 4
+# Units whose processes get per-service CPU/RSS/FD/thread accounting
+PROCESS_SERVICES = ALLOWED_SERVICES + ["caddy", TUNNEL_SERVICE_NAME]
+PROCESS_HISTORY_COLUMNS = tuple(
+    f"{svc}.{field}" for svc in PROCESS_SERVICES for field in ("cpu", "rss")
+)
+STORAGE_HISTORY_COLUMNS = ("disk_read_bps", "disk_write_bps", "disk_await_ms", "io_pressure", "db_mb", "db_wal_mb")
+# LNbits health-check response time, p50/p95 over the last LNBITS_LATENCY_WINDOW seconds
+LNBITS_HISTORY_COLUMNS = ("lnbits_p50_ms", "lnbits_p95_ms")
+# Phoenixd balance and liquidity, persisted only (see /box/api/funding-sources/phoenixd/history)
+LIQUIDITY_HISTORY_COLUMNS = (
+    "phoenixd_balance", "phoenixd_fee_credit", "phoenixd_channels", "phoenixd_outbound", "phoenixd_inbound",
+)
+LIQUIDITY_HISTORY_RANGE = 7 * 86400
+# Disk-full ETA is fitted over this much of the stored disk usage history
+DISK_FORECAST_WINDOW = 24 * 3600
+# Chart history keeps only the plotted metrics as typed columns; the full nested
+# snapshot lives in stats_snapshot["current"]
+stats_history = ColumnarHistory(
+    {
+        "timestamp": "d", "cpu": "d", "ram": "d", "temp": "d",
+        **{column: "d" for column in STORAGE_HISTORY_COLUMNS + PROCESS_HISTORY_COLUMNS + LNBITS_HISTORY_COLUMNS},
+    },
+    STATS_HISTORY_SIZE,
+)
 stats_lock = threading.Lock()
-
-# WiFi connection state
-wifi_connect_status = {"status": "idle", "message": "", "ip": ""}
-wifi_connect_lock = threading.Lock()
+# Notified (under stats_lock) whenever the collector publishes a new snapshot
+stats_changed = threading.Condition(stats_lock)
+# Latest full snapshot from the collector; api_stats serves this instead of re-probing
+stats_snapshot: dict[str, Any] = {
+    "current": None,
+    "collected_at": None,
+    "collected_monotonic": 0.0,
+    "history_appended_monotonic": 0.0,
+    "version": 0,
+}
+# Distinguishes history cursors/ETags handed out before an admin restart
+STATS_EPOCH = secrets.token_hex(4)
+
+# Live stats stream (SSE) — every subscriber is fed from the single collector
+STATS_STREAM_HEARTBEAT = 15
+STATS_STREAM_MAX_CLIENTS = 8
+_stats_stream_lock = threading.Lock()
+_stats_stream = {"clients": 0}
+# Set on shutdown so open streams end instead of holding a worker until the next heartbeat
+stats_stream_closing = threading.Event()
+_stats_refresh = SingleFlight()
+
+# Persistent metrics history — memory-mapped ring file with 30s raw, 5m and 1h rollups
+METRICS_STORE_FILE = LNBITSBOX_STATE_DIR / "metrics.ring"
+METRICS_STORE_FIELDS = (
+    ("cpu", "ram", "temp", "disk", "lnbits_up", "funding_up", "tor_up")
+    + STORAGE_HISTORY_COLUMNS
+    + PROCESS_HISTORY_COLUMNS
+    + LIQUIDITY_HISTORY_COLUMNS
+    + LNBITS_HISTORY_COLUMNS
+)
+METRICS_MAX_RANGE = 90 * 86400
+_metrics_store_lock = threading.Lock()
+_metrics_store: dict[str, Any] = {"store": None, "error": None}
+
+# Prometheus/OpenMetrics export — bearer token read from the environment or this file
+METRICS_TOKEN_FILE = LNBITSBOX_STATE_DIR / "metrics-token"
+probe_latency = Histogram(("probe",))
+route_latency = Histogram(("method", "route"))
+
+# Route, subprocess and outbound HTTP timings (see /box/api/debug/perf); the optional
+# Server-Timing header breaks each response down into subprocess/http time
+perf_calls = CallRecorder()
+SERVER_TIMING_ENABLED = os.environ.get("LNBITSBOX_SERVER_TIMING", "").strip().lower() in {"1", "true", "yes"}
+
+# Every subprocess goes through one runner: identical in-flight commands are joined, read-only
+# results (systemctl show, ip addr, wpa_cli status, ...) are cached briefly, and at most this
+# many children run at once
+COMMAND_MAX_CONCURRENT = 4
+command_runner = CommandRunner(recorder=perf_calls, max_concurrent=COMMAND_MAX_CONCURRENT)
+
+# Outbound HTTP — one keep-alive session per upstream with (connect, read) timeouts. Local
+# sidecars sit behind circuit breakers: after 3 failures in a row calls fail fast for 30s
+HTTP_BREAKER_FAILURES = 3
+HTTP_BREAKER_COOLDOWN = 30
+http_clients = UpstreamClients(perf_calls, failure_threshold=HTTP_BREAKER_FAILURES, cooldown=HTTP_BREAKER_COOLDOWN)
+for _upstream, _timeout, _breaker in (
+    ("spark", (2, 5), True),
+    ("arkade", (2, 5), True),
+    ("phoenixd", (2, 5), True),
+    ("lnbits", (2, 3), True),
+    ("lnpro", (5, 20), False),
+    ("github", (5, 10), False),
+):
+    http_clients.configure(_upstream, timeout=_timeout, breaker=_breaker)
+
+# Long-running operations (backup, restore, Wi-Fi connect, tunnel start, OTA update,
+# factory reset) run as jobs: routes return a job id and the UI polls /box/api/jobs/<id>.
+# Manual and scheduled backups and restores share the "recovery" kind because all of them
+# stop services
+JOBS_STATE_FILE = LNBITSBOX_STATE_DIR / "admin-jobs.json"
+JOB_CONCURRENCY = {"recovery": 1, "wifi": 1, "tunnel": 1, "update": 1, "factory_reset": 1}
+jobs = JobQueue(JOBS_STATE_FILE, limits=JOB_CONCURRENCY)
+RECOVERY_DOWNLOAD_DIR = RECOVERY_STATE_DIR / "downloads"
+RECOVERY_DOWNLOAD_MAX_AGE = 3600
+UPDATE_FOLLOW_TIMEOUT = 3 * 3600
 
 # Tunnel remote sync state
 TUNNEL_REMOTE_SYNC_MIN_INTERVAL = 10
@@ -215,34 +338,49 @@ LOG_SERVICE_BY_KEY = {entry["key"]: entry for entry in LOG_SERVICE_OPTIONS}
 FUNDING_LOG_KEYS = {"spark", "ark", "phoenixd"}
 
 
-def _read_key_value_file(path: Path) -> dict[str, str]:
+def run_command(args, *, cache_ttl: float | None = None, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run() through the shared command runner; cache_ttl=0 forces a fresh read"""
+    return command_runner.run(args, cache_ttl=cache_ttl, **kwargs)
+
+
+def http_request(target: str, method: str, url: str, **kwargs):
+    """Request through the pooled client for `target`; raises CircuitOpenError while its breaker is open"""
+    return http_clients.request(target, method, url, **kwargs)
+
+
+# Config and secret files read on every stats cycle or page render are served from memory
+# until their inode/mtime/size change; every write helper below invalidates what it writes
+file_cache = FileCache()
+
+
+def _parse_key_value(text: str) -> dict[str, str]:
     values: dict[str, str] = {}
-    try:
-        for line in path.read_text().splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#") or "=" not in stripped:
-                continue
-            key, value = stripped.split("=", 1)
-            values[key.strip()] = value.strip().strip('"').strip("'")
-    except Exception:
-        pass
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or "=" not in stripped:
+            continue
+        key, value = stripped.split("=", 1)
+        values[key.strip()] = value.strip().strip('"').strip("'")
     return values
 
 
+def _read_key_value_file(path: Path) -> dict[str, str]:
+    # Copy so callers cannot modify the cached dict
+    return dict(file_cache.read(path, _parse_key_value, default={}))
+
+
 def _read_selected_funding_source() -> str:
-    try:
-        selected = FUNDING_SOURCE_STATE_FILE.read_text().strip()
-        if selected in FUNDING_SOURCES:
-            return selected
-    except Exception:
-        pass
-    return "spark"
+    selected = file_cache.read(FUNDING_SOURCE_STATE_FILE, str.strip)
+    return selected if selected in FUNDING_SOURCES else "spark"
 
 
 def _write_selected_funding_source(source: str):
     FUNDING_SOURCE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
     FUNDING_SOURCE_STATE_FILE.write_text(source + "\n")
     FUNDING_SOURCE_STATE_FILE.chmod(0o644)
+    file_cache.invalidate(FUNDING_SOURCE_STATE_FILE)
+    # The cached payload describes the previous backend; the next read loads the new one
+    funding_status.clear()
 
 
 def _read_phoenixd_api_password() -> str:
@@ -257,6 +395,7 @@ def _write_sidecar_api_key(path: Path, group: str, field: str, value: str):
     path.parent.mkdir(parents=True, exist_ok=True, mode=0o750)
     path.write_text(f"{field}={value}\n")
     path.chmod(0o640)
+    file_cache.invalidate(path)
     try:
         shutil.chown(path, user="root", group=group)
     except Exception:
@@ -345,43 +484,58 @@ def _update_lnbits_funding_source_env(source: str):
 
 def _funding_sources_payload() -> dict[str, Any]:
     selected = _read_selected_funding_source()
+    sources = {
+        key: {
+            "label": value["label"],
+            "service": value["service"],
+            "selected": key == selected,
+            "service_status": get_service_status(value["service"]) if value["service"] else "unavailable",
+        }
+        for key, value in FUNDING_SOURCES.items()
+    }
+    # Selected backend's status and the health of every running backend, fetched concurrently
+    running = [key for key, source in sources.items() if source["service_status"] == "active"]
+    status, health = funding_loop.run(gather_funding(funding_clients, selected, running))
+    status = status or {}
     return {
         "selected": selected,
-        "sources": {
-            key: {
-                "label": value["label"],
-                "service": value["service"],
-                "selected": key == selected,
-                "service_status": get_service_status(value["service"]) if value["service"] else "unavailable",
-            }
-            for key, value in FUNDING_SOURCES.items()
-        },
+        "sources": sources,
         "spark": {
-            "balance": get_spark_balance() if selected == "spark" else None,
+            "balance": status.get("balance") if selected == "spark" else None,
             "seed_present": bool(_read_spark_mnemonic()),
         },
-        "arkade": (
-            get_arkade_status()
-            if selected == "ark"
-            else {
-                "seed_present": bool(_read_arkade_mnemonic()),
-                "balance": None,
-                "mnemonic_missing": False,
-            }
-        ),
-        "phoenixd": (
-            get_phoenixd_status()
-            if selected == "phoenixd"
-            else {
-                "seed_present": bool(_read_phoenixd_seed()),
-                "balance": None,
-                "channels": [],
-                "channel_count": 0,
-            }
-        ),
+        "arkade": {
+            "seed_present": bool(_read_arkade_mnemonic()),
+            "balance": status.get("balance") if selected == "ark" else None,
+            "mnemonic_missing": bool(status.get("mnemonic_missing")) if selected == "ark" else False,
+        },
+        "phoenixd": {
+            "seed_present": bool(_read_phoenixd_seed()),
+            "balance": None,
+            "channels": [],
+            "channel_count": 0,
+            "liquidity": None,
+            **(status if selected == "phoenixd" else {}),
+        },
+        "health": health,
+        "breakers": http_clients.breakers("spark", "arkade", "phoenixd"),
     }
 
 
+# Funding-source status is served from cache: refreshed in the background every
+# FUNDING_STATUS_REFRESH seconds (see stats_probes), revalidated on read once older than
+# that, and never served older than FUNDING_STATUS_MAX_AGE
+FUNDING_STATUS_REFRESH = 20
+FUNDING_STATUS_MAX_AGE = 60
+funding_status = StaleWhileRevalidate(
+    _funding_sources_payload, refresh_after=FUNDING_STATUS_REFRESH, max_age=FUNDING_STATUS_MAX_AGE,
+)
+
+
+def _funding_status_payload() -> dict[str, Any]:
+    return {**funding_status.get(), "cache": funding_status.status()}
+
+
 def _selected_funding_service() -> str | None:
     source = FUNDING_SOURCES.get(_read_selected_funding_source(), {})
     return source.get("service") or None
@@ -422,6 +576,18 @@ def _json_error(message: str, status_code: int = 500, **payload):
     return _json_response(status="error", message=message, status_code=status_code, **payload)
 
 
+def _job_response(job: dict[str, Any], message: str, **payload):
+    return _json_response(
+        status="ok",
+        message=message,
+        job_id=job["id"],
+        job=job,
+        data={"job_id": job["id"], "job": job, **payload},
+        status_code=202,
+        **payload,
+    )
+
+
 def _get_log_service(service_key: str) -> dict[str, str]:
     service = LOG_SERVICE_BY_KEY.get(service_key)
     if not service:
@@ -446,7 +612,7 @@ def _run_journalctl(unit_name: str | None, *, lines: int | None = None) -> str:
     if lines is not None:
         args.extend(["-n", str(lines)])
 
-    result = subprocess.run(
+    result = run_command(
         args,
         capture_output=True,
         text=True,
@@ -463,8 +629,10 @@ def _run_journalctl(unit_name: str | None, *, lines: int | None = None) -> str:
 def _remove_path(path: Path):
     if path.is_symlink() or path.is_file():
         path.unlink(missing_ok=True)
+        file_cache.invalidate(path)
     elif path.exists():
         shutil.rmtree(path)
+        file_cache.invalidate()
 
 
 def _perform_factory_reset_dev_mode():
@@ -488,7 +656,7 @@ def _start_factory_reset():
         return
 
     reset_command = Path("/run/current-system/sw/bin/lnbitspi-factory-reset")
-    subprocess.run(
+    run_command(
         [
             "systemd-run",
             "--no-block",
@@ -543,21 +711,12 @@ def _get_or_create_tunnel_client_id() -> tuple[str, dict[str, Any]]:
 def _tunnel_service_status() -> str:
     if DEV_MODE:
         return "inactive"
-    try:
-        result = subprocess.run(
-            ["systemctl", "is-active", f"{TUNNEL_SERVICE_NAME}.service"],
-            capture_output=True, text=True, timeout=5
-        )
-        return result.stdout.strip() or "unknown"
-    except Exception:
-        return "unknown"
+    return unit_states.active_state(TUNNEL_SERVICE_NAME)
 
 
 def _lnpro_request(method: str, endpoint: str, json_body: dict[str, Any] | None = None):
-    import requests
-
     url = f"{TUNNEL_API_BASE_URL}/{endpoint.lstrip('/')}"
-    return requests.request(method, url, json=json_body, timeout=20)
+    return http_request("lnpro", method, url, json=json_body)
 
 
 def _normalize_tunnel(remote: dict[str, Any]) -> dict[str, Any]:
@@ -644,29 +803,19 @@ def _write_key_file(private_key: str):
     _ensure_tunnel_state_dir()
     TUNNEL_KEY_FILE.write_text(private_key, encoding="utf-8")
     os.chmod(TUNNEL_KEY_FILE, 0o600)
+    file_cache.invalidate(TUNNEL_KEY_FILE)
 
 
 def _read_key_file() -> str | None:
-    try:
-        return TUNNEL_KEY_FILE.read_text(encoding="utf-8")
-    except Exception:
-        return None
+    return file_cache.read(TUNNEL_KEY_FILE)
 
 
 def _read_spark_mnemonic() -> str | None:
-    try:
-        mnemonic = SPARK_MNEMONIC_FILE.read_text(encoding="utf-8").strip()
-        return mnemonic or None
-    except Exception:
-        return None
+    return file_cache.read(SPARK_MNEMONIC_FILE, str.strip) or None
 
 
 def _read_arkade_mnemonic() -> str | None:
-    try:
-        mnemonic = ARKADE_MNEMONIC_FILE.read_text(encoding="utf-8").strip()
-        return mnemonic or None
-    except Exception:
-        return None
+    return file_cache.read(ARKADE_MNEMONIC_FILE, str.strip) or None
 
 
 def _normalize_mnemonic(value: str) -> str:
@@ -697,6 +846,8 @@ def _write_spark_mnemonic(mnemonic: str):
                 tmp_path.unlink()
             except OSError:
                 pass
+    file_cache.invalidate(SPARK_MNEMONIC_FILE)
+    funding_status.invalidate()
 
 
 def _write_arkade_mnemonic(mnemonic: str):
@@ -723,6 +874,8 @@ def _write_arkade_mnemonic(mnemonic: str):
                 tmp_path.unlink()
             except OSError:
                 pass
+    file_cache.invalidate(ARKADE_MNEMONIC_FILE)
+    funding_status.invalidate()
 
 
 def _runtime_env_content(tunnel: dict[str, Any]) -> str:
@@ -746,33 +899,52 @@ def _write_runtime_env(tunnel: dict[str, Any]):
     os.chmod(TUNNEL_RUNTIME_ENV, 0o600)
 
 
-def _start_tunnel_service_if_needed(tunnel: dict[str, Any], service_status: str | None = None) -> tuple[bool, str]:
+def _tunnel_start_blocker(tunnel: dict[str, Any], service_status: str | None = None) -> str | None:
+    """Reason the tunnel service should not be started, or None"""
     if not tunnel.get("tunnel_id"):
-        return False, "No tunnel configured"
+        return "No tunnel configured"
     if not tunnel.get("remote_port"):
-        return False, "Tunnel remote port missing"
+        return "Tunnel remote port missing"
     if not TUNNEL_KEY_FILE.exists():
-        return False, "Tunnel key not found. Create tunnel again."
+        return "Tunnel key not found. Create tunnel again."
+    if (service_status or _tunnel_service_status()) == "active":
+        return "Tunnel service already active"
+    return None
 
-    current_status = service_status or _tunnel_service_status()
-    if current_status == "active":
-        return False, "Tunnel service already active"
+
+def _start_tunnel_service_if_needed(tunnel: dict[str, Any], service_status: str | None = None) -> tuple[bool, str]:
+    blocker = _tunnel_start_blocker(tunnel, service_status)
+    if blocker:
+        return False, blocker
 
     if DEV_MODE:
         return True, "DEV MODE: would start tunnel service"
 
     _write_runtime_env(tunnel)
-    subprocess.run(
+    run_command(
         ["systemctl", "enable", f"{TUNNEL_SERVICE_NAME}.service"],
         check=True, capture_output=True, timeout=20
     )
-    subprocess.run(
+    run_command(
         ["systemctl", "restart", f"{TUNNEL_SERVICE_NAME}.service"],
         check=True, capture_output=True, timeout=20
     )
     return True, "Tunnel service restarted"
 
 
+def _submit_tunnel_start(tunnel: dict[str, Any]) -> dict[str, Any]:
+    """Start the tunnel service in a job; systemctl enable + restart can take up to 40s"""
+    def run(report):
+        report(10, "Starting tunnel service")
+        try:
+            started, message = _start_tunnel_service_if_needed(tunnel)
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(exc.stderr.decode() or "Failed to start tunnel service") from exc
+        return {"started": started, "message": message}
+
+    return jobs.submit("tunnel", run, title="Start tunnel service", exclusive=True)
+
+
 def _tunnel_connect_script(tunnel: dict[str, Any] | None) -> str | None:
     if not tunnel:
         return None
@@ -1094,6 +1266,7 @@ def _write_restored_file(destination_path: Path, payload: bytes, mode_value: str
                 tmp_path.unlink()
             except OSError:
                 pass
+        file_cache.invalidate(destination_path)
 
 
 def _services_for_restore(components: list[str]) -> list[str]:
@@ -1115,14 +1288,14 @@ def _stop_services(service_names: list[str]):
     if DEV_MODE:
         return
     for service in service_names:
-        subprocess.run(["systemctl", "stop", service], capture_output=True, timeout=30, check=False)
+        run_command(["systemctl", "stop", service], capture_output=True, timeout=30, check=False)
 
 
 def _start_services(service_names: list[str]):
     if DEV_MODE:
         return
     for service in service_names:
-        subprocess.run(["systemctl", "start", service], capture_output=True, timeout=30, check=False)
+        run_command(["systemctl", "start", service], capture_output=True, timeout=30, check=False)
 
 
 def _restore_component_ownership(component: str, destination_path: Path):
@@ -1281,45 +1454,64 @@ def _prune_scheduled_backups():
             pass
 
 
-def _scheduled_backup_worker():
-    while True:
-        try:
-            schedule = _recovery_schedule()
-            if schedule.get("enabled"):
-                interval_hours = max(1, int(schedule.get("interval_hours") or 24))
-                now = time.time()
-                next_run_at = schedule.get("next_run_at")
-                if not next_run_at or now >= float(next_run_at):
-                    passphrase = schedule.get("passphrase", "")
-                    if not passphrase:
-                        raise ValueError("Scheduled backup passphrase is missing.")
-                    content, manifest = _create_recovery_backup_bytes(
-                        passphrase=passphrase,
-                        created_by="scheduled",
-                    )
-                    backup_result = _write_recovery_destination_file(
-                        schedule.get("destination", "local"),
-                        content,
-                        manifest,
-                    )
-                    _prune_scheduled_backups()
-                    schedule["last_run_at"] = now
-                    schedule["next_run_at"] = now + (interval_hours * 3600)
-                    schedule["last_result"] = {
-                        "status": "ok",
-                        "message": f"Last scheduled backup saved to {backup_result['path']}",
-                        "created_at": manifest["created_at"],
-                    }
-                    _save_recovery_schedule(schedule)
-        except Exception as exc:
-            schedule = _recovery_schedule()
-            schedule["last_result"] = {
-                "status": "error",
-                "message": str(exc),
-                "created_at": utc_now_iso(),
-            }
-            _save_recovery_schedule(schedule)
-        time.sleep(60)
+def _scheduled_backup_job(report) -> dict[str, Any]:
+    """Job body for a due scheduled backup; the outcome is recorded in the schedule's last_result"""
+    schedule = _recovery_schedule()
+    try:
+        passphrase = schedule.get("passphrase", "")
+        if not passphrase:
+            raise ValueError("Scheduled backup passphrase is missing.")
+        report(10, "Creating encrypted backup")
+        content, manifest = _create_recovery_backup_bytes(
+            passphrase=passphrase,
+            created_by="scheduled",
+        )
+        report(80, "Saving scheduled backup")
+        backup_result = _write_recovery_destination_file(
+            schedule.get("destination", "local"),
+            content,
+            manifest,
+        )
+        _prune_scheduled_backups()
+    except Exception as exc:
+        schedule = _recovery_schedule()
+        schedule["last_result"] = {
+            "status": "error",
+            "message": str(exc),
+            "created_at": utc_now_iso(),
+        }
+        _save_recovery_schedule(schedule)
+        raise
+    now = time.time()
+    schedule = _recovery_schedule()
+    interval_hours = max(1, int(schedule.get("interval_hours") or 24))
+    schedule["last_run_at"] = now
+    schedule["next_run_at"] = now + (interval_hours * 3600)
+    schedule["last_result"] = {
+        "status": "ok",
+        "message": f"Last scheduled backup saved to {backup_result['path']}",
+        "created_at": manifest["created_at"],
+    }
+    _save_recovery_schedule(schedule)
+    return {**backup_result, "message": schedule["last_result"]["message"]}
+
+
+def _run_scheduled_backup():
+    """
+    Submit the scheduled backup if one is due; run every minute by the backup worker.
+    It runs as an exclusive "recovery" job, so it never overlaps a manual backup or a
+    restore; while one of those is running the backup is retried on the next tick.
+    """
+    schedule = _recovery_schedule()
+    if not schedule.get("enabled"):
+        return
+    next_run_at = schedule.get("next_run_at")
+    if next_run_at and time.time() < float(next_run_at):
+        return
+    try:
+        jobs.submit("recovery", _scheduled_backup_job, title="Scheduled backup", exclusive=True)
+    except JobConflictError:
+        pass
 
 
 # ── Network Helpers ─────────────────────────────────────────────────
@@ -1335,15 +1527,56 @@ def get_wifi_interface():
     return None
 
 
-def wpa_cli(iface, *args, timeout=5, check=False):
+def wpa_cli(iface, *args, timeout=5, check=False, cache_ttl=None):
     """Run wpa_cli via control socket (not D-Bus) with stdin closed"""
-    return subprocess.run(
+    return run_command(
         ["wpa_cli", "-p", "/run/wpa_supplicant", "-i", iface, *args],
         capture_output=True, text=True, timeout=timeout,
-        stdin=subprocess.DEVNULL, check=check,
+        stdin=subprocess.DEVNULL, check=check, cache_ttl=cache_ttl,
     )
 
 
+# Interface and address tables kept current from rtnetlink events; wpa_cli is only asked
+# for the SSID when the WiFi link changes or the cached answer is older than this
+WIFI_SSID_REFRESH = 60
+
+network_state = NetworkState()
+internet_probe = ReachabilityProbe()
+_wifi_ssid_cache = {"key": None, "checked_at": 0.0, "ssid": ""}
+_wifi_ssid_lock = threading.Lock()
+
+
+def _on_network_change(names):
+    """Link or address changed: re-check reachability and refresh network stats now"""
+    internet_probe.reset()
+    stats_probes.expire("network")
+    stats_wakeup.set()
+
+
+network_monitor = NetlinkMonitor(network_state, on_change=_on_network_change)
+
+
+def _wifi_ssid(iface, link):
+    """SSID of the associated network, cached until the WiFi link changes"""
+    key = (iface, link["carrier"], tuple(link["ipv4"]))
+    with _wifi_ssid_lock:
+        if _wifi_ssid_cache["key"] == key and time.monotonic() - _wifi_ssid_cache["checked_at"] < WIFI_SSID_REFRESH:
+            return _wifi_ssid_cache["ssid"]
+    ssid = ""
+    try:
+        result = wpa_cli(iface, "status")
+        if result.returncode == 0:
+            for line in result.stdout.strip().splitlines():
+                if line.startswith("ssid="):
+                    ssid = line.split("=", 1)[1]
+                    break
+    except Exception:
+        pass
+    with _wifi_ssid_lock:
+        _wifi_ssid_cache.update(key=key, checked_at=time.monotonic(), ssid=ssid)
+    return ssid
+
+
 def get_network_info():
     """Return network connectivity info: internet, wifi, ethernet"""
     if DEV_MODE:
@@ -1352,61 +1585,34 @@ def get_network_info():
             "wifi": {"ssid": "HomeNetwork", "ip": "192.168.1.100", "interface": "wlan0"},
             "ethernet": {"interface": "eth0", "ip": "192.168.1.50"},
         }
-    info = {"internet": False, "wifi": None, "ethernet": None}
-
-    # Internet check — ping 1.1.1.1
-    try:
-        result = subprocess.run(
-            ["ping", "-c", "1", "-W", "2", "1.1.1.1"],
-            capture_output=True, timeout=5,
-        )
-        info["internet"] = result.returncode == 0
-    except Exception:
-        pass
+    reachability = internet_probe.check()
+    info = {
+        "internet": reachability["internet"],
+        "wifi": None,
+        "ethernet": None,
+        "reachability": reachability,
+        "netlink": {"connected": network_monitor.connected, "error": network_monitor.error},
+    }
+    interfaces = network_state.interfaces()
 
-    # WiFi — via wpa_cli status
+    # WiFi — associated link with an address
     wifi_iface = get_wifi_interface()
-    if wifi_iface:
-        try:
-            result = wpa_cli(wifi_iface, "status")
-            if result.returncode == 0:
-                wpa = {}
-                for line in result.stdout.strip().splitlines():
-                    if "=" in line:
-                        k, v = line.split("=", 1)
-                        wpa[k] = v
-                if wpa.get("wpa_state") == "COMPLETED":
-                    info["wifi"] = {
-                        "ssid": wpa.get("ssid", ""),
-                        "ip": wpa.get("ip_address", ""),
-                        "interface": wifi_iface,
-                    }
-        except Exception:
-            pass
+    link = interfaces.get(wifi_iface) if wifi_iface else None
+    if link and link["carrier"] and link["ipv4"]:
+        info["wifi"] = {
+            "ssid": _wifi_ssid(wifi_iface, link),
+            "ip": link["ipv4"][0],
+            "interface": wifi_iface,
+        }
 
-    # Ethernet — via ip -j addr show
-    try:
-        result = subprocess.run(
-            ["ip", "-j", "addr", "show"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode == 0:
-            ifaces = json.loads(result.stdout)
-            for iface in ifaces:
-                name = iface.get("ifname", "")
-                if not (name.startswith("eth") or name.startswith("en")):
-                    continue
-                for addr_info in iface.get("addr_info", []):
-                    if addr_info.get("family") == "inet":
-                        info["ethernet"] = {
-                            "interface": name,
-                            "ip": addr_info.get("local", ""),
-                        }
-                        break
-                if info["ethernet"]:
-                    break
-    except Exception:
-        pass
+    # Ethernet — first wired link with carrier and an IPv4 address
+    for name in sorted(interfaces):
+        link = interfaces[name]
+        if not (name.startswith("eth") or name.startswith("en")):
+            continue
+        if link["carrier"] and link["ipv4"]:
+            info["ethernet"] = {"interface": name, "ip": link["ipv4"][0]}
+            break
 
     return info
 
@@ -1476,6 +1682,26 @@ def login_required(f):
     return decorated
 
 
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+    perf_calls.begin()
+
+
+@app.after_request
+def _observe_request_latency(response):
+    started = g.pop("request_started", None)
+    spans = perf_calls.end()
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        route_latency.observe((request.method, route), elapsed)
+        perf_calls.record("route", f"{request.method} {route}", elapsed, error=response.status_code >= 500)
+        if SERVER_TIMING_ENABLED:
+            response.headers["Server-Timing"] = server_timing_header(elapsed, spans)
+    return response
+
+
 # ── Stats Collection ────────────────────────────────────────────────
 
 def get_cpu_temp():
@@ -1497,140 +1723,51 @@ def get_uptime():
         return {"seconds": 0, "formatted": "unknown"}
 
 
-def get_service_status(service):
-    try:
-        result = subprocess.run(
-            ["systemctl", "is-active", f"{service}.service"],
-            capture_output=True, text=True, timeout=5
-        )
-        return result.stdout.strip()
-    except Exception:
-        return "unknown"
-
-
-def get_spark_balance():
-    """Query Spark sidecar for wallet balance"""
-    try:
-        import requests
-        api_key = _read_sidecar_api_key(SPARK_API_KEY_FILE, "SPARK_SIDECAR_API_KEY")
-        headers = {"X-API-Key": api_key} if api_key else {}
-        resp = requests.post(f"{SPARK_URL}/v1/balance", headers=headers, timeout=5)
-        if resp.ok:
-            data = resp.json()
-            balance_msat = data.get("balance_msat")
-            if balance_msat is not None:
-                return {"balance": int(balance_msat) // 1000}
-            balance_sats = data.get("balance_sats")
-            if balance_sats is not None:
-                return {"balance": int(balance_sats)}
-    except Exception:
-        pass
-    return None
-
+def _systemctl_show(units: list[str]) -> str:
+    result = run_command(
+        ["systemctl", "show", f"--property={','.join(UNIT_PROPERTIES)}", *units],
+        capture_output=True, text=True, timeout=5, check=True
+    )
+    return result.stdout
 
-def get_arkade_balance():
-    """Query Arkade sidecar for wallet balance"""
-    try:
-        import requests
-        api_key = _read_sidecar_api_key(ARKADE_API_KEY_FILE, "ARKADE_SIDECAR_API_KEY")
-        headers = {"X-API-Key": api_key} if api_key else {}
-        resp = requests.post(f"{ARKADE_URL}/v1/balance", headers=headers, timeout=5)
-        if resp.ok:
-            data = resp.json()
-            balance_msat = data.get("balance_msat")
-            if balance_msat is not None:
-                return {
-                    "balance": int(balance_msat) // 1000,
-                    "status": data.get("status"),
-                }
-            balance_sats = data.get("balance_sats")
-            if balance_sats is not None:
-                return {
-                    "balance": int(balance_sats),
-                    "status": data.get("status"),
-                }
-            return {"balance": None, "status": data.get("status"), "raw": data}
-    except Exception:
-        pass
-    return None
 
+# One `systemctl show` for every unit the dashboard reports on, shared by the stats
+# probe, funding status, recovery report and tunnel status; dropped whenever the command
+# runner sees a mutating systemctl call.
+unit_states = UnitStateCache(
+    PROCESS_SERVICES,
+    _systemctl_show,
+    ttl=5,
+)
 
-def _read_phoenixd_seed() -> str | None:
-    try:
-        seed = _normalize_mnemonic(PHOENIXD_SEED_FILE.read_text())
-        return seed or None
-    except Exception:
-        return None
 
+def _on_commands_invalidated(tool):
+    if tool in (None, "systemctl"):
+        unit_states.invalidate()
+        funding_status.invalidate()
 
-def _phoenixd_request(path: str):
-    try:
-        import requests
-        password = _read_phoenixd_api_password()
-        if not password:
-            return None
-        resp = requests.get(f"{PHOENIXD_URL.rstrip('/')}/{path.lstrip('/')}", auth=("", password), timeout=5)
-        if resp.ok:
-            return resp.json()
-    except Exception:
-        pass
-    return None
 
+command_runner.on_invalidate(_on_commands_invalidated)
 
-def get_phoenixd_balance():
-    data = _phoenixd_request("getbalance")
-    if not isinstance(data, dict):
-        return None
 
-    def sats_from(*keys):
-        for key in keys:
-            value = data.get(key)
-            if value is None:
-                continue
-            try:
-                return int(value)
-            except Exception:
-                continue
-        return None
-
-    balance = sats_from("balanceSat", "balance", "balance_sats")
-    fee_credit = sats_from("feeCreditSat", "feeCredit", "fee_credit_sat")
-    return {"balance": balance, "fee_credit": fee_credit, "raw": data}
-
-
-def get_phoenixd_channels():
-    data = _phoenixd_request("listchannels")
-    if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
-        channels = data.get("channels")
-        if isinstance(channels, list):
-            return channels
-    info = _phoenixd_request("getinfo")
-    if isinstance(info, dict) and isinstance(info.get("channels"), list):
-        return info["channels"]
-    return []
+def get_service_status(service):
+    return unit_states.active_state(service)
 
 
-def get_phoenixd_status():
-    channels = get_phoenixd_channels()
-    balance = get_phoenixd_balance()
-    return {
-        "seed_present": bool(_read_phoenixd_seed()),
-        "balance": balance,
-        "channels": channels,
-        "channel_count": len(channels),
-    }
+def _read_phoenixd_seed() -> str | None:
+    return file_cache.read(PHOENIXD_SEED_FILE, _normalize_mnemonic) or None
 
 
-def get_arkade_status():
-    balance = get_arkade_balance()
-    status = balance.get("status") if isinstance(balance, dict) else None
-    return {
-        "seed_present": bool(_read_arkade_mnemonic()),
-        "balance": balance,
-        "mnemonic_missing": status == "missing_mnemonic",
-    }
+# One client per funding backend (see funding_clients); requests go through the pooled,
+# circuit-broken http_clients
+funding_clients = {
+    "spark": SparkClient(SPARK_URL, http_request, api_key=lambda: _read_sidecar_api_key(SPARK_API_KEY_FILE, "SPARK_SIDECAR_API_KEY")),
+    "ark": ArkadeClient(ARKADE_URL, http_request, api_key=lambda: _read_sidecar_api_key(ARKADE_API_KEY_FILE, "ARKADE_SIDECAR_API_KEY")),
+    "phoenixd": PhoenixdClient(PHOENIXD_URL, http_request, password=_read_phoenixd_api_password),
+}
+# Funding refreshes run on one long-lived event loop (and worker pool for the blocking HTTP calls)
+FUNDING_IO_WORKERS = 8
+funding_loop = EventLoopThread(name="funding-loop", max_workers=FUNDING_IO_WORKERS)
 
 
 def get_cpu_percent():
@@ -1654,75 +1791,450 @@ def get_memory_info():
         return {"used": 0, "total": 0, "percent": 0}
 
 
-def get_lnbits_http_status():
-    """Check LNbits by making an HTTP request to /"""
-    try:
-        import requests
-        resp = requests.get(f"{LNBITS_URL}/", timeout=3, allow_redirects=True)
-        return resp.status_code
+# LNbits is probed on its health endpoint rather than the landing page. A p95 response
+# time above LNBITS_SLOW_MS reports "slow" separately from "stopped"/"error". While the
+# unit is active, a timeout or an open breaker is never "stopped" (see health_state), and
+# a timed-out probe's elapsed time joins the window
+LNBITS_HEALTH_PATH = "/api/v1/health"
+LNBITS_SLOW_MS = 1000
+LNBITS_LATENCY_WINDOW = 300
+lnbits_latency = LatencyWindow(LNBITS_LATENCY_WINDOW)
+_lnbits_probe = {"status": None}
+
+
+def get_lnbits_health():
+    """Probe the LNbits health endpoint and summarize recent response times"""
+    code = None
+    latency_ms = None
+    timed_out = False
+    breaker_open = False
+    started = time.perf_counter()
+    try:
+        resp = http_request("lnbits", "GET", f"{LNBITS_URL}{LNBITS_HEALTH_PATH}", allow_redirects=False)
+        code = resp.status_code
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        lnbits_latency.add(latency_ms)
+    except RequestTimeout:
+        timed_out = True
+    except CircuitOpenError:
+        breaker_open = True
     except Exception:
-        return None
+        pass
+    unit_active = code is None and get_service_status("lnbits") == "active"
+    if timed_out and unit_active:
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        lnbits_latency.add(latency_ms)
+    window = lnbits_latency.summary()
+    status = health_state(
+        code, window["p95_ms"], slow_ms=LNBITS_SLOW_MS, unit_active=unit_active,
+        timed_out=timed_out, breaker_open=breaker_open, previous=_lnbits_probe["status"],
+    )
+    _lnbits_probe["status"] = status
+    return {
+        "status": status,
+        "code": code,
+        "latency_ms": latency_ms,
+        "p50_ms": window["p50_ms"],
+        "p95_ms": window["p95_ms"],
+        "samples": window["count"],
+        "slow_ms": LNBITS_SLOW_MS,
+    }
 
 
 def get_onion_address():
     """Read the Tor hidden service .onion address"""
+    return file_cache.read(TOR_HOSTNAME_FILE, str.strip)
+
+
+def get_disk_usage():
+    disk = shutil.disk_usage("/")
+    return {
+        "used": disk.used,
+        "total": disk.total,
+        "percent": round(disk.used / disk.total * 100, 1) if disk.total else 0,
+    }
+
+
+disk_io_sampler = DiskIOSampler(LNBITS_STATE_DIR)
+
+
+def get_io_pressure():
+    """IO pressure stall information; None on kernels built without PSI"""
     try:
-        return Path("/var/lib/tor/onion/lnbits/hostname").read_text().strip()
-    except Exception:
+        return parse_pressure(Path("/proc/pressure/io").read_text())
+    except FileNotFoundError:
         return None
 
 
-def collect_stats():
-    """Collect all system stats"""
-    disk = shutil.disk_usage("/")
-    funding_sources = _funding_sources_payload()
+def get_database_sizes():
+    return sqlite_file_sizes(LNBITS_DB_PATH)
+
+
+def get_disk_fill_eta():
+    """Seconds until the disk is full, from the trend of stored disk usage"""
+    store = _get_metrics_store()
+    if store is None:
+        return None
+    end = time.time()
+    result = store.query(end - DISK_FORECAST_WINDOW, end, "5m")
+    eta = fill_eta(result["timestamps"], result["metrics"]["disk"]["avg"])
+    return round(eta) if eta is not None else None
+
+
+def _storage_history_row(stats: dict[str, Any]) -> dict[str, float | None]:
+    disk_io = stats.get("disk_io") or {}
+    pressure = (stats.get("io_pressure") or {}).get("some") or {}
+    database = stats.get("database") or {}
+
+    def mb(value: int | None) -> float | None:
+        return round(value / 1048576, 2) if value is not None else None
+
+    return {
+        "disk_read_bps": disk_io.get("read_bytes_per_s"),
+        "disk_write_bps": disk_io.get("write_bytes_per_s"),
+        "disk_await_ms": disk_io.get("await_ms"),
+        "io_pressure": pressure.get("avg10"),
+        "db_mb": mb(database.get("total")),
+        "db_wal_mb": mb(database.get("wal")),
+    }
+
+
+def get_service_units():
+    """ActiveState, SubState, MainPID and NRestarts for every allowed service"""
+    return {svc: unit_states.get(svc) for svc in ALLOWED_SERVICES}
+
+
+process_sampler = ProcessSampler()
+
+
+def get_process_stats():
+    """CPU%, RSS, open FDs and threads per service, keyed by unit name"""
+    return process_sampler.sample({svc: unit_states.get(svc) for svc in PROCESS_SERVICES})
+
+
+def _process_history_row(processes: dict[str, dict[str, Any]]) -> dict[str, float | None]:
+    row: dict[str, float | None] = {}
+    for svc in PROCESS_SERVICES:
+        sample = processes.get(svc) or {}
+        rss = sample.get("rss")
+        row[f"{svc}.cpu"] = sample.get("cpu_percent")
+        row[f"{svc}.rss"] = round(rss / 1048576, 1) if rss is not None else None
+    return row
+
+
+# Probe registry: cheap procfs/sysfs reads every tick, service/process/IO state every 15s,
+# sidecar balances, connectivity and DB sizes every minute, the disk-full forecast every
+# 5 minutes (or on demand via refresh).
+stats_probes = ProbeScheduler(
+    observer=lambda name, duration, error: probe_latency.observe((name,), duration),
+    max_workers=STATS_PROBE_WORKERS,
+    deadline=STATS_PROBE_DEADLINE,
+)
+stats_probes.register("cpu_percent", get_cpu_percent, interval=5, timeout=1, cost="cheap", default=0)
+stats_probes.register("ram", get_memory_info, interval=5, timeout=1, cost="cheap",
+                      default={"used": 0, "total": 0, "percent": 0})
+stats_probes.register("cpu_temp", get_cpu_temp, interval=5, timeout=1, cost="cheap")
+stats_probes.register("uptime", get_uptime, interval=5, timeout=1, cost="cheap",
+                      default={"seconds": 0, "formatted": "unknown"})
+stats_probes.register("disk", get_disk_usage, interval=30, timeout=1, cost="cheap",
+                      default={"used": 0, "total": 0, "percent": 0})
+stats_probes.register("tor_onion", get_onion_address, interval=60, timeout=1, cost="cheap")
+stats_probes.register("disk_io", disk_io_sampler.sample, interval=15, timeout=1, cost="cheap", default={})
+stats_probes.register("io_pressure", get_io_pressure, interval=15, timeout=1, cost="cheap")
+stats_probes.register("database", get_database_sizes, interval=60, timeout=1, cost="cheap", default={})
+stats_probes.register("disk_forecast", get_disk_fill_eta, interval=300, timeout=2, cost="moderate")
+stats_probes.register("lnbits", get_lnbits_health, interval=10, timeout=4, cost="cheap",
+                      default={"status": "stopped", "code": None, "latency_ms": None, "p50_ms": None, "p95_ms": None})
+stats_probes.register("services", get_service_units, interval=15, timeout=10, cost="moderate", default={})
+stats_probes.register("processes", get_process_stats, interval=15, timeout=2, cost="cheap", default={})
+stats_probes.register("funding_sources", funding_status.refresh, interval=FUNDING_STATUS_REFRESH, timeout=15,
+                      cost="expensive", default={})
+stats_probes.register("network", get_network_info, interval=5, timeout=5, cost="cheap",
+                      default={"internet": False, "wifi": None, "ethernet": None})
+
+
+def collect_stats(*, force: bool | list[str] = False):
+    """Run due probes and assemble a stats snapshot from their latest values"""
+    stats_probes.run_due(force=force)
+    values = stats_probes.values()
+    stale_probes = stats_probes.stale()
+    funding_sources = values["funding_sources"] or {}
     return {
         "timestamp": datetime.now().isoformat(),
-        "cpu_percent": get_cpu_percent(),
-        "ram": get_memory_info(),
-        "cpu_temp": get_cpu_temp(),
-        "disk": {
-            "used": disk.used,
-            "total": disk.total,
-            "percent": round(disk.used / disk.total * 100, 1) if disk.total else 0,
-        },
-        "uptime": get_uptime(),
-        "services": {
-            svc: get_service_status(svc) for svc in ALLOWED_SERVICES
-        },
+        "cpu_percent": values["cpu_percent"],
+        "ram": values["ram"],
+        "cpu_temp": values["cpu_temp"],
+        "disk": {**values["disk"], "full_eta_seconds": values["disk_forecast"]},
+        "disk_io": values["disk_io"],
+        "io_pressure": values["io_pressure"],
+        "database": values["database"],
+        "uptime": values["uptime"],
+        "services": {svc: unit["active_state"] for svc, unit in values["services"].items()},
+        "service_units": values["services"],
+        "processes": values["processes"],
         "funding_sources": funding_sources,
         "funding_source": _read_selected_funding_source(),
         "spark_balance": funding_sources.get("spark", {}).get("balance"),
         "arkade_status": funding_sources.get("arkade", {}),
         "phoenixd_status": funding_sources.get("phoenixd", {}),
-        "tor_onion": get_onion_address(),
-        "network": get_network_info(),
+        "tor_onion": values["tor_onion"],
+        "network": values["network"],
+        "lnbits": values["lnbits"],
+        "stale_probes": stale_probes,
+    }
+
+
+def _get_metrics_store() -> MetricsStore | None:
+    with _metrics_store_lock:
+        if _metrics_store["store"] is None and _metrics_store["error"] is None:
+            try:
+                _metrics_store["store"] = MetricsStore(METRICS_STORE_FILE, METRICS_STORE_FIELDS)
+            except Exception as exc:
+                _metrics_store["error"] = str(exc)
+                app.logger.warning("Metrics store unavailable: %s", exc)
+        return _metrics_store["store"]
+
+
+def _lnbits_history_row(stats: dict[str, Any]) -> dict[str, float | None]:
+    lnbits = stats.get("lnbits") or {}
+    return {"lnbits_p50_ms": lnbits.get("p50_ms"), "lnbits_p95_ms": lnbits.get("p95_ms")}
+
+
+def _liquidity_history_row(stats: dict[str, Any]) -> dict[str, float | None]:
+    funding = stats.get("funding_sources") or {}
+    if funding.get("selected") != "phoenixd":
+        return {column: None for column in LIQUIDITY_HISTORY_COLUMNS}
+    phoenixd = funding.get("phoenixd") or {}
+    balance = phoenixd.get("balance") or {}
+    liquidity = phoenixd.get("liquidity") or {}
+    return {
+        "phoenixd_balance": balance.get("balance"),
+        "phoenixd_fee_credit": balance.get("fee_credit"),
+        "phoenixd_channels": phoenixd.get("channel_count") if phoenixd.get("balance") is not None else None,
+        "phoenixd_outbound": liquidity.get("outbound_sat"),
+        "phoenixd_inbound": liquidity.get("inbound_sat"),
     }
 
 
-def stats_collector():
-    """Background thread collecting stats periodically"""
-    # Initial collection with small delay for psutil baseline
+def _metrics_sample(stats: dict[str, Any]) -> dict[str, float | None]:
+    services = stats.get("services") or {}
+    funding_service = _selected_funding_service()
+
+    def up(service: str | None) -> int | None:
+        status = services.get(service) if service else None
+        return None if status is None else int(status == "active")
+
+    return {
+        "cpu": stats.get("cpu_percent"),
+        "ram": (stats.get("ram") or {}).get("percent"),
+        "temp": stats.get("cpu_temp"),
+        "disk": (stats.get("disk") or {}).get("percent"),
+        "lnbits_up": up("lnbits"),
+        "funding_up": up(funding_service),
+        "tor_up": up("tor"),
+        **_storage_history_row(stats),
+        **_process_history_row(stats.get("processes") or {}),
+        **_liquidity_history_row(stats),
+        **_lnbits_history_row(stats),
+    }
+
+
+def _persist_metrics(stats: dict[str, Any]):
+    store = _get_metrics_store()
+    if store is None:
+        return
+    try:
+        store.append(time.time(), _metrics_sample(stats))
+    except Exception as exc:
+        app.logger.warning("Failed to persist metrics: %s", exc)
+
+
+def _stored_history(range_seconds: int, resolution: str | None = None, end: float | None = None) -> dict[str, Any]:
+    store = _get_metrics_store()
+    if store is None:
+        raise RuntimeError(_metrics_store["error"] or "Metrics store unavailable")
+    end = end or time.time()
+    result = store.query(end - range_seconds, end, resolution)
+    metrics = result["metrics"]
+    return {
+        "timestamps": [datetime.fromtimestamp(ts).isoformat() for ts in result["timestamps"]],
+        "cpu": metrics["cpu"]["avg"],
+        "ram": metrics["ram"]["avg"],
+        "temp": metrics["temp"]["avg"],
+        "resolution": result["resolution"],
+        "resolution_seconds": result["resolution_seconds"],
+        "range_seconds": range_seconds,
+        "series": metrics,
+    }
+
+
+def _snapshot_values(stats: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in stats.items() if key != "timestamp"}
+
+
+def _collect_and_store_stats(force: bool = False) -> dict[str, Any]:
+    stats = collect_stats(force=force)
+    now = time.monotonic()
+    append_history = False
+    with stats_lock:
+        if not stats_history or now - stats_snapshot["history_appended_monotonic"] >= STATS_HISTORY_INTERVAL:
+            stats_history.append({
+                "timestamp": time.time(),
+                "cpu": stats["cpu_percent"],
+                "ram": stats["ram"]["percent"],
+                "temp": stats["cpu_temp"],
+                **_storage_history_row(stats),
+                **_process_history_row(stats["processes"]),
+                **_lnbits_history_row(stats),
+            })
+            stats_snapshot["history_appended_monotonic"] = now
+            append_history = True
+        previous = stats_snapshot["current"]
+        if append_history or previous is None or _snapshot_values(previous) != _snapshot_values(stats):
+            stats_snapshot["current"] = stats
+            stats_snapshot["collected_at"] = stats["timestamp"]
+            stats_snapshot["version"] += 1
+            stats_changed.notify_all()
+        else:
+            # Nothing changed: keep the published snapshot (and its ETag); only its age resets
+            stats = previous
+        stats_snapshot["collected_monotonic"] = now
+    if append_history:
+        _persist_metrics(stats)
+    return stats
+
+
+def refresh_stats(*, force: bool = False) -> dict[str, Any]:
+    """Run one probe cycle; concurrent callers share the same run"""
+    return _stats_refresh.do(("stats", force), lambda: _collect_and_store_stats(force))
+
+
+def latest_stats(*, refresh: bool = False) -> tuple[dict[str, Any], float, int]:
+    """
+    Return the latest snapshot, its age in seconds and version. Probes only if forced or
+    empty, or if the snapshot is a tick old in a process that does not run the collector.
+    """
+    with stats_lock:
+        current = stats_snapshot["current"]
+        age = time.monotonic() - stats_snapshot["collected_monotonic"]
+    if refresh or current is None or (not background_workers.leader and age >= STATS_TICK_INTERVAL):
+        refresh_stats(force=refresh)
+    with stats_lock:
+        age = max(0.0, time.monotonic() - stats_snapshot["collected_monotonic"])
+        return stats_snapshot["current"], age, stats_snapshot["version"]
+
+
+def _parse_history_cursor(value: str | None) -> int | None:
+    epoch, _, sequence = (value or "").partition(":")
+    if epoch != STATS_EPOCH or not sequence.isdigit():
+        return None
+    return int(sequence)
+
+
+def _history_payload(columns: dict[str, list[Any]], *, reset: bool, appended: int) -> dict[str, Any]:
+    history = dict(columns)
+    history["timestamps"] = [datetime.fromtimestamp(ts).isoformat() for ts in history.pop("timestamp")]
+    history.update({"cursor": f"{STATS_EPOCH}:{appended}", "reset": reset, "size": STATS_HISTORY_SIZE})
+    return history
+
+
+def _stats_stream_events(cursor: int | None):
+    """Yield SSE frames: one 'stats' event per collector snapshot, comments as keepalive"""
+    version = None
+    yield f"retry: 5000\n: connected {STATS_EPOCH}\n\n"
+    while not stats_stream_closing.is_set():
+        with stats_changed:
+            if stats_snapshot["current"] is None or stats_snapshot["version"] == version:
+                stats_changed.wait(STATS_STREAM_HEARTBEAT)
+            if stats_stream_closing.is_set():
+                return
+            changed = stats_snapshot["current"] is not None and stats_snapshot["version"] != version
+            if changed:
+                version = stats_snapshot["version"]
+                current = stats_snapshot["current"]
+                age = max(0.0, time.monotonic() - stats_snapshot["collected_monotonic"])
+                columns, reset = stats_history.since(cursor)
+                cursor = stats_history.appended
+        if not changed:
+            yield ": keepalive\n\n"
+            continue
+        payload = {
+            "current": current,
+            "collected_at": current["timestamp"],
+            "age_seconds": round(age, 1),
+            "stale": age > STATS_STALE_AFTER,
+            "history": _history_payload(columns, reset=reset, appended=cursor),
+        }
+        yield f"id: {STATS_EPOCH}:{cursor}\nevent: stats\ndata: {json.dumps(payload)}\n\n"
+
+
+def _psutil_baseline():
+    """Prime psutil.cpu_percent() so the first collection has a reference point"""
     try:
         import psutil
         psutil.cpu_percent()
     except Exception:
         pass
-    time.sleep(1)
-
-    while True:
-        try:
-            stats = collect_stats()
-            with stats_lock:
-                stats_history.append(stats)
-        except Exception:
-            pass
-        time.sleep(STATS_INTERVAL)
 
 
-# Start background collector
-threading.Thread(target=stats_collector, daemon=True).start()
-threading.Thread(target=_scheduled_backup_worker, daemon=True).start()
+# Background workers run only in the process holding this lock, so a multi-process server
+# collects stats and runs scheduled backups once; the other processes probe stats on read
+# (see latest_stats) but their live streams only carry those reads. Crashed workers are
+# restarted and their health is shown on the Advanced page. serve() starts them, so
+# importing app (tests, tooling) starts no threads
+WORKERS_LOCK_FILE = LNBITSBOX_STATE_DIR / "admin-workers.lock"
+background_workers = Supervisor(LeaderLock(WORKERS_LOCK_FILE))
+# The collector wakes early when stats_wakeup is set (e.g. on a link change)
+background_workers.add(Worker(
+    "stats_collector", refresh_stats, interval=STATS_TICK_INTERVAL,
+    setup=_psutil_baseline, wakeup=stats_wakeup, initial_delay=1,
+))
+background_workers.add(Worker("scheduled_backup", _run_scheduled_backup, interval=60))
+
+
+def start_background():
+    background_workers.start()
+    _resume_update_job()
+    if not DEV_MODE:
+        network_monitor.start()
+
+
+# ── Static Assets ───────────────────────────────────────────────────
+
+# Bundles written by `python asset_utils.py` (the Nix build runs it). DEV_MODE and trees
+# without a build load the source files instead, so edits show up on reload
+ASSETS_DIR = Path(__file__).resolve().parent / "static" / "dist"
+ASSET_MAX_AGE = 365 * 24 * 3600
+asset_manifest = None if DEV_MODE else load_manifest(ASSETS_DIR)
+
+
+@app.context_processor
+def _asset_helpers():
+    def asset_urls(name: str) -> list[str]:
+        if asset_manifest and name in asset_manifest:
+            return [url_for("asset", filename=asset_manifest[name])]
+        return [url_for("static", filename=path) for path in ASSET_BUNDLES[name]]
+    return {"asset_urls": asset_urls}
+
+
+@app.route("/box/assets/<filename>")
+def asset(filename: str):
+    # Names carry a content hash, so a response never changes and may be cached for good
+    path = ASSETS_DIR / Path(filename).name
+    mimetype = ASSET_TYPES.get(path.suffix)
+    if mimetype is None or not path.is_file():
+        return _json_error("Not found", 404)
+    encoding = None
+    for candidate, suffix in (("br", ".br"), ("gzip", ".gz")):
+        if request.accept_encodings[candidate] and path.with_name(path.name + suffix).is_file():
+            path, encoding = path.with_name(path.name + suffix), candidate
+            break
+    response = send_file(path, mimetype=mimetype, max_age=ASSET_MAX_AGE, etag=True, conditional=True)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = f"public, max-age={ASSET_MAX_AGE}, immutable"
+    return response
 
 
 # ── Routes ──────────────────────────────────────────────────────────
@@ -1789,7 +2301,7 @@ def funding_sources_page():
         page_key="funding_sources",
         page_title="Funding Source",
         page_intro="Inspect the active LNbits funding source.",
-        funding_sources=_funding_sources_payload(),
+        funding_sources=_funding_status_payload(),
         spark_mnemonic=_read_spark_mnemonic(),
         arkade_mnemonic=_read_arkade_mnemonic(),
         phoenixd_seed=_read_phoenixd_seed(),
@@ -1870,36 +2382,241 @@ def _render_admin_page(
     )
 
 
+def _stats_payload(current: dict[str, Any], age: float, history: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "current": current,
+        "collected_at": current["timestamp"],
+        "age_seconds": round(age, 1),
+        "stale": age > STATS_STALE_AFTER,
+        "probes": stats_probes.status(),
+        "history": history,
+    }
+
+
 @app.route("/box/api/stats")
 @login_required
 def api_stats():
-    current = collect_stats()
+    refresh = request.args.get("refresh", "").lower() in {"1", "true", "yes"}
+    try:
+        range_seconds = parse_duration(request.args.get("range"))
+    except ValueError as exc:
+        return _json_error(str(exc), 400)
+    resolution = request.args.get("resolution", "").strip() or None
+    if range_seconds is not None and range_seconds > METRICS_MAX_RANGE:
+        return _json_error("Requested range is longer than the stored history", 400)
+
+    since = request.args.get("since", "").strip()
+
+    current, age, _ = latest_stats(refresh=refresh)
+    etag = None
+    if range_seconds is not None or resolution:
+        try:
+            history = _stored_history(range_seconds or STATS_HISTORY_INTERVAL * STATS_HISTORY_SIZE, resolution)
+        except ValueError as exc:
+            return _json_error(str(exc), 400)
+        except Exception as exc:
+            return _json_error(str(exc), 503)
+    else:
+        with stats_lock:
+            columns, reset = stats_history.since(_parse_history_cursor(since))
+            appended = stats_history.appended
+        # Keyed on what the response carries: the history up to `appended` and the snapshot
+        # collected at current["timestamp"]. Collector ticks that publish nothing new keep it
+        etag = f"{STATS_EPOCH}-{appended}-{current['timestamp']}-{since or 'full'}"
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        history = _history_payload(columns, reset=reset, appended=appended)
+    payload = _stats_payload(current, age, history)
+    response, status_code = _json_response(data=payload, **payload)
+    if etag:
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "no-cache"
+    return response, status_code
+
+
+@app.route("/box/api/stats/stream")
+@login_required
+def api_stats_stream():
+    cursor = _parse_history_cursor(request.headers.get("Last-Event-ID") or request.args.get("since"))
+    with _stats_stream_lock:
+        if _stats_stream["clients"] >= STATS_STREAM_MAX_CLIENTS:
+            return _json_error("Too many live stats streams open", 503)
+        _stats_stream["clients"] += 1
+
+    def release():
+        with _stats_stream_lock:
+            _stats_stream["clients"] -= 1
+
+    response = app.response_class(_stats_stream_events(cursor), mimetype="text/event-stream")
+    response.call_on_close(release)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+# ── Metrics Export ──────────────────────────────────────────────
+
+def _metrics_token(*, create: bool = False) -> str | None:
+    token = os.environ.get("LNBITSBOX_METRICS_TOKEN", "").strip()
+    if token:
+        return token
+    try:
+        token = METRICS_TOKEN_FILE.read_text().strip()
+    except FileNotFoundError:
+        token = ""
+    if not token and create:
+        token = _rotate_metrics_token()
+    return token or None
+
+
+def _rotate_metrics_token() -> str:
+    token = secrets.token_urlsafe(32)
+    METRICS_TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = METRICS_TOKEN_FILE.with_suffix(".tmp")
+    tmp_path.write_text(token + "\n")
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, METRICS_TOKEN_FILE)
+    return token
+
+
+def _seconds_until(value: str | None, now: datetime) -> float | None:
+    parsed = parse_iso_datetime(value.replace("Z", "+00:00")) if value else None
+    return round((parsed - now).total_seconds()) if parsed else None
+
+
+def render_openmetrics() -> str:
+    """Render the latest collector snapshot; never runs probes, subprocesses or sidecar calls"""
     with stats_lock:
-        history = list(stats_history)
+        current = stats_snapshot["current"]
+        age = time.monotonic() - stats_snapshot["collected_monotonic"] if current else None
+    out = MetricsWriter(prefix="lnbitsbox_")
+    out.gauge("stats_age_seconds", "Seconds since the collector last published a snapshot",
+              round(age, 3) if age is not None else None)
+    if current:
+        out.gauge("cpu_percent", "Box-wide CPU usage", current["cpu_percent"])
+        out.gauge("memory_used_bytes", "Used RAM", current["ram"]["used"])
+        out.gauge("memory_total_bytes", "Total RAM", current["ram"]["total"])
+        out.gauge("cpu_temperature_celsius", "CPU temperature", current["cpu_temp"])
+        out.gauge("disk_used_bytes", "Used bytes on the root filesystem", current["disk"]["used"])
+        out.gauge("disk_total_bytes", "Size of the root filesystem", current["disk"]["total"])
+        out.gauge("disk_full_eta_seconds", "Projected seconds until the disk is full",
+                  current["disk"].get("full_eta_seconds"))
+        out.gauge("uptime_seconds", "System uptime", current["uptime"]["seconds"])
+        for svc, unit in (current.get("service_units") or {}).items():
+            out.gauge("unit_active", "Whether the systemd unit is active", unit["active_state"] == "active", {"unit": svc})
+            out.counter("unit_restarts", "Automatic restarts of the systemd unit (NRestarts)", unit["n_restarts"], {"unit": svc})
+        for svc, sample in (current.get("processes") or {}).items():
+            out.gauge("unit_cpu_percent", "CPU usage of the unit as a share of all cores", sample["cpu_percent"], {"unit": svc})
+            out.gauge("unit_rss_bytes", "Resident memory of the unit's main process", sample["rss"], {"unit": svc})
+
+        source = current.get("funding_source")
+        balance = {
+            "spark": current.get("spark_balance"),
+            "ark": (current.get("arkade_status") or {}).get("balance"),
+            "phoenixd": (current.get("phoenixd_status") or {}).get("balance"),
+        }.get(source)
+        out.gauge("funding_balance_sats", "Balance of the selected funding source",
+                  balance.get("balance") if isinstance(balance, dict) else None, {"source": source})
+        out.gauge("phoenixd_channels", "Number of phoenixd channels",
+                  (current.get("phoenixd_status") or {}).get("channel_count") if source == "phoenixd" else None)
+        lnbits = current.get("lnbits") or {}
+        out.gauge("lnbits_up", "Whether the LNbits health endpoint answered 200", lnbits.get("code") == 200)
+        out.gauge("lnbits_response_p95_seconds", "95th percentile LNbits health-check response time",
+                  lnbits["p95_ms"] / 1000 if lnbits.get("p95_ms") is not None else None)
+
+    now = datetime.now(timezone.utc)
+    tunnel = _load_tunnel_state().get("current_tunnel") or {}
+    out.gauge("tunnel_expiry_seconds", "Seconds until the reverse tunnel subscription expires",
+              _seconds_until(tunnel.get("expires_at"), now))
+    last_backup = _recovery_state().get("last_backup") or {}
+    backup_in = _seconds_until(last_backup.get("created_at"), now)
+    out.gauge("last_backup_age_seconds", "Seconds since the last successful recovery backup",
+              -backup_in if backup_in is not None else None)
+
+    out.histogram("probe_duration_seconds", "Stats probe run time", probe_latency)
+    out.histogram("http_request_duration_seconds", "Admin app request latency by route", route_latency)
+    return out.render()
+
+
+@app.route("/box/metrics")
+def metrics_export():
+    token = _metrics_token()
+    if token is None:
+        return _json_error("Metrics export is disabled until a token is generated", 404)
+    scheme, _, supplied = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(supplied.strip(), token):
+        return _json_error("Invalid metrics token", 401)
+    return app.response_class(render_openmetrics(), mimetype=None, content_type=OPENMETRICS_CONTENT_TYPE)
+
+
+@app.route("/box/api/metrics/token", methods=["GET", "POST"])
+@login_required
+def api_metrics_token():
+    if request.method == "POST" and os.environ.get("LNBITSBOX_METRICS_TOKEN", "").strip():
+        return _json_error("The metrics token is set by LNBITSBOX_METRICS_TOKEN", 409)
+    token = _rotate_metrics_token() if request.method == "POST" else _metrics_token(create=True)
+    payload = {"token": token, "endpoint": "/box/metrics"}
+    return _json_response(status="ok", data=payload, **payload)
+
+
+@app.route("/box/api/debug/perf")
+@login_required
+def api_debug_perf():
+    summary = perf_calls.summary()
     payload = {
-        "current": current,
-        "history": {
-            "timestamps": [s["timestamp"] for s in history],
-            "cpu": [s["cpu_percent"] for s in history],
-            "ram": [s["ram"]["percent"] for s in history],
-            "temp": [s["cpu_temp"] for s in history],
-        }
+        "routes": summary.get("route", []),
+        "subprocess": summary.get("subprocess", []),
+        "http": summary.get("http", []),
+        "probes": stats_probes.status(),
+        "file_cache": file_cache.status(),
+        "server_timing": SERVER_TIMING_ENABLED,
     }
-    return _json_response(data=payload, **payload)
+    return _json_response(status="ok", data=payload, **payload)
+
+
+@app.route("/box/api/workers")
+@login_required
+def api_workers():
+    payload = background_workers.status()
+    return _json_response(status="ok", data=payload, **payload)
+
+
+@app.route("/box/api/jobs")
+@login_required
+def api_jobs():
+    payload = {"jobs": jobs.jobs(request.args.get("kind") or None)}
+    return _json_response(status="ok", data=payload, **payload)
+
+
+@app.route("/box/api/jobs/<job_id>")
+@login_required
+def api_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        return _json_error("Job not found", 404)
+    payload = {"job": job}
+    return _json_response(status="ok", data=payload, **payload)
 
 
 @app.route("/box/api/lnbits-status")
 @login_required
 def api_lnbits_status():
-    code = get_lnbits_http_status()
-    if code == 200:
-        return _json_response(data={"status": "running"}, status="running")
-    elif code == 502:
-        return _json_response(data={"status": "starting"}, status="starting")
-    elif code is not None:
-        return _json_response(data={"status": "error", "code": code}, status="error", code=code)
-    else:
-        return _json_response(data={"status": "stopped"}, status="stopped")
+    # Served from the collector's last health probe; it runs every 10s
+    health = stats_probes.values()["lnbits"]
+    return _json_response(data=health, **health)
+
+
+def _schedule_power_action(action: str):
+    # systemd-run --no-block queues the transient unit and returns at once, so the response
+    # still goes out before the box powers off
+    result = run_command(
+        ["systemd-run", "--no-block", "systemctl", action],
+        capture_output=True, text=True, timeout=10,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"Failed to schedule {action}")
 
 
 @app.route("/box/api/shutdown", methods=["POST"])
@@ -1907,7 +2624,10 @@ def api_lnbits_status():
 def api_shutdown():
     if DEV_MODE:
         return jsonify({"status": "ok", "message": "DEV MODE: would shutdown"})
-    subprocess.Popen(["systemd-run", "--no-block", "systemctl", "poweroff"])
+    try:
+        _schedule_power_action("poweroff")
+    except Exception as exc:
+        return _json_error(str(exc), 500)
     return jsonify({"status": "ok", "message": "Shutting down..."})
 
 
@@ -1916,7 +2636,10 @@ def api_shutdown():
 def api_reboot():
     if DEV_MODE:
         return jsonify({"status": "ok", "message": "DEV MODE: would reboot"})
-    subprocess.Popen(["systemd-run", "--no-block", "systemctl", "reboot"])
+    try:
+        _schedule_power_action("reboot")
+    except Exception as exc:
+        return _json_error(str(exc), 500)
     return jsonify({"status": "ok", "message": "Rebooting..."})
 
 
@@ -1927,18 +2650,24 @@ def api_factory_reset():
     if payload.get("acknowledged") is not True:
         return _json_error("Factory reset confirmation is required.", 400)
 
-    try:
-        _start_factory_reset()
-    except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.decode().strip() if exc.stderr else ""
-        return _json_error(stderr or "Failed to start factory reset.", 500)
-    except Exception as exc:
-        return _json_error(str(exc), 500)
-
-    return _json_response(
-        status="ok",
-        message="Factory reset started. LNbitsBox will return to the setup wizard in a few seconds.",
-        data={"redirect": "/", "delay_ms": 3000},
+    def run(report):
+        report(10, "Starting factory reset")
+        try:
+            _start_factory_reset()
+        except subprocess.CalledProcessError as exc:
+            stderr = exc.stderr.decode().strip() if exc.stderr else ""
+            raise RuntimeError(stderr or "Failed to start factory reset.") from exc
+        return {"redirect": "/", "delay_ms": 3000}
+
+    try:
+        job = jobs.submit("factory_reset", run, title="Factory reset", exclusive=True)
+    except JobConflictError as exc:
+        return _json_error(str(exc), 409)
+    return _job_response(
+        job,
+        "Factory reset started. LNbitsBox will return to the setup wizard in a few seconds.",
+        redirect="/",
+        delay_ms=3000,
     )
 
 
@@ -1963,7 +2692,43 @@ def api_stop_service(service):
 @app.route("/box/api/funding-sources", methods=["GET"])
 @login_required
 def api_funding_sources():
-    payload = _funding_sources_payload()
+    payload = _funding_status_payload()
+    return _json_response(status="ok", data=payload, **payload)
+
+
+@app.route("/box/api/funding-sources/refresh", methods=["POST"])
+@login_required
+def api_refresh_funding_sources():
+    try:
+        payload = {**funding_status.refresh(), "cache": funding_status.status()}
+    except Exception as exc:
+        return _json_error(f"Refresh failed: {exc}", 502)
+    return _json_response(status="ok", data=payload, **payload)
+
+
+@app.route("/box/api/funding-sources/phoenixd/history", methods=["GET"])
+@login_required
+def api_phoenixd_history():
+    try:
+        range_seconds = parse_duration(request.args.get("range")) or LIQUIDITY_HISTORY_RANGE
+    except ValueError as exc:
+        return _json_error(str(exc), 400)
+    if range_seconds > METRICS_MAX_RANGE:
+        return _json_error("Requested range is longer than the stored history", 400)
+    store = _get_metrics_store()
+    if store is None:
+        return _json_error(_metrics_store["error"] or "Metrics store unavailable", 503)
+    end = time.time()
+    try:
+        result = store.query(end - range_seconds, end, request.args.get("resolution", "").strip() or None)
+    except ValueError as exc:
+        return _json_error(str(exc), 400)
+    payload = {
+        "timestamps": [datetime.fromtimestamp(ts).isoformat() for ts in result["timestamps"]],
+        "resolution": result["resolution"],
+        "range_seconds": range_seconds,
+        **{column.removeprefix("phoenixd_"): result["metrics"][column]["avg"] for column in LIQUIDITY_HISTORY_COLUMNS},
+    }
     return _json_response(status="ok", data=payload, **payload)
 
 
@@ -2062,7 +2827,7 @@ def api_update_spark_seed():
                 message="Spark seed phrase saved. Spark remains stopped because it is not the active funding source.",
                 data={"service": "spark-sidecar", "action": "none"},
             )
-        subprocess.run(
+        run_command(
             ["systemctl", "restart", "spark-sidecar.service"],
             check=True,
             capture_output=True,
@@ -2121,7 +2886,7 @@ def api_update_arkade_seed():
                 message="Ark seed phrase saved. Arkade remains stopped because it is not the active funding source.",
                 data={"service": "arkade-sidecar", "action": "none"},
             )
-        subprocess.run(
+        run_command(
             ["systemctl", "restart", "arkade-sidecar.service"],
             check=True,
             capture_output=True,
@@ -2151,7 +2916,7 @@ def _service_action(service, action, verb):
         return _json_response(status="ok", message=f"DEV MODE: would {action} {service}", data={"service": service, "action": action})
 
     try:
-        subprocess.run(
+        run_command(
             ["systemctl", action, f"{service}.service"],
             check=True, capture_output=True, timeout=30
         )
@@ -2191,27 +2956,72 @@ def api_recovery_backup_file_download(filename: str):
     )
 
 
+def _prune_recovery_downloads():
+    cutoff = time.time() - RECOVERY_DOWNLOAD_MAX_AGE
+    try:
+        entries = list(RECOVERY_DOWNLOAD_DIR.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
 @app.route("/box/api/recovery/backup/download", methods=["POST"])
 @login_required
 def api_recovery_backup_download():
-    passphrase = request.form.get("passphrase", "")
+    payload = request.get_json(silent=True) or {}
+    passphrase = str(payload.get("passphrase") or "")
     if not passphrase:
         return _json_error("Backup password is required.", 400)
 
-    content, manifest = _create_recovery_backup_bytes(passphrase=passphrase)
-    _record_backup_success(
-        manifest=manifest,
-        storage="Downloaded from browser",
-        file_path=None,
-        validated=True,
-    )
-    response = send_file(
+    def run(report):
+        report(10, "Creating encrypted backup")
+        content, manifest = _create_recovery_backup_bytes(passphrase=passphrase)
+        report(80, "Preparing download")
+        _prune_recovery_downloads()
+        RECOVERY_DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        target = RECOVERY_DOWNLOAD_DIR / f"{secrets.token_hex(16)}.zip"
+        target.write_bytes(content)
+        os.chmod(target, 0o600)
+        _record_backup_success(
+            manifest=manifest,
+            storage="Downloaded from browser",
+            file_path=None,
+            validated=True,
+        )
+        return {"download": target.name, "filename": _backup_filename(manifest)}
+
+    try:
+        job = jobs.submit("recovery", run, title="Encrypted backup download", exclusive=True)
+    except JobConflictError as exc:
+        return _json_error(str(exc), 409)
+    return _job_response(job, "Preparing encrypted backup for download.")
+
+
+@app.route("/box/api/recovery/backup/download/<job_id>", methods=["GET"])
+@login_required
+def api_recovery_backup_download_file(job_id: str):
+    job = jobs.get(job_id)
+    result = (job or {}).get("result") or {}
+    if not job or job["status"] != "succeeded" or not result.get("download"):
+        return _json_error("Backup download not found.", 404)
+    target = RECOVERY_DOWNLOAD_DIR / Path(result["download"]).name
+    try:
+        content = target.read_bytes()
+    except FileNotFoundError:
+        return _json_error("Backup download has expired. Create a new backup.", 410)
+    # Single use: the encrypted archive does not stay on disk after the browser has it
+    target.unlink(missing_ok=True)
+    return send_file(
         io.BytesIO(content),
         mimetype="application/zip",
         as_attachment=True,
-        download_name=_backup_filename(manifest),
+        download_name=result.get("filename") or target.name,
     )
-    return response
 
 
 @app.route("/box/api/recovery/backup/save", methods=["POST"])
@@ -2222,14 +3032,18 @@ def api_recovery_backup_save():
     if not passphrase:
         return _json_error("Backup password is required.", 400)
 
-    content, manifest = _create_recovery_backup_bytes(passphrase=passphrase)
-    result = _write_recovery_destination_file("local", content, manifest)
-    return _json_response(
-        status="ok",
-        message=f"Encrypted backup saved on this box at {result['path']}",
-        data=result,
-        **result,
-    )
+    def run(report):
+        report(10, "Creating encrypted backup")
+        content, manifest = _create_recovery_backup_bytes(passphrase=passphrase)
+        report(80, "Saving backup on this box")
+        result = _write_recovery_destination_file("local", content, manifest)
+        return {**result, "message": f"Encrypted backup saved on this box at {result['path']}"}
+
+    try:
+        job = jobs.submit("recovery", run, title="Encrypted backup", exclusive=True)
+    except JobConflictError as exc:
+        return _json_error(str(exc), 409)
+    return _job_response(job, "Saving encrypted backup on this box.")
 
 
 @app.route("/box/api/recovery/restore/validate", methods=["POST"])
@@ -2288,36 +3102,39 @@ def api_recovery_restore():
     if invalid_components:
         return _json_error("Invalid restore components: " + ", ".join(invalid_components), 400)
 
-    services = _services_for_restore(selected_components)
-    try:
-        _stop_services(services)
-        restore_result = _restore_component_files(inner_zip, manifest, selected_components)
-    except ValueError as exc:
-        return _json_error(str(exc), 400)
-    finally:
-        _start_services(services)
+    def run(progress):
+        services = _services_for_restore(selected_components)
+        try:
+            progress(10, "Stopping services")
+            _stop_services(services)
+            progress(30, "Restoring files")
+            restore_result = _restore_component_files(inner_zip, manifest, selected_components)
+        finally:
+            progress(80, "Starting services")
+            _start_services(services)
+
+        report = _post_restore_report(selected_components, manifest)
+        state = _recovery_state()
+        state["last_restore"] = {
+            "restored_at": utc_now_iso(),
+            "filename": filename,
+            "components": selected_components,
+            "report": report,
+        }
+        _save_recovery_state(state)
+        return {
+            "filename": filename,
+            "restored_components": selected_components,
+            "restore_result": restore_result,
+            "report": report,
+            "message": "Encrypted backup restored successfully.",
+        }
 
-    report = _post_restore_report(selected_components, manifest)
-    state = _recovery_state()
-    state["last_restore"] = {
-        "restored_at": utc_now_iso(),
-        "filename": filename,
-        "components": selected_components,
-        "report": report,
-    }
-    _save_recovery_state(state)
-    payload = {
-        "filename": filename,
-        "restored_components": selected_components,
-        "restore_result": restore_result,
-        "report": report,
-    }
-    return _json_response(
-        status="ok",
-        message="Encrypted backup restored successfully.",
-        data=payload,
-        **payload,
-    )
+    try:
+        job = jobs.submit("recovery", run, title="Restore from backup", exclusive=True)
+    except JobConflictError as exc:
+        return _json_error(str(exc), 409)
+    return _job_response(job, "Restoring selected components.", filename=filename)
 
 
 @app.route("/box/api/recovery/schedule", methods=["GET"])
@@ -2445,6 +3262,60 @@ def api_wifi_scan():
         return _json_error(str(e), 500)
 
 
+def _connect_wifi(wifi_iface: str, ssid: str, password: str, report) -> dict[str, Any]:
+    # Read backup of current config
+    backup_conf = None
+    conf_path = "/etc/wpa_supplicant.conf"
+    try:
+        backup_conf = Path(conf_path).read_text()
+    except Exception:
+        pass
+
+    # Add network
+    result = wpa_cli(wifi_iface, "add_network")
+    net_id = result.stdout.strip()
+
+    # Set SSID
+    wpa_cli(wifi_iface, "set_network", net_id, "ssid", f'"{ssid}"', check=True)
+
+    # Set password or open network
+    if password:
+        wpa_cli(wifi_iface, "set_network", net_id, "psk", f'"{password}"', check=True)
+    else:
+        wpa_cli(wifi_iface, "set_network", net_id, "key_mgmt", "NONE", check=True)
+
+    # Select network (connects to new, disables others)
+    wpa_cli(wifi_iface, "select_network", net_id, check=True)
+    report(20, f"Connecting to {ssid}...")
+
+    # Poll for connection
+    new_ip = ""
+    for attempt in range(8):  # 8 * 2s = 16s max
+        time.sleep(2)
+        result = wpa_cli(wifi_iface, "status", cache_ttl=0)
+        wpa = {}
+        for line in result.stdout.strip().splitlines():
+            if "=" in line:
+                k, v = line.split("=", 1)
+                wpa[k] = v
+        if wpa.get("wpa_state") == "COMPLETED":
+            new_ip = wpa.get("ip_address", "")
+            # Re-enable all networks and save
+            wpa_cli(wifi_iface, "enable_network", "all")
+            wpa_cli(wifi_iface, "save_config")
+            return {"ssid": ssid, "ip": new_ip, "message": f"Connected to {ssid}"}
+        report(20 + (attempt + 1) * 10, f"Waiting for {ssid} ({wpa.get('wpa_state', 'unknown').lower()})...")
+
+    # Restore backup config
+    if backup_conf is not None:
+        try:
+            Path(conf_path).write_text(backup_conf)
+            wpa_cli(wifi_iface, "reconfigure")
+        except Exception:
+            pass
+    raise RuntimeError(f"Failed to connect to {ssid}")
+
+
 @app.route("/box/api/wifi/connect", methods=["POST"])
 @login_required
 def api_wifi_connect():
@@ -2456,120 +3327,55 @@ def api_wifi_connect():
         return _json_error("SSID is required", 400)
 
     if DEV_MODE:
-        with wifi_connect_lock:
-            wifi_connect_status.update({"status": "connecting", "message": f"Connecting to {ssid}...", "ip": ""})
-
-        def mock_connect():
+        def run(report):
+            report(20, f"Connecting to {ssid}...")
             time.sleep(4)
-            with wifi_connect_lock:
-                wifi_connect_status.update({"status": "success", "message": f"Connected to {ssid}", "ip": "192.168.1.42"})
-        threading.Thread(target=mock_connect, daemon=True).start()
-        return _json_response(status="connecting", data={"status": "connecting"})
-
-    wifi_iface = get_wifi_interface()
-    if not wifi_iface:
-        return _json_error("No wireless interface found", 404)
-
-    with wifi_connect_lock:
-        if wifi_connect_status["status"] == "connecting":
-            return _json_error("Connection attempt already in progress", 409)
-        wifi_connect_status.update({"status": "connecting", "message": f"Connecting to {ssid}...", "ip": ""})
-
-    def do_connect():
-        global wifi_connect_status
-        try:
-            # Read backup of current config
-            backup_conf = None
-            conf_path = "/etc/wpa_supplicant.conf"
-            try:
-                backup_conf = Path(conf_path).read_text()
-            except Exception:
-                pass
+            return {"ssid": ssid, "ip": "192.168.1.42", "message": f"Connected to {ssid}"}
+    else:
+        wifi_iface = get_wifi_interface()
+        if not wifi_iface:
+            return _json_error("No wireless interface found", 404)
 
-            # Add network
-            result = wpa_cli(wifi_iface, "add_network")
-            net_id = result.stdout.strip()
-
-            # Set SSID
-            wpa_cli(wifi_iface, "set_network", net_id, "ssid", f'"{ssid}"', check=True)
-
-            # Set password or open network
-            if password:
-                wpa_cli(wifi_iface, "set_network", net_id, "psk", f'"{password}"', check=True)
-            else:
-                wpa_cli(wifi_iface, "set_network", net_id, "key_mgmt", "NONE", check=True)
-
-            # Select network (connects to new, disables others)
-            wpa_cli(wifi_iface, "select_network", net_id, check=True)
-
-            # Poll for connection
-            connected = False
-            new_ip = ""
-            for _ in range(8):  # 8 * 2s = 16s max
-                time.sleep(2)
-                result = wpa_cli(wifi_iface, "status")
-                wpa = {}
-                for line in result.stdout.strip().splitlines():
-                    if "=" in line:
-                        k, v = line.split("=", 1)
-                        wpa[k] = v
-                if wpa.get("wpa_state") == "COMPLETED":
-                    new_ip = wpa.get("ip_address", "")
-                    connected = True
-                    break
+        def run(report):
+            return _connect_wifi(wifi_iface, ssid, password, report)
 
-            if connected:
-                # Re-enable all networks and save
-                wpa_cli(wifi_iface, "enable_network", "all")
-                wpa_cli(wifi_iface, "save_config")
-                with wifi_connect_lock:
-                    wifi_connect_status.update({
-                        "status": "success",
-                        "message": f"Connected to {ssid}",
-                        "ip": new_ip,
-                    })
-            else:
-                # Restore backup config
-                if backup_conf is not None:
-                    try:
-                        Path(conf_path).write_text(backup_conf)
-                        wpa_cli(wifi_iface, "reconfigure")
-                    except Exception:
-                        pass
-                with wifi_connect_lock:
-                    wifi_connect_status.update({
-                        "status": "failed",
-                        "message": f"Failed to connect to {ssid}",
-                        "ip": "",
-                    })
-        except Exception as e:
-            with wifi_connect_lock:
-                wifi_connect_status.update({
-                    "status": "failed",
-                    "message": str(e),
-                    "ip": "",
-                })
-
-    threading.Thread(target=do_connect, daemon=True).start()
-    return _json_response(status="connecting", data={"status": "connecting"})
+    try:
+        job = jobs.submit("wifi", run, title=f"Connect to {ssid}", exclusive=True)
+    except JobConflictError:
+        return _json_error("Connection attempt already in progress", 409)
+    return _job_response(job, f"Connecting to {ssid}...")
 
 
 @app.route("/box/api/wifi/connect/status")
 @login_required
 def api_wifi_connect_status():
-    with wifi_connect_lock:
-        payload = dict(wifi_connect_status)
-        return _json_response(data=payload, **payload)
+    # Legacy view of the latest Wi-Fi job; new clients poll /box/api/jobs/<id>
+    job = jobs.latest("wifi")
+    if job is None:
+        payload = {"status": "idle", "message": "", "ip": ""}
+    elif job["status"] == "succeeded":
+        payload = {"status": "success", "message": job["result"]["message"], "ip": job["result"]["ip"]}
+    elif job["status"] in ("failed", "interrupted"):
+        payload = {"status": "failed", "message": job["error"] or "", "ip": ""}
+    else:
+        payload = {"status": "connecting", "message": job["message"], "ip": ""}
+    payload["job_id"] = job["id"] if job else None
+    return _json_response(data=payload, **payload)
 
 
 # ── Tunnel Endpoints ────────────────────────────────────────────
 
-@app.route("/box/api/tunnel/status")
-@login_required
-def api_tunnel_status():
+def _tunnel_status_payload() -> dict[str, Any]:
     client_id, state = _get_or_create_tunnel_client_id()
     payload = _build_tunnel_status_payload(client_id, state)
     _schedule_tunnel_state_refresh(client_id)
+    return payload
+
+
+@app.route("/box/api/tunnel/status")
+@login_required
+def api_tunnel_status():
+    payload = _tunnel_status_payload()
     return _json_response(data=payload, **payload)
 
 
@@ -2730,6 +3536,7 @@ def api_tunnel_poll():
     service_status = _tunnel_service_status()
     auto_started = False
     auto_start_message: str | None = None
+    auto_start_job_id: str | None = None
 
     if DEV_MODE and pending and pending.get("action") == "renew":
         # Simple mock progression for local UI development
@@ -2743,13 +3550,14 @@ def api_tunnel_poll():
         _save_tunnel_state(state)
         pending = None
         paid = True
-        try:
-            auto_started, auto_start_message = _start_tunnel_service_if_needed(current, service_status=service_status)
-            if auto_started:
-                service_status = "active" if DEV_MODE else _tunnel_service_status()
-        except subprocess.CalledProcessError as e:
-            auto_started = False
-            auto_start_message = e.stderr.decode() or "Failed to start tunnel service"
+        auto_start_message = _tunnel_start_blocker(current, service_status=service_status)
+        if auto_start_message is None:
+            try:
+                auto_start_job_id = _submit_tunnel_start(current)["id"]
+                auto_started = True
+                auto_start_message = "Starting tunnel service"
+            except JobConflictError as exc:
+                auto_start_message = str(exc)
 
     payload = {
         "paid": paid,
@@ -2760,6 +3568,7 @@ def api_tunnel_poll():
         "connect_script": _tunnel_connect_script(state.get("current_tunnel")),
         "auto_started": auto_started,
         "auto_start_message": auto_start_message,
+        "auto_start_job_id": auto_start_job_id,
     }
     return _json_response(status="ok", data=payload, **payload)
 
@@ -2777,17 +3586,16 @@ def api_tunnel_start():
     if pending:
         return jsonify({"status": "error", "message": "Tunnel invoice is still unpaid"}), 409
 
+    blocker = _tunnel_start_blocker(current)
+    if blocker == "Tunnel service already active":
+        return jsonify({"status": "ok", "message": blocker})
+    if blocker:
+        return jsonify({"status": "error", "message": blocker}), 400
     try:
-        started, message = _start_tunnel_service_if_needed(current)
-        if not started and message == "Tunnel service already active":
-            return jsonify({"status": "ok", "message": message})
-        if not started:
-            return jsonify({"status": "error", "message": message}), 400
-        return jsonify({"status": "ok", "message": message})
-    except subprocess.CalledProcessError as e:
-        return jsonify({"status": "error", "message": e.stderr.decode()}), 500
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+        job = _submit_tunnel_start(current)
+    except JobConflictError as exc:
+        return _json_error(str(exc), 409)
+    return _job_response(job, "Starting tunnel service")
 
 
 @app.route("/box/api/tunnel/stop", methods=["POST"])
@@ -2797,7 +3605,7 @@ def api_tunnel_stop():
         return jsonify({"status": "ok", "message": "DEV MODE: would stop tunnel service"})
 
     try:
-        subprocess.run(
+        run_command(
             ["systemctl", "stop", f"{TUNNEL_SERVICE_NAME}.service"],
             check=True, capture_output=True, timeout=20
         )
@@ -2838,54 +3646,98 @@ def api_qrcode():
 # ── OTA Update Endpoints ─────────────────────────────────────────
 
 def get_current_version():
+    return file_cache.read(VERSION_FILE, str.strip, default="dev")
+
+
+UPDATE_PROGRESS = {"idle": 5, "downloading": 30, "activating": 70}
+# Held from the in-progress check until the update job is submitted, so two clicks cannot
+# both launch the unit
+_update_start_lock = threading.Lock()
+
+
+def _read_update_status() -> str:
     try:
-        return VERSION_FILE.read_text().strip()
+        return (UPDATE_STATE_DIR / "status").read_text().strip()
     except Exception:
-        return "dev"
+        return "idle"
+
+
+def _follow_update(report) -> dict[str, Any]:
+    """Job body that tracks the lnbitsbox-update unit through its status file"""
+    deadline = time.monotonic() + UPDATE_FOLLOW_TIMEOUT
+    while time.monotonic() < deadline:
+        status = _read_update_status()
+        if status == "success":
+            return {"status": status}
+        if status == "failed":
+            raise RuntimeError("Update failed. Check the update log for details.")
+        report(UPDATE_PROGRESS.get(status, 5), status)
+        time.sleep(2)
+    raise RuntimeError("Timed out waiting for the update to finish")
+
+
+def _resume_update_job():
+    """Activating an update restarts this app; a fresh job picks up following the unit"""
+    if not DEV_MODE and _read_update_status() in ("downloading", "activating"):
+        jobs.submit("update", _follow_update, title="System update", exclusive=True)
+
+
+def _fetch_latest_release() -> dict[str, Any]:
+    resp = http_request("github", "GET", GITHUB_RELEASES_URL, headers={
+        "Accept": "application/vnd.github.v3+json",
+    })
+    if not resp.ok:
+        raise RuntimeError(f"Failed to check for updates (GitHub returned HTTP {resp.status_code})")
+    return resp.json()
+
+
+# The latest release is looked up from every admin page (sidebar badge, update card), so it
+# is cached; "Check for updates" asks for a fresh lookup with ?refresh=1
+UPDATE_CHECK_REFRESH = 15 * 60
+UPDATE_CHECK_MAX_AGE = 6 * 3600
+latest_release = StaleWhileRevalidate(
+    _fetch_latest_release, refresh_after=UPDATE_CHECK_REFRESH, max_age=UPDATE_CHECK_MAX_AGE,
+)
 
 
-@app.route("/box/api/update/check")
-@login_required
-def api_update_check():
+def _update_check_payload(current: str, *, refresh: bool = False) -> dict[str, Any]:
     if DEV_MODE:
-        payload = {
+        return {
             "current_version": "1.0.0",
             "latest_version": "1.1.0",
             "update_available": True,
             "release_notes": "DEV MODE: Mock update available.\n- Bug fixes\n- Performance improvements",
             "release_tag": "v1.1.0",
         }
-        return _json_response(data=payload, **payload)
 
-    current = get_current_version()
-    try:
-        import requests
-        resp = requests.get(GITHUB_RELEASES_URL, timeout=10, headers={
-            "Accept": "application/vnd.github.v3+json",
-        })
-        if not resp.ok:
-            return _json_error("Failed to check for updates", 502, upstream_status_code=resp.status_code)
+    release = latest_release.refresh() if refresh else latest_release.get()
+    latest_tag = release.get("tag_name", "")
+    latest_version = latest_tag.lstrip("v")
+    release_notes = release.get("body", "")
+
+    has_manifest = any(
+        a.get("name") == "manifest.json"
+        for a in release.get("assets", [])
+    )
 
-        release = resp.json()
-        latest_tag = release.get("tag_name", "")
-        latest_version = latest_tag.lstrip("v")
-        release_notes = release.get("body", "")
+    return {
+        "current_version": current,
+        "latest_version": latest_version,
+        "update_available": latest_version != current and has_manifest,
+        "release_notes": release_notes,
+        "release_tag": latest_tag,
+    }
 
-        has_manifest = any(
-            a.get("name") == "manifest.json"
-            for a in release.get("assets", [])
-        )
 
-        payload = {
-            "current_version": current,
-            "latest_version": latest_version,
-            "update_available": latest_version != current and has_manifest,
-            "release_notes": release_notes,
-            "release_tag": latest_tag,
-        }
-        return _json_response(data=payload, **payload)
+@app.route("/box/api/update/check")
+@login_required
+def api_update_check():
+    refresh = request.args.get("refresh", "").lower() in {"1", "true", "yes"}
+    try:
+        payload = _update_check_payload(get_current_version(), refresh=refresh)
     except Exception as e:
-        return _json_error(str(e), 500)
+        return _json_error(str(e), 502)
+    return _json_response(data=payload, **payload)
 
 
 @app.route("/box/api/update/start", methods=["POST"])
@@ -2894,20 +3746,21 @@ def api_update_start():
     if DEV_MODE:
         return jsonify({"status": "started", "message": "DEV MODE: would start update"})
 
-    # Check if an update is already in progress
-    status_file = UPDATE_STATE_DIR / "status"
-    try:
-        current_status = status_file.read_text().strip()
-        if current_status in ("downloading", "activating"):
-            return jsonify({"status": "error", "message": "Update already in progress"}), 409
-    except Exception:
-        pass
-
     data = request.get_json(silent=True) or {}
     release_tag = data.get("release_tag", "")
     if not release_tag:
         return jsonify({"status": "error", "message": "No release_tag provided"}), 400
 
+    with _update_start_lock:
+        return _start_update(release_tag)
+
+
+def _start_update(release_tag: str):
+    # Caller holds _update_start_lock
+    latest_job = jobs.latest("update")
+    if _read_update_status() in ("downloading", "activating") or (latest_job and latest_job["status"] in ("queued", "running")):
+        return jsonify({"status": "error", "message": "Update already in progress"}), 409
+
     # Reset status to idle before starting
     try:
         UPDATE_STATE_DIR.mkdir(parents=True, exist_ok=True)
@@ -2918,7 +3771,7 @@ def api_update_start():
 
     # Launch update as a transient systemd unit so it survives admin app restarts
     try:
-        result = subprocess.run(
+        result = run_command(
             [
                 "systemd-run",
                 "--system",
@@ -2934,22 +3787,23 @@ def api_update_start():
         if result.returncode != 0:
             app.logger.error("systemd-run failed: %s", result.stderr.strip())
             return jsonify({"status": "error", "message": result.stderr.strip()}), 500
-        return jsonify({"status": "started"})
+        # The unit itself runs outside this process; the job follows its status file
+        job = jobs.submit("update", _follow_update, title=f"Update to {release_tag}", exclusive=True)
+        return jsonify({"status": "started", "job_id": job["id"], "job": job})
+    except JobConflictError as exc:
+        return _json_error(str(exc), 409)
     except Exception as e:
         app.logger.error("Failed to launch update: %s", e)
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
-@app.route("/box/api/update/status")
-@login_required
-def api_update_status():
+def _update_status_payload() -> dict[str, Any]:
     if DEV_MODE:
-        payload = {
+        return {
             "status": "idle",
             "log_lines": ["DEV MODE: No update in progress"],
             "target_version": "",
         }
-        return _json_response(data=payload, **payload)
 
     status = "idle"
     log_lines = []
@@ -2971,13 +3825,136 @@ def api_update_status():
     except Exception:
         pass
 
-    payload = {
+    return {
         "status": status,
         "log_lines": log_lines,
         "target_version": target_version,
     }
+
+
+@app.route("/box/api/update/status")
+@login_required
+def api_update_status():
+    payload = _update_status_payload()
     return _json_response(data=payload, **payload)
 
 
+# ── Dashboard Bootstrap ─────────────────────────────────────────
+
+# Everything the dashboard cards fetch on first render, in one round trip. Sections run
+# concurrently; the response waits at most BOOTSTRAP_TIMEOUT and reports slower sections
+# as "pending" (they keep running and warm their caches), so the page falls back to the
+# section's own endpoint instead of waiting on, e.g., a slow GitHub lookup
+BOOTSTRAP_TIMEOUT = 3
+BOOTSTRAP_WORKERS = 6
+bootstrap_pool = ThreadPoolExecutor(max_workers=BOOTSTRAP_WORKERS, thread_name_prefix="bootstrap")
+
+
+def _bootstrap_stats() -> dict[str, Any]:
+    current, age, _ = latest_stats()
+    with stats_lock:
+        columns, reset = stats_history.since(None)
+        appended = stats_history.appended
+    return _stats_payload(current, age, _history_payload(columns, reset=reset, appended=appended))
+
+
+# Section name -> builder; each reuses the helper behind the section's own endpoint
+BOOTSTRAP_SECTIONS = {
+    "stats": _bootstrap_stats,
+    "lnbits": lambda: stats_probes.values()["lnbits"],
+    "funding": _funding_status_payload,
+    "tunnel": _tunnel_status_payload,
+    "recovery": _recovery_status_payload,
+    "update_status": _update_status_payload,
+    "update_check": lambda: _update_check_payload(get_current_version()),
+}
+
+
+@app.route("/box/api/bootstrap")
+@login_required
+def api_bootstrap():
+    requested = [name.strip() for name in request.args.get("sections", "").split(",") if name.strip()]
+    unknown = [name for name in requested if name not in BOOTSTRAP_SECTIONS]
+    if unknown:
+        return _json_error(f"Unknown bootstrap section: {', '.join(unknown)}", 400)
+
+    if not DEV_MODE:
+        # Warm the unit-state cache once so every section reads the same `systemctl show`
+        unit_states.states()
+    sections = gather_sections(
+        {name: BOOTSTRAP_SECTIONS[name] for name in requested or BOOTSTRAP_SECTIONS},
+        bootstrap_pool,
+        BOOTSTRAP_TIMEOUT,
+    )
+    payload = {"sections": sections}
+    return _json_response(status="ok", data=payload, **payload)
+
+
+# ── Server ──────────────────────────────────────────────────────────
+
+# Production mode serves through waitress rather than Flask's development server: a bounded
+# worker pool and connection limit, idle keep-alive timeouts and a draining shutdown. The
+# threaded dev server does not stall fast requests behind slow ones either, and latency is
+# about the same (see bench_concurrency.py). Each live stats stream holds a worker, so the
+# pool must stay well above STATS_STREAM_MAX_CLIENTS
+ADMIN_HOST = "127.0.0.1"
+ADMIN_PORT = 8090
+ADMIN_SERVER = os.environ.get("LNBITSBOX_ADMIN_SERVER", "dev" if DEV_MODE else "waitress").strip().lower()
+ADMIN_THREADS = int(os.environ.get("LNBITSBOX_ADMIN_THREADS", "16"))
+# Idle keep-alive connections are closed after this many seconds
+ADMIN_CHANNEL_TIMEOUT = int(os.environ.get("LNBITSBOX_ADMIN_CHANNEL_TIMEOUT", "60"))
+ADMIN_CONNECTION_LIMIT = int(os.environ.get("LNBITSBOX_ADMIN_CONNECTION_LIMIT", "100"))
+# On SIGTERM, stop accepting and give in-flight requests this long to finish
+ADMIN_SHUTDOWN_TIMEOUT = 10
+
+
+def _close_stats_streams():
+    stats_stream_closing.set()
+    with stats_changed:
+        stats_changed.notify_all()
+
+
+def serve():
+    if ADMIN_SERVER == "dev":
+        # With the reloader, only the child process that serves requests starts the workers
+        if not DEV_MODE or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+            start_background()
+        app.run(host=ADMIN_HOST, port=ADMIN_PORT, debug=DEV_MODE, threaded=True)
+        return
+
+    from waitress import create_server
+
+    server = create_server(
+        app,
+        host=ADMIN_HOST,
+        port=ADMIN_PORT,
+        threads=ADMIN_THREADS,
+        channel_timeout=ADMIN_CHANNEL_TIMEOUT,
+        connection_limit=ADMIN_CONNECTION_LIMIT,
+        ident="lnbitsbox-admin",
+    )
+
+    # server.run() would shut the task dispatcher down itself on KeyboardInterrupt, before
+    # responses are flushed, so the runner drives the loop and drains it on shutdown
+    runner = WaitressRunner(server)
+    if not runner.supported:
+        app.logger.warning("Unrecognized waitress internals; shutdown will not drain requests")
+
+    def stop(signum, frame):
+        runner.stop()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    start_background()
+    app.logger.info("Serving on http://%s:%s with %s threads", ADMIN_HOST, ADMIN_PORT, ADMIN_THREADS)
+    try:
+        runner.run()
+    finally:
+        if not runner.drain(ADMIN_SHUTDOWN_TIMEOUT, on_drain=_close_stats_streams):
+            app.logger.warning("Closed the server without draining in-flight requests")
+        background_workers.stop(timeout=ADMIN_SHUTDOWN_TIMEOUT)
+        stats_probes.shutdown()
+
+
 if __name__ == "__main__":
-    app.run(host="127.0.0.1", port=8090, debug=DEV_MODE)
+    serve()
@@ -0,0 +1,243 @@
+"""
+Build step for the dashboard's static assets.
+
+    python asset_utils.py                # writes static/dist/
+    python asset_utils.py --out /tmp/dist
+
+- Each bundle concatenates the listed files (in order) from static/ and minifies them.
+- Output names carry a content hash (dashboard.3f2a9c1b0d4e.js), so they can be cached forever.
+- Every output gets a .gz variant, and a .br variant when the brotli module is installed.
+- manifest.json maps bundle names to the hashed file names; templates resolve them
+  through asset_urls() and fall back to the source files when there is no manifest.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz variants are written without it
+    brotli = None
+
+MANIFEST_NAME = "manifest.json"
+
+# Bundle name -> source files under static/, in load order. Every page that loads
+# dashboard-core.js gets one bundle, so it costs one request besides the CSS and shell
+ASSET_BUNDLES: dict[str, tuple[str, ...]] = {
+    "admin.css": ("css/admin.css",),
+    "shell.js": ("js/admin-shell.js",),
+    "dashboard.js": (
+        "js/dashboard-core.js", "js/dashboard-services.js", "js/dashboard-tunnel.js", "js/dashboard-wifi.js",
+        "js/dashboard-db.js", "js/dashboard-updates.js", "js/dashboard-app.js",
+    ),
+    "overview.js": (
+        "js/dashboard-core.js", "js/dashboard-services.js", "js/dashboard-tunnel.js", "js/dashboard-updates.js",
+        "js/dashboard-app.js",
+    ),
+    "advanced.js": (
+        "js/dashboard-core.js", "js/dashboard-services.js", "js/dashboard-tunnel.js", "js/dashboard-logs.js",
+        "js/dashboard-factory-reset.js", "js/dashboard-perf.js", "js/dashboard-workers.js", "js/dashboard-app.js",
+    ),
+    "funding.js": (
+        "js/dashboard-core.js", "js/dashboard-services.js", "js/dashboard-funding.js", "js/dashboard-app.js",
+        "js/dashboard-spark.js", "js/dashboard-arkade.js", "js/dashboard-seeds.js",
+    ),
+    "maintenance.js": ("js/dashboard-core.js", "js/dashboard-updates.js", "js/dashboard-app.js"),
+    "recovery.js": ("js/dashboard-core.js", "js/dashboard-db.js", "js/dashboard-app.js"),
+    "remote_access.js": (
+        "js/dashboard-core.js", "js/dashboard-services.js", "js/dashboard-tunnel.js", "js/dashboard-app.js",
+    ),
+    "system.js": (
+        "js/dashboard-core.js", "js/dashboard-services.js", "js/dashboard-wifi.js", "js/dashboard-updates.js",
+        "js/dashboard-app.js",
+    ),
+}
+
+ASSET_TYPES = {
+    ".js": "text/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+}
+
+# A "/" after one of these starts a regular expression rather than a division
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = {"return", "typeof", "case", "in", "of", "delete", "void", "throw", "new", "instanceof"}
+
+
+def _previous_word(out: list[str]) -> str:
+    text = "".join(out[-12:]).rstrip()
+    word = ""
+    for char in reversed(text):
+        if not (char.isalnum() or char in "_$"):
+            break
+        word = char + word
+    return word
+
+
+def _regex_allowed(out: list[str]) -> bool:
+    text = "".join(out[-12:]).rstrip()
+    if not text:
+        return True
+    return text[-1] in _REGEX_PRECEDERS or _previous_word(out) in _REGEX_KEYWORDS
+
+
+def minify_js(source: str) -> str:
+    """
+    Conservative minifier: drops comments, indentation and blank lines and collapses
+    runs of spaces, leaving strings, template literals and regexes untouched.
+    Line breaks are kept so automatic semicolon insertion behaves as before.
+    """
+    out: list[str] = []
+    i, n = 0, len(source)
+
+    def newline():
+        while out and out[-1] in (" ", "\t"):
+            out.pop()
+        if out and out[-1] != "\n":
+            out.append("\n")
+
+    while i < n:
+        char = source[i]
+        if char in "'\"`":
+            end = i + 1
+            while end < n and source[end] != char:
+                if source[end] == "\\":
+                    end += 1
+                elif char != "`" and source[end] == "\n":
+                    break
+                end += 1
+            out.append(source[i:end + 1])
+            i = end + 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            if "\n" in source[i:end]:
+                newline()
+            elif out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            i = end
+        elif char == "/" and _regex_allowed(out):
+            end, in_class = i + 1, False
+            while end < n and source[end] != "\n":
+                if source[end] == "\\":
+                    end += 1
+                elif source[end] == "[":
+                    in_class = True
+                elif source[end] == "]":
+                    in_class = False
+                elif source[end] == "/" and not in_class:
+                    break
+                end += 1
+            out.append(source[i:end + 1])
+            i = end + 1
+        elif char == "\n":
+            newline()
+            i += 1
+        elif char in " \t\r":
+            if out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            i += 1
+        else:
+            out.append(char)
+            i += 1
+    newline()
+    return "".join(out).lstrip("\n")
+
+
+def minify_css(source: str) -> str:
+    """Drops comments and whitespace that CSS does not need; strings are left untouched"""
+    out: list[str] = []
+    i, n = 0, len(source)
+    while i < n:
+        char = source[i]
+        if char in "'\"":
+            end = i + 1
+            while end < n and source[end] != char:
+                end += 2 if source[end] == "\\" else 1
+            out.append(source[i:end + 1])
+            i = end + 1
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif char.isspace():
+            while i < n and source[i].isspace():
+                i += 1
+            following = source[i] if i < n else ""
+            if out and out[-1] not in "{};,>:" and following not in "{};,>":
+                out.append(" ")
+            elif out and out[-1] == ":" and following == ";":
+                # Tailwind's empty custom properties ("--tw-pan-x: ;") need the space
+                out.append(" ")
+        else:
+            if char == "}" and out and out[-1] == ";":
+                out.pop()
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def bundle_source(static_dir: Path, files: tuple[str, ...]) -> str:
+    # The ";" keeps one file's trailing IIFE from being called by the next file's "("
+    return "\n;".join(Path(static_dir, name).read_text(encoding="utf-8") for name in files)
+
+
+def hashed_name(name: str, content: bytes) -> str:
+    stem, suffix = name.rsplit(".", 1)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}.{suffix}"
+
+
+def build_assets(static_dir: Path, out_dir: Path,
+                 bundles: dict[str, tuple[str, ...]] = ASSET_BUNDLES) -> dict[str, str]:
+    """Write minified, hashed and precompressed bundles plus the manifest; returns the manifest"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest: dict[str, str] = {}
+    for name, files in bundles.items():
+        source = bundle_source(static_dir, files)
+        minified = minify_css(source) if name.endswith(".css") else minify_js(source)
+        content = minified.encode("utf-8")
+        filename = hashed_name(name, content)
+        (out_dir / filename).write_bytes(content)
+        (out_dir / f"{filename}.gz").write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli is not None:
+            (out_dir / f"{filename}.br").write_bytes(brotli.compress(content, quality=11))
+        manifest[name] = filename
+
+    keep = {MANIFEST_NAME} | {f"{filename}{ext}" for filename in manifest.values() for ext in ("", ".gz", ".br")}
+    for stale in out_dir.iterdir():
+        if stale.is_file() and stale.name not in keep:
+            stale.unlink()
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return manifest
+
+
+def load_manifest(out_dir: Path) -> dict[str, str] | None:
+    try:
+        manifest = json.loads((Path(out_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def main():
+    here = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Bundle, minify, hash and precompress the dashboard assets")
+    parser.add_argument("--static", type=Path, default=here / "static")
+    parser.add_argument("--out", type=Path, default=here / "static" / "dist")
+    args = parser.parse_args()
+    for name, filename in build_assets(args.static, args.out).items():
+        sizes = [(args.out / f"{filename}{ext}") for ext in ("", ".gz", ".br")]
+        print(f"{name:>18} -> {filename}  " + " / ".join(
+            f"{path.suffix.lstrip('.') if path.suffix in ('.gz', '.br') else 'raw'} {path.stat().st_size}"
+            for path in sizes if path.exists()
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Static-asset load time for one dashboard page over an emulated high-latency link.
+
+    python asset_utils.py
+    python bench_assets.py --page advanced.js --rtt 0.6 --bandwidth 64
+
+- A local server adds --rtt seconds to every request and sends at most --bandwidth KiB/s
+  per response, roughly a Tor circuit or the lnpro reverse tunnel.
+- "before" fetches the page's source files uncompressed (one request each); "after"
+  fetches the bundles from static/dist with their brotli/gzip variant.
+- Requests run over --connections parallel connections, like a browser's 6 per host.
+- Bandwidth is per connection rather than shared, which flatters "before".
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from asset_utils import ASSET_BUNDLES, load_manifest
+
+HERE = Path(__file__).resolve().parent
+
+
+def page_assets(page: str) -> list[str]:
+    # Every page loads the CSS; pages built on admin_page.html also load the shell
+    return ["admin.css"] + ([] if page == "dashboard.js" else ["shell.js"]) + [page]
+
+
+def before_files(page: str) -> dict[str, tuple[bytes, str | None]]:
+    files = {}
+    for name in page_assets(page):
+        for path in ASSET_BUNDLES[name]:
+            files[f"/static/{path}"] = ((HERE / "static" / path).read_bytes(), None)
+    return files
+
+
+def after_files(page: str, dist: Path) -> dict[str, tuple[bytes, str | None]]:
+    manifest = load_manifest(dist)
+    if manifest is None:
+        raise SystemExit(f"No manifest in {dist}; run `python asset_utils.py` first")
+    files = {}
+    for name in page_assets(page):
+        filename = manifest[name]
+        for suffix, encoding in ((".br", "br"), (".gz", "gzip"), ("", None)):
+            variant = dist / f"{filename}{suffix}"
+            if variant.exists():
+                files[f"/assets/{filename}"] = (variant.read_bytes(), encoding)
+                break
+    return files
+
+
+def serve(files: dict[str, tuple[bytes, str | None]], rtt: float, bandwidth: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body, encoding = files[self.path]
+            time.sleep(rtt)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+            for offset in range(0, len(body), 4096):
+                chunk = body[offset:offset + 4096]
+                time.sleep(len(chunk) / bandwidth)
+                self.wfile.write(chunk)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return httpd
+
+
+def load(files: dict[str, tuple[bytes, str | None]], args) -> dict[str, float | int]:
+    httpd = serve(files, args.rtt, args.bandwidth * 1024)
+    host, port = httpd.server_address[:2]
+
+    def fetch(path: str) -> int:
+        with urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=120) as resp:
+            return len(resp.read())
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.connections) as pool:
+        transferred = sum(pool.map(fetch, files))
+    elapsed = time.perf_counter() - started
+    httpd.shutdown()
+    httpd.server_close()
+    return {"requests": len(files), "bytes": transferred, "seconds": round(elapsed, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare static-asset load time before/after bundling")
+    parser.add_argument("--page", default="dashboard.js", choices=sorted(name for name in ASSET_BUNDLES if name != "shell.js" and name.endswith(".js")))
+    parser.add_argument("--rtt", type=float, default=0.6, help="seconds added to every request")
+    parser.add_argument("--bandwidth", type=float, default=64.0, help="KiB/s per response")
+    parser.add_argument("--connections", type=int, default=6)
+    parser.add_argument("--dist", type=Path, default=HERE / "static" / "dist")
+    args = parser.parse_args()
+    for label, files in (("before", before_files(args.page)), ("after", after_files(args.page, args.dist))):
+        result = load(files, args)
+        print(f"{label:>6}: {result['requests']:>2} requests  {result['bytes']:>7} bytes  {result['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
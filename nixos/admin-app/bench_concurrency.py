@@ -0,0 +1,115 @@
+"""
+Concurrent-request latency benchmark for the admin dashboard.
+
+Keeps a few slow requests in flight (journal download by default) while timing fast
+requests from several parallel clients. Run it against each server mode and compare:
+
+    LNBITSBOX_ADMIN_SERVER=dev python app.py &
+    python bench_concurrency.py --cookie "session=..."
+    LNBITSBOX_ADMIN_SERVER=waitress python app.py &
+    python bench_concurrency.py --cookie "session=..."
+
+- --cookie is the Cookie header of a logged-in browser session.
+- Reports p50/p95/max latency and errors for the fast requests.
+
+Measured 2026-10-18 on a 1-CPU x86 container, not a Pi. The app ran under DEV_MODE with
+a WSGI wrapper adding a /bench/slow route that sleeps 2s, because DEV_MODE mocks the
+real slow endpoints. Settings: --slow /bench/slow --requests 1000 --concurrency 8,
+with the fast requests to /box/api/stats. Each line is one of two runs.
+
+    server                        slow clients   rps   p50_ms  p95_ms  max_ms
+    dev (Flask, threaded=True)    0              424   18.3    25.9    51.2
+    dev (Flask, threaded=True)    4              440   17.9    25.8    37.1
+    dev (Flask, threaded=True)    12             440   17.9    24.7    35.9
+    waitress (16 threads)         0              504   15.1    27.3    45.4
+    waitress (16 threads)         4              474   16.4    28.3    40.5
+    waitress (16 threads)         12             470   16.6    24.8    37.2
+
+The threaded dev server already keeps fast requests from stalling behind slow ones.
+Waitress gives about 10% more throughput and a slightly lower p50, with the same p95.
+One waitress run with 12 slow clients had a 892ms max. The reasons to switch are
+operational: a bounded pool, a connection limit, idle timeouts and a draining
+shutdown. Latency is not one of them.
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def fetch(url: str, cookie: str, timeout: float) -> float:
+    req = urllib.request.Request(url, headers={"Cookie": cookie} if cookie else {})
+    started = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        resp.read()
+    return time.perf_counter() - started
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run(args) -> dict[str, float | int]:
+    stop = threading.Event()
+
+    def slow_client():
+        while not stop.is_set():
+            try:
+                fetch(args.url + args.slow, args.cookie, args.timeout)
+            except Exception:
+                time.sleep(0.5)
+
+    slow_threads = [threading.Thread(target=slow_client, daemon=True) for _ in range(args.slow_clients)]
+    for thread in slow_threads:
+        thread.start()
+    time.sleep(0.5)
+
+    latencies: list[float] = []
+    errors = 0
+
+    def fast_request(_):
+        return fetch(args.url + args.fast, args.cookie, args.timeout)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(fast_request, index) for index in range(args.requests)]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except (OSError, urllib.error.URLError):
+                errors += 1
+    elapsed = time.perf_counter() - started
+    stop.set()
+
+    latencies.sort()
+    return {
+        "requests": args.requests,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 1) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1) if latencies else None,
+        "max_ms": round(latencies[-1] * 1000, 1) if latencies else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure fast-request latency while slow requests are running")
+    parser.add_argument("--url", default="http://127.0.0.1:8090")
+    parser.add_argument("--cookie", default="", help="Cookie header of a logged-in session")
+    parser.add_argument("--fast", default="/box/api/stats")
+    parser.add_argument("--slow", default="/box/api/logs/lnbits/download")
+    parser.add_argument("--slow-clients", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    for key, value in run(args).items():
+        print(f"{key:>15}: {value}")
+
+
+if __name__ == "__main__":
+    main()
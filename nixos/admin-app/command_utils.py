@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from typing import Any, Callable
+
+from perf_utils import CallRecorder, command_label
+from stats_utils import SingleFlight
+
+# Read-only commands whose successful results may be reused, by command label, in seconds
+DEFAULT_READ_TTLS: dict[str, float] = {
+    "systemctl show": 2.0,
+    "systemctl is-active": 2.0,
+    "ip addr": 5.0,
+    "ip route": 5.0,
+    "ip link": 5.0,
+    "wpa_cli status": 1.0,
+    "wpa_cli scan_results": 5.0,
+    "wpa_cli list_networks": 5.0,
+}
+
+# Any other command of these tools is treated as a mutation and drops cached reads of the
+# listed tools (joining a network changes addresses, so wpa_cli also invalidates ip)
+DEFAULT_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "systemctl": ("systemctl",),
+    "wpa_cli": ("wpa_cli", "ip"),
+    "ip": ("ip",),
+}
+
+
+def _tool(label: str) -> str:
+    return label.split(" ", 1)[0]
+
+
+class CommandRunner:
+    """
+    Single execution layer for subprocesses:
+    - Identical read-only commands already running are joined instead of forked again;
+      mutations always run on their own, so one issued after a config write is never
+      answered by a run that started before it.
+    - Successful read-only commands (see DEFAULT_READ_TTLS) are cached for their TTL.
+    - Other commands of a known tool invalidate that tool's cached reads and notify listeners.
+    - At most `max_concurrent` subprocesses run at once; waiting for a slot counts against
+      the command's timeout, and the subprocess only gets what is left of it.
+    - Every executed command is timed through the CallRecorder.
+    """
+
+    def __init__(self, *, run: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+                 recorder: CallRecorder | None = None, max_concurrent: int = 4,
+                 read_ttls: dict[str, float] | None = None,
+                 invalidates: dict[str, tuple[str, ...]] | None = None,
+                 clock: Callable[[], float] | None = None):
+        self._run = run
+        self._recorder = recorder
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._read_ttls = DEFAULT_READ_TTLS if read_ttls is None else read_ttls
+        self._invalidates = DEFAULT_INVALIDATES if invalidates is None else invalidates
+        self._clock = clock or time.monotonic
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._cache: dict[tuple, tuple[float, str, subprocess.CompletedProcess]] = {}
+        self._listeners: list[Callable[[str], None]] = []
+
+    def on_invalidate(self, listener: Callable[[str], None]):
+        """Call listener(tool) whenever a mutating command invalidates that tool's reads"""
+        self._listeners.append(listener)
+
+    def invalidate(self, tool: str | None = None):
+        with self._lock:
+            if tool is None:
+                self._cache.clear()
+            else:
+                for key in [key for key, entry in self._cache.items() if entry[1] == tool]:
+                    del self._cache[key]
+        for listener in list(self._listeners):
+            listener(tool)
+
+    def _execute(self, label: str, args: list[str], kwargs: dict[str, Any]) -> subprocess.CompletedProcess:
+        timeout = kwargs.get("timeout")
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=timeout):
+            raise subprocess.TimeoutExpired(args, timeout)
+        try:
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(args, timeout)
+                kwargs = {**kwargs, "timeout": remaining}
+            if self._recorder is not None:
+                return self._recorder.time_call("subprocess", label, self._run, args, **kwargs)
+            return self._run(args, **kwargs)
+        finally:
+            self._slots.release()
+
+    def run(self, args: list[str], *, cache_ttl: float | None = None, **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run() through the shared layer; cache_ttl overrides the default TTL (0 disables)"""
+        args = [str(arg) for arg in args]
+        label = command_label(args)
+        tool = _tool(label)
+        ttl = self._read_ttls.get(label, 0.0) if cache_ttl is None else cache_ttl
+        is_read = label in self._read_ttls or bool(cache_ttl)
+        key = (tuple(args), tuple(sorted((name, repr(value)) for name, value in kwargs.items() if name != "timeout")))
+
+        if ttl > 0:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] > self._clock():
+                    return entry[2]
+
+        try:
+            if is_read:
+                result = self._flight.do(key, lambda: self._execute(label, args, kwargs))
+            else:
+                result = self._execute(label, args, kwargs)
+        finally:
+            if not is_read and tool in self._invalidates:
+                for target in self._invalidates[tool]:
+                    self.invalidate(target)
+
+        if ttl > 0 and result.returncode == 0:
+            with self._lock:
+                self._cache[key] = (self._clock() + ttl, tool, result)
+        return result
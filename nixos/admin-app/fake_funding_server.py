@@ -0,0 +1,126 @@
+"""
+Local stand-ins for the funding backends, for offline development and load tests.
+
+    python fake_funding_server.py spark --port 8765
+    python fake_funding_server.py phoenixd --port 9740 --latency 0.05 --fail-rate 0.1
+
+- spark/ark answer POST /v1/balance like the sidecars.
+- phoenixd answers GET /getbalance, /listchannels and /getinfo.
+- --latency delays every response; --fail-rate answers that share of requests with 503.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+FAKE_CHANNELS = [
+    {
+        "state": "Normal",
+        "channelId": "6f1c2a0b9e3d4c5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f",
+        "balanceSat": 245000,
+        "inboundLiquiditySat": 1755000,
+        "capacitySat": 2000000,
+        "fundingTxId": "a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f06f1c2a0b9e3d4c5f6a7b8c9d0e1f",
+    },
+]
+
+ROUTES: dict[str, dict[tuple[str, str], Any]] = {
+    "spark": {("POST", "/v1/balance"): {"balance_sats": 125000}},
+    "ark": {("POST", "/v1/balance"): {"balance_sats": 98000, "status": "ready"}},
+    "phoenixd": {
+        ("GET", "/getbalance"): {"balanceSat": 245000, "feeCreditSat": 1200},
+        ("GET", "/listchannels"): FAKE_CHANNELS,
+        ("GET", "/getinfo"): {"nodeId": "02" + "ab" * 32, "channels": FAKE_CHANNELS, "chain": "mainnet", "version": "fake"},
+    },
+}
+
+
+class FakeFundingServer:
+    """Threaded HTTP server for one backend; port 0 picks a free port"""
+
+    def __init__(self, backend: str, *, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, fail_rate: float = 0.0):
+        if backend not in ROUTES:
+            raise ValueError(f"Unknown backend: {backend}")
+        routes = ROUTES[backend]
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                with server._lock:
+                    server.requests += 1
+                if latency:
+                    time.sleep(latency)
+                body = routes.get((self.command, self.path.split("?", 1)[0]))
+                if body is None:
+                    status, body = 404, {"error": "not found"}
+                elif fail_rate and random.random() < fail_rate:
+                    status, body = 503, {"error": "injected failure"}
+                else:
+                    status = 200
+                raw = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self.backend = backend
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeFundingServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name=f"fake-{self.backend}", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake funding backend for offline testing")
+    parser.add_argument("backend", choices=sorted(ROUTES))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered with 503")
+    args = parser.parse_args()
+    server = FakeFundingServer(args.backend, host=args.host, port=args.port, latency=args.latency, fail_rate=args.fail_rate)
+    print(f"fake {args.backend} listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+
+class FileCache:
+    """
+    Parsed contents of small files, validated with stat() instead of re-reading:
+    - read() returns the cached value while the file's (inode, mtime, size) are unchanged;
+      otherwise it reads and parses the file again.
+    - Missing or unreadable files and parse errors return `default` (nothing is cached).
+    - Entries are per (path, parse), so one file can be cached under several parsers.
+    - invalidate() drops entries for a path, or everything; write helpers call it so a
+      rewrite within the same mtime tick is never missed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, Hashable], tuple[tuple[int, int, int], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path, parse: Callable[[str], Any] = str, *, default: Any = None) -> Any:
+        key = (os.fspath(path), parse)
+        try:
+            st = os.stat(key[0])
+        except OSError:
+            return default
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        try:
+            value = parse(Path(key[0]).read_text(encoding="utf-8"))
+        except Exception:
+            return default
+        with self._lock:
+            self._entries[key] = (signature, value)
+        return value
+
+    def invalidate(self, path: Path | None = None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            target = os.fspath(path)
+            for key in [key for key in self._entries if key[0] == target]:
+                del self._entries[key]
+
+    def status(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable
+
+from phoenixd_utils import liquidity_summary, normalize_balance, normalize_channels, sats_from
+
+# request(upstream, method, url, **kwargs) -> response with .ok, .status_code and .json(),
+# e.g. UpstreamClients.request so pooling and circuit breakers apply
+Request = Callable[..., Any]
+
+# (latency_ms, error) of every call made while checked_status() runs; gathered sub-tasks and
+# worker threads inherit the context, so concurrent calls land in the same list
+_call_log: contextvars.ContextVar[list[tuple[float, str | None]] | None] = contextvars.ContextVar(
+    "funding_call_log", default=None,
+)
+
+
+class EventLoopThread:
+    """
+    One long-lived asyncio loop on a daemon thread, for running coroutines from sync code:
+    - run(coro) schedules the coroutine on the loop and blocks until it finishes.
+    - The loop and its default executor (used by asyncio.to_thread) are created on first
+      use and reused, instead of a new loop and thread pool per asyncio.run().
+    """
+
+    def __init__(self, *, name: str = "asyncio-loop", max_workers: int | None = None):
+        self._name = name
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=f"{self._name}-io"))
+                threading.Thread(target=loop.run_forever, name=self._name, daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro: Awaitable[Any], timeout: float | None = None) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result(timeout)
+
+
+class FundingSourceClient(ABC):
+    """
+    Common async interface for a funding backend:
+    - balance() -> {"balance": sats, ...} or None
+    - status() -> backend-specific status dict (balance included)
+    - channels() -> normalized channel list, or None where the backend has no channels
+    - health() -> {"ok", "latency_ms", "error"} from one cheap call
+    - checked_status() -> (status, health) with health taken from the status calls themselves
+    Blocking HTTP calls run in worker threads, so clients can be gathered concurrently.
+    """
+
+    key = ""
+    upstream = ""
+    health_path = ""
+    health_method = "GET"
+
+    def __init__(self, base_url: str, request: Request):
+        self.base_url = base_url.rstrip("/")
+        self._request = request
+        self.last_latency_ms: float | None = None
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        return {}
+
+    async def _call(self, method: str, path: str) -> Any:
+        """Decoded JSON body of a 2xx response; raises on transport errors and other statuses"""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        started = time.perf_counter()
+        error = None
+        try:
+            resp = await asyncio.to_thread(self._request, self.upstream, method, url, **self._request_kwargs())
+            if not resp.ok:
+                raise RuntimeError(f"HTTP {resp.status_code}")
+            return resp.json()
+        except Exception as exc:
+            error = str(exc) or exc.__class__.__name__
+            raise
+        finally:
+            self.last_latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            log = _call_log.get()
+            if log is not None:
+                log.append((self.last_latency_ms, error))
+
+    async def _try_call(self, method: str, path: str) -> Any:
+        try:
+            return await self._call(method, path)
+        except Exception:
+            return None
+
+    @abstractmethod
+    async def balance(self) -> dict[str, Any] | None:
+        ...
+
+    async def channels(self) -> list[dict[str, Any]] | None:
+        return None
+
+    async def status(self) -> dict[str, Any]:
+        return {"balance": await self.balance()}
+
+    async def health(self) -> dict[str, Any]:
+        try:
+            await self._call(self.health_method, self.health_path)
+        except Exception as exc:
+            return {"ok": False, "latency_ms": self.last_latency_ms, "error": str(exc) or exc.__class__.__name__}
+        return {"ok": True, "latency_ms": self.last_latency_ms, "error": None}
+
+    async def checked_status(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """status() and its health: ok when every call succeeded, latency of the slowest call"""
+        log: list[tuple[float, str | None]] = []
+        token = _call_log.set(log)
+        try:
+            status = await self.status()
+        finally:
+            _call_log.reset(token)
+        errors = [error for _, error in log if error]
+        return status, {
+            "ok": bool(log) and not errors,
+            "latency_ms": max(latency for latency, _ in log) if log else None,
+            "error": errors[0] if errors else None,
+        }
+
+
+class _SidecarClient(FundingSourceClient):
+    """Spark/Arkade sidecars: POST /v1/balance with an X-API-Key header"""
+
+    health_path = "v1/balance"
+    health_method = "POST"
+
+    def __init__(self, base_url: str, request: Request, api_key: Callable[[], str] = lambda: ""):
+        super().__init__(base_url, request)
+        self._api_key = api_key
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        api_key = self._api_key()
+        return {"headers": {"X-API-Key": api_key} if api_key else {}}
+
+    async def _balance_data(self) -> dict[str, Any] | None:
+        data = await self._try_call("POST", "v1/balance")
+        return data if isinstance(data, dict) else None
+
+
+class SparkClient(_SidecarClient):
+    key = "spark"
+    upstream = "spark"
+
+    async def balance(self) -> dict[str, Any] | None:
+        data = await self._balance_data()
+        if data is None:
+            return None
+        balance = sats_from(data, ("balance_sats",), ("balance_msat",))
+        return {"balance": balance} if balance is not None else None
+
+
+class ArkadeClient(_SidecarClient):
+    key = "ark"
+    upstream = "arkade"
+
+    async def balance(self) -> dict[str, Any] | None:
+        data = await self._balance_data()
+        if data is None:
+            return None
+        balance = sats_from(data, ("balance_sats",), ("balance_msat",))
+        result = {"balance": balance, "status": data.get("status")}
+        if balance is None:
+            result["raw"] = data
+        return result
+
+    async def status(self) -> dict[str, Any]:
+        balance = await self.balance()
+        return {
+            "balance": balance,
+            "mnemonic_missing": (balance or {}).get("status") == "missing_mnemonic",
+        }
+
+
+class PhoenixdClient(FundingSourceClient):
+    """phoenixd HTTP API with basic auth; status() fetches balance, channels and info concurrently"""
+
+    key = "phoenixd"
+    upstream = "phoenixd"
+    health_path = "getinfo"
+
+    def __init__(self, base_url: str, request: Request, password: Callable[[], str] = lambda: ""):
+        super().__init__(base_url, request)
+        self._password = password
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        return {"auth": ("", self._password())}
+
+    async def balance(self) -> dict[str, Any] | None:
+        return normalize_balance(await self._try_call("GET", "getbalance"))
+
+    async def channels(self) -> list[dict[str, Any]]:
+        listchannels, getinfo = await asyncio.gather(
+            self._try_call("GET", "listchannels"), self._try_call("GET", "getinfo"),
+        )
+        return normalize_channels(listchannels, getinfo)
+
+    async def status(self) -> dict[str, Any]:
+        balance, channels = await asyncio.gather(self.balance(), self.channels())
+        return {
+            "balance": balance,
+            "channels": channels,
+            "channel_count": len(channels),
+            "liquidity": liquidity_summary(channels),
+        }
+
+
+async def gather_funding(clients: dict[str, FundingSourceClient], selected: str | None,
+                         health_keys: list[str] | tuple[str, ...] = ()) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+    """
+    Status of the selected backend and health of `health_keys`, all concurrently. The selected
+    backend's health comes from its status calls, so it is not called a second time.
+    """
+    client = clients.get(selected) if selected else None
+    keys = [key for key in health_keys if key in clients and not (client is not None and key == selected)]
+    results = await asyncio.gather(
+        client.checked_status() if client is not None else asyncio.sleep(0, (None, None)),
+        *(clients[key].health() for key in keys),
+    )
+    status, selected_health = results[0]
+    health = dict(zip(keys, results[1:]))
+    if client is not None and selected in health_keys:
+        health[selected] = selected_health
+    return status, health
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+from perf_utils import CallRecorder
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker:
+    - closed: calls pass; `failure_threshold` failures in a row open the breaker.
+    - open: calls fail fast until `cooldown` seconds have passed.
+    - half_open: one trial call is let through; success closes, failure re-opens.
+    """
+
+    def __init__(self, *, failure_threshold: int = 3, cooldown: float = 30.0,
+                 clock: Callable[[], float] | None = None):
+        self._threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._rejected = 0
+        self._last_error: str | None = None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if self._state == "open" and self._clock() - self._opened_at >= self._cooldown:
+                self._state = "half_open"
+            if self._state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+            self._last_error = None
+
+    def record_failure(self, error: str):
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+            self._trial_in_flight = False
+            if self._state == "half_open" or self._failures >= self._threshold:
+                self._state = "open"
+                self._opened_at = self._clock()
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            retry_in = None
+            if self._state == "open":
+                retry_in = max(0.0, round(self._opened_at + self._cooldown - self._clock(), 1))
+            return {
+                "state": self._state,
+                "failures": self._failures,
+                "rejected": self._rejected,
+                "retry_in": retry_in,
+                "last_error": self._last_error,
+            }
+
+
+def _default_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class UpstreamClients:
+    """
+    One pooled keep-alive requests.Session per upstream (spark, phoenixd, github, ...):
+    - configure(name, timeout=(connect, read), breaker=True) sets the default timeout and
+      optionally guards the upstream with a CircuitBreaker.
+    - request() raises CircuitOpenError while the breaker is open; connection errors and
+      5xx responses count as failures.
+    - Every request that reaches the network is timed through the CallRecorder.
+    """
+
+    def __init__(self, recorder: CallRecorder | None = None, *,
+                 session_factory: Callable[[], Any] = _default_session,
+                 default_timeout: tuple[float, float] = (3.0, 10.0),
+                 failure_threshold: int = 3, cooldown: float = 30.0,
+                 clock: Callable[[], float] | None = None):
+        self._recorder = recorder
+        self._session_factory = session_factory
+        self._default_timeout = default_timeout
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: dict[str, Any] = {}
+        self._timeouts: dict[str, tuple[float, float]] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def configure(self, name: str, *, timeout: tuple[float, float] | None = None, breaker: bool = False):
+        with self._lock:
+            if timeout is not None:
+                self._timeouts[name] = timeout
+            if breaker and name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(
+                    failure_threshold=self._failure_threshold, cooldown=self._cooldown, clock=self._clock,
+                )
+
+    def _session(self, name: str):
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None:
+                session = self._sessions[name] = self._session_factory()
+            return session
+
+    def request(self, name: str, method: str, url: str, **kwargs):
+        breaker = self._breakers.get(name)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"{name} is unavailable (circuit open)")
+        kwargs.setdefault("timeout", self._timeouts.get(name, self._default_timeout))
+        session = self._session(name)
+        try:
+            if self._recorder is not None:
+                response = self._recorder.time_call("http", name, session.request, method, url, **kwargs)
+            else:
+                response = session.request(method, url, **kwargs)
+        except Exception as exc:
+            if breaker is not None:
+                breaker.record_failure(str(exc) or exc.__class__.__name__)
+            raise
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure(f"HTTP {response.status_code}")
+            else:
+                breaker.record_success()
+        return response
+
+    def breakers(self, *names: str) -> dict[str, dict[str, Any]]:
+        """Breaker status per upstream, limited to `names` when given"""
+        return {
+            name: breaker.status()
+            for name, breaker in self._breakers.items()
+            if not names or name in names
+        }
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable
+
+JOB_ACTIVE_STATES = ("queued", "running")
+JOB_TERMINAL_STATES = ("succeeded", "failed", "interrupted")
+
+
+class JobConflictError(RuntimeError):
+    """Raised by an exclusive submit while a job of the same kind is queued or running"""
+
+
+class Job:
+    __slots__ = (
+        "id", "kind", "title", "status", "progress", "message", "result", "error",
+        "created_at", "started_at", "finished_at", "fn",
+    )
+
+    def __init__(self, job_id: str, kind: str, title: str, created_at: float,
+                 fn: Callable[[Callable[..., None]], Any] | None = None):
+        self.id = job_id
+        self.kind = kind
+        self.title = title
+        self.status = "queued"
+        self.progress = 0
+        self.message = "Queued"
+        self.result: Any = None
+        self.error: str | None = None
+        self.created_at = created_at
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.fn = fn
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "fn"}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "Job":
+        job = cls(str(payload["id"]), str(payload["kind"]), str(payload.get("title") or ""), float(payload["created_at"]))
+        for name in ("status", "progress", "message", "result", "error", "started_at", "finished_at"):
+            if name in payload:
+                setattr(job, name, payload[name])
+        return job
+
+
+class JobQueue:
+    """
+    Background jobs for long-running admin operations:
+    - submit() queues fn(report) and returns the job right away; fn calls
+      report(progress, message) as it goes and its return value becomes the job result.
+    - At most `limits[kind]` jobs of one kind run at once (default 1); the rest wait in order.
+    - exclusive=True rejects a submit with JobConflictError while that kind is busy.
+    - Job state is written to `path` on every change. Jobs that were queued or running
+      when the process stopped load back as "interrupted".
+    - Only the newest `keep` finished jobs are retained.
+    """
+
+    def __init__(self, path: Path, *, limits: dict[str, int] | None = None, keep: int = 50,
+                 clock: Callable[[], float] | None = None,
+                 spawn: Callable[[Callable[[], None], str], None] | None = None):
+        self.path = Path(path)
+        self._limits = dict(limits or {})
+        self._keep = keep
+        self._clock = clock or time.time
+        self._spawn = spawn or (lambda fn, name: threading.Thread(target=fn, name=name, daemon=True).start())
+        self._cond = threading.Condition()
+        self._jobs: dict[str, Job] = {}
+        self._pending: dict[str, deque[Job]] = {}
+        self._running: dict[str, int] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        now = self._clock()
+        for payload in stored.get("jobs", []) if isinstance(stored, dict) else []:
+            try:
+                job = Job.from_dict(payload)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if job.status in JOB_ACTIVE_STATES:
+                job.status = "interrupted"
+                job.error = "The admin app restarted before this job finished."
+                job.finished_at = now
+            self._jobs[job.id] = job
+        self._prune()
+
+    def _save(self):
+        # Caller holds self._cond
+        payload = {"jobs": [job.as_dict() for job in self._jobs.values()]}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def _prune(self):
+        finished = [job for job in self._jobs.values() if job.status in JOB_TERMINAL_STATES]
+        finished.sort(key=lambda job: job.finished_at or job.created_at, reverse=True)
+        for job in finished[self._keep:]:
+            del self._jobs[job.id]
+
+    def _changed(self):
+        self._save()
+        self._cond.notify_all()
+
+    def limit(self, kind: str) -> int:
+        return max(1, self._limits.get(kind, 1))
+
+    def submit(self, kind: str, fn: Callable[[Callable[..., None]], Any], *, title: str = "",
+               exclusive: bool = False) -> dict[str, Any]:
+        with self._cond:
+            if exclusive and self._active(kind):
+                raise JobConflictError(f"A {title or kind} job is already in progress")
+            job = Job(secrets.token_hex(8), kind, title or kind, self._clock(), fn)
+            self._jobs[job.id] = job
+            self._pending.setdefault(kind, deque()).append(job)
+            self._dispatch(kind)
+            self._changed()
+            return job.as_dict()
+
+    def _active(self, kind: str) -> list[Job]:
+        return [job for job in self._jobs.values() if job.kind == kind and job.status in JOB_ACTIVE_STATES]
+
+    def _dispatch(self, kind: str):
+        # Caller holds self._cond
+        pending = self._pending.get(kind)
+        while pending and self._running.get(kind, 0) < self.limit(kind):
+            job = pending.popleft()
+            job.status = "running"
+            job.message = "Starting"
+            job.started_at = self._clock()
+            self._running[kind] = self._running.get(kind, 0) + 1
+            self._spawn(lambda job=job: self._run(job), f"job-{kind}")
+
+    def _report(self, job: Job, progress: float | None = None, message: str | None = None):
+        with self._cond:
+            if job.status != "running":
+                return
+            if progress is not None:
+                job.progress = max(0, min(100, int(progress)))
+            if message is not None:
+                job.message = message
+            self._changed()
+
+    def _run(self, job: Job):
+        try:
+            result = job.fn(lambda progress=None, message=None: self._report(job, progress, message))
+        except Exception as exc:
+            status, result, error = "failed", None, str(exc) or exc.__class__.__name__
+        else:
+            status, error = "succeeded", None
+        with self._cond:
+            job.status = status
+            job.result = result
+            job.error = error
+            job.finished_at = self._clock()
+            if status == "succeeded":
+                job.progress = 100
+                job.message = "Done"
+            else:
+                job.message = error
+            job.fn = None
+            self._running[job.kind] -= 1
+            self._dispatch(job.kind)
+            self._prune()
+            self._changed()
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return job.as_dict() if job else None
+
+    def jobs(self, kind: str | None = None) -> list[dict[str, Any]]:
+        """Jobs newest first, optionally filtered by kind"""
+        with self._cond:
+            selected = [job for job in self._jobs.values() if kind is None or job.kind == kind]
+            selected.sort(key=lambda job: job.created_at, reverse=True)
+            return [job.as_dict() for job in selected]
+
+    def latest(self, kind: str) -> dict[str, Any] | None:
+        jobs = self.jobs(kind)
+        return jobs[0] if jobs else None
+
+    def wait(self, job_id: str, timeout: float | None = None) -> dict[str, Any] | None:
+        """Block until the job finishes (or the timeout passes) and return its state"""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: job_id not in self._jobs or self._jobs[job_id].status in JOB_TERMINAL_STATES,
+                timeout,
+            )
+            job = self._jobs.get(job_id)
+            return job.as_dict() if job else None
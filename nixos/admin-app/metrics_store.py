@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"LNBXRING"
+# Version 2 keeps a sample count per metric; version 1 files are migrated on open
+FORMAT_VERSION = 2
+_SLOT_METRIC_FIELDS = {1: "fff", 2: "fffI"}
+HEADER_SIZE = 4096
+_HEADER_PREFIX = struct.Struct("<8sI")
+
+# name, bucket size in seconds, slot count
+DEFAULT_TIERS: tuple[tuple[str, int, int], ...] = (
+    ("raw", 30, 5760),    # 2 days of 30s samples
+    ("5m", 300, 4032),    # 14 days of 5 minute rollups
+    ("1h", 3600, 2160),   # 90 days of hourly rollups
+)
+
+
+def _nan_to_none(value: float) -> float | None:
+    return None if math.isnan(value) else round(value, 3)
+
+
+class MetricsStore:
+    """
+    Fixed-size, memory-mapped ring file holding min/avg/max rollups per metric:
+    - Every tier is a ring of slots addressed by (timestamp // resolution) % capacity, so
+      appends are O(1) and need no head pointer that could be lost on a crash.
+    - Each sample is merged into the current bucket of every tier, giving exact rollups.
+      Every metric counts its own samples, so one that is None for part of a bucket
+      averages only the samples it has.
+    - Opening a file written with a different metric list or an older format migrates
+      the overlapping metrics.
+    """
+
+    def __init__(self, path: Path, metrics: tuple[str, ...] | list[str], tiers: tuple[tuple[str, int, int], ...] = DEFAULT_TIERS,
+                 *, format_version: int = FORMAT_VERSION):
+        self.path = Path(path)
+        self.metrics = tuple(metrics)
+        self.tiers = tuple((name, int(resolution), int(capacity)) for name, resolution, capacity in tiers)
+        self.format_version = format_version
+        self._slot = struct.Struct("<qI" + _SLOT_METRIC_FIELDS[format_version] * len(self.metrics))
+        self._lock = threading.Lock()
+        self._offsets: dict[str, int] = {}
+        offset = HEADER_SIZE
+        for name, _, capacity in self.tiers:
+            self._offsets[name] = offset
+            offset += capacity * self._slot.size
+        self.size = offset
+        self._file = None
+        self._mm: mmap.mmap | None = None
+        self._open()
+
+    # ── File handling ──────────────────────────────────────────────
+
+    def _header_bytes(self) -> bytes:
+        layout = json.dumps(
+            {"metrics": list(self.metrics), "tiers": [list(tier) for tier in self.tiers]},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header = _HEADER_PREFIX.pack(MAGIC, self.format_version) + struct.pack("<I", len(layout)) + layout
+        if len(header) > HEADER_SIZE:
+            raise ValueError("Metrics store layout does not fit in the header")
+        return header.ljust(HEADER_SIZE, b"\0")
+
+    @staticmethod
+    def _read_layout(path: Path) -> dict[str, Any] | None:
+        try:
+            with open(path, "rb") as handle:
+                header = handle.read(HEADER_SIZE)
+            magic, version = _HEADER_PREFIX.unpack_from(header, 0)
+            if magic != MAGIC or version not in _SLOT_METRIC_FIELDS:
+                return None
+            (length,) = struct.unpack_from("<I", header, _HEADER_PREFIX.size)
+            start = _HEADER_PREFIX.size + 4
+            return {**json.loads(header[start:start + length].decode("utf-8")), "version": version}
+        except Exception:
+            return None
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        layout = self._read_layout(self.path) if self.path.exists() else None
+        expected = {
+            "metrics": list(self.metrics),
+            "tiers": [list(tier) for tier in self.tiers],
+            "version": self.format_version,
+        }
+        valid = layout == expected and self.path.stat().st_size == self.size
+        if not valid:
+            previous = None
+            if layout and [list(tier) for tier in self.tiers] == layout.get("tiers"):
+                previous = self.path.with_suffix(self.path.suffix + ".old")
+                os.replace(self.path, previous)
+            self._create()
+            if previous is not None:
+                self._migrate_from(previous, layout["metrics"], layout["version"])
+                previous.unlink(missing_ok=True)
+        self._file = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), self.size)
+
+    def _create(self):
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            handle.write(self._header_bytes())
+            handle.truncate(self.size)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.path)
+
+    def _migrate_from(self, old_path: Path, old_metrics: list[str], old_version: int):
+        old_store = MetricsStore(old_path, old_metrics, self.tiers, format_version=old_version)
+        new_store = MetricsStore(self.path, self.metrics, self.tiers, format_version=self.format_version)
+        try:
+            for name, _, capacity in self.tiers:
+                for index in range(capacity):
+                    record = old_store._read_slot(name, index)
+                    if record is None:
+                        continue
+                    bucket, count, values = record
+                    mapped = [values.get(metric, (math.nan, math.nan, math.nan, 0)) for metric in self.metrics]
+                    new_store._write_slot(name, index, bucket, count, mapped)
+        finally:
+            old_store.close()
+            new_store.close()
+
+    def close(self):
+        with self._lock:
+            if self._mm is not None:
+                self._mm.flush()
+                self._mm.close()
+                self._mm = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ── Slot access ────────────────────────────────────────────────
+
+    def _slot_offset(self, tier: str, index: int) -> int:
+        return self._offsets[tier] + index * self._slot.size
+
+    def _read_slot(self, tier: str, index: int) -> tuple[int, int, dict[str, tuple[float, float, float, int]]] | None:
+        """Return (bucket, samples, {metric: (min, avg, max, metric samples)}) or None if empty"""
+        fields = self._slot.unpack_from(self._mm, self._slot_offset(tier, index))
+        bucket, count = fields[0], fields[1]
+        if count == 0:
+            return None
+        width = len(_SLOT_METRIC_FIELDS[self.format_version])
+        values = {}
+        for i, metric in enumerate(self.metrics):
+            low, avg, high, *rest = fields[2 + i * width: 2 + (i + 1) * width]
+            # Version 1 kept one count per slot; it is the best estimate for each metric
+            samples = rest[0] if rest else (0 if math.isnan(avg) else count)
+            values[metric] = (low, avg, high, samples)
+        return bucket, count, values
+
+    def _write_slot(self, tier: str, index: int, bucket: int, count: int, values: list[tuple[float, float, float, int]]):
+        flat: list[float] = []
+        for low, avg, high, samples in values:
+            flat.extend((low, avg, high, samples) if self.format_version > 1 else (low, avg, high))
+        self._slot.pack_into(self._mm, self._slot_offset(tier, index), bucket, count, *flat)
+
+    # ── Public API ─────────────────────────────────────────────────
+
+    def append(self, timestamp: float, values: dict[str, float | int | None]):
+        """Merge one sample into the current bucket of every tier"""
+        ts = int(timestamp)
+        with self._lock:
+            if self._mm is None:
+                raise ValueError("Metrics store is closed")
+            for name, resolution, capacity in self.tiers:
+                bucket = ts - (ts % resolution)
+                index = (bucket // resolution) % capacity
+                existing = self._read_slot(name, index)
+                if existing is None or existing[0] != bucket:
+                    count = 0
+                    current = {metric: (math.nan, math.nan, math.nan, 0) for metric in self.metrics}
+                else:
+                    _, count, current = existing
+                count += 1
+                merged = []
+                for metric in self.metrics:
+                    low, avg, high, samples = current[metric]
+                    value = values.get(metric)
+                    if value is None:
+                        merged.append((low, avg, high, samples))
+                    elif samples == 0 or math.isnan(avg):
+                        merged.append((float(value), float(value), float(value), 1))
+                    else:
+                        samples += 1
+                        merged.append((
+                            min(low, value),
+                            avg + (value - avg) / samples,
+                            max(high, value),
+                            samples,
+                        ))
+                self._write_slot(name, index, bucket, count, merged)
+
+    def tier_for(self, start: float, end: float, resolution: str | None = None) -> tuple[str, int, int]:
+        """Pick the requested tier, or the finest tier whose retention covers start"""
+        if resolution:
+            for tier in self.tiers:
+                if tier[0] == resolution:
+                    return tier
+            raise ValueError(f"Unknown resolution: {resolution}")
+        for tier in self.tiers:
+            _, tier_resolution, capacity = tier
+            if end - start <= tier_resolution * capacity and (end - start) / tier_resolution <= 1440:
+                return tier
+        return self.tiers[-1]
+
+    def query(self, start: float, end: float, resolution: str | None = None) -> dict[str, Any]:
+        """Return columnar min/avg/max series for buckets within [start, end]"""
+        name, tier_resolution, capacity = self.tier_for(start, end, resolution)
+        end_bucket = int(end) - (int(end) % tier_resolution)
+        first_bucket = max(int(start) - (int(start) % tier_resolution), end_bucket - (capacity - 1) * tier_resolution)
+        timestamps: list[int] = []
+        series: dict[str, dict[str, list[float | None]]] = {
+            metric: {"min": [], "avg": [], "max": []} for metric in self.metrics
+        }
+        with self._lock:
+            if self._mm is None:
+                raise ValueError("Metrics store is closed")
+            for bucket in range(first_bucket, end_bucket + 1, tier_resolution):
+                record = self._read_slot(name, (bucket // tier_resolution) % capacity)
+                if record is None or record[0] != bucket:
+                    continue
+                timestamps.append(bucket)
+                for metric, (low, avg, high, _) in record[2].items():
+                    series[metric]["min"].append(_nan_to_none(low))
+                    series[metric]["avg"].append(_nan_to_none(avg))
+                    series[metric]["max"].append(_nan_to_none(high))
+        return {
+            "resolution": name,
+            "resolution_seconds": tier_resolution,
+            "timestamps": timestamps,
+            "metrics": series,
+        }
+
+    def retention(self) -> dict[str, int]:
+        return {name: resolution * capacity for name, resolution, capacity in self.tiers}
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import ipaddress
+import socket
+import struct
+import threading
+import time
+from typing import Any, Callable
+
+NETLINK_ROUTE = 0
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV6_IFADDR = 0x100
+
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_GETLINK = 18
+RTM_NEWADDR = 20
+RTM_DELADDR = 21
+RTM_GETADDR = 22
+
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+
+IFLA_IFNAME = 3
+IFLA_OPERSTATE = 16
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+
+IFF_UP = 0x1
+IFF_LOWER_UP = 0x10000
+
+OPERSTATES = ("unknown", "notpresent", "down", "lowerlayerdown", "testing", "dormant", "up")
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_IFINFOMSG = struct.Struct("=BxHiII")
+_IFADDRMSG = struct.Struct("=BBBBI")
+_RTATTR = struct.Struct("=HH")
+
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def parse_messages(data: bytes) -> list[tuple[int, bytes]]:
+    """Split a netlink datagram into (message type, payload) pairs"""
+    messages = []
+    offset = 0
+    while offset + _NLMSGHDR.size <= len(data):
+        length, msg_type, _, _, _ = _NLMSGHDR.unpack_from(data, offset)
+        if length < _NLMSGHDR.size:
+            break
+        messages.append((msg_type, data[offset + _NLMSGHDR.size:offset + length]))
+        offset += _align(length)
+    return messages
+
+
+def _attributes(payload: bytes, offset: int) -> dict[int, bytes]:
+    attrs = {}
+    while offset + _RTATTR.size <= len(payload):
+        length, attr_type = _RTATTR.unpack_from(payload, offset)
+        if length < _RTATTR.size:
+            break
+        attrs[attr_type] = payload[offset + _RTATTR.size:offset + length]
+        offset += _align(length)
+    return attrs
+
+
+def parse_link(payload: bytes) -> dict[str, Any]:
+    _, _, index, flags, _ = _IFINFOMSG.unpack_from(payload, 0)
+    attrs = _attributes(payload, _IFINFOMSG.size)
+    operstate = attrs.get(IFLA_OPERSTATE, b"\0")[0]
+    return {
+        "index": index,
+        "name": attrs.get(IFLA_IFNAME, b"").split(b"\0", 1)[0].decode("utf-8", "replace"),
+        "up": bool(flags & IFF_UP),
+        "carrier": bool(flags & IFF_LOWER_UP),
+        "operstate": OPERSTATES[operstate] if operstate < len(OPERSTATES) else "unknown",
+    }
+
+
+def parse_addr(payload: bytes) -> dict[str, Any]:
+    family, prefixlen, _, _, index = _IFADDRMSG.unpack_from(payload, 0)
+    attrs = _attributes(payload, _IFADDRMSG.size)
+    raw = attrs.get(IFA_LOCAL) or attrs.get(IFA_ADDRESS) or b""
+    address = str(ipaddress.ip_address(raw)) if len(raw) in (4, 16) else ""
+    return {"index": index, "family": "inet" if family == socket.AF_INET else "inet6", "address": address, "prefixlen": prefixlen}
+
+
+class NetworkState:
+    """
+    In-memory interface and address tables maintained from rtnetlink messages.
+    apply() returns the names of interfaces whose link or addresses changed.
+    sync() replaces both tables with a full dump, dropping anything the dump no longer has.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._links: dict[int, dict[str, Any]] = {}
+        self._addrs: dict[int, set[tuple[str, str, int]]] = {}
+        self.version = 0
+
+    def apply(self, msg_type: int, payload: bytes) -> set[str]:
+        changed: set[str] = set()
+        with self._lock:
+            if msg_type in (RTM_NEWLINK, RTM_DELLINK):
+                link = parse_link(payload)
+                previous = self._links.get(link["index"])
+                if msg_type == RTM_DELLINK:
+                    self._links.pop(link["index"], None)
+                    self._addrs.pop(link["index"], None)
+                    changed.add(link["name"])
+                elif previous != link:
+                    self._links[link["index"]] = link
+                    changed.add(link["name"])
+            elif msg_type in (RTM_NEWADDR, RTM_DELADDR):
+                addr = parse_addr(payload)
+                entry = (addr["family"], addr["address"], addr["prefixlen"])
+                addrs = self._addrs.setdefault(addr["index"], set())
+                if msg_type == RTM_NEWADDR and entry not in addrs:
+                    addrs.add(entry)
+                    changed.add(self._links.get(addr["index"], {}).get("name", str(addr["index"])))
+                elif msg_type == RTM_DELADDR and entry in addrs:
+                    addrs.discard(entry)
+                    changed.add(self._links.get(addr["index"], {}).get("name", str(addr["index"])))
+            if changed:
+                self.version += 1
+        return changed
+
+    def sync(self, messages: list[tuple[int, bytes]]) -> set[str]:
+        """Replace the tables with a link + address dump; returns interfaces that differ from before"""
+        fresh = NetworkState()
+        for msg_type, payload in messages:
+            fresh.apply(msg_type, payload)
+        after = fresh.interfaces()
+        with self._lock:
+            before = self._interfaces()
+            self._links, self._addrs = fresh._links, fresh._addrs
+            changed = {name for name in before.keys() | after.keys() if before.get(name) != after.get(name)}
+            if changed:
+                self.version += 1
+        return changed
+
+    def _interfaces(self) -> dict[str, dict[str, Any]]:
+        # Caller holds self._lock
+        result = {}
+        for index, link in self._links.items():
+            addrs = sorted(self._addrs.get(index, ()))
+            result[link["name"]] = {
+                **link,
+                "ipv4": [address for family, address, _ in addrs if family == "inet"],
+                "ipv6": [address for family, address, _ in addrs if family == "inet6"],
+            }
+        return result
+
+    def interfaces(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return self._interfaces()
+
+
+class NetlinkMonitor:
+    """
+    Background thread subscribed to rtnetlink link and address events:
+    - On every (re)connect the tables are rebuilt from a fresh link and address dump, so
+      changes missed while disconnected are reconciled; then events are applied as they arrive.
+    - on_change(names) is called after every batch that changed the tables.
+    - Socket errors reconnect with exponential backoff; `error` holds the last failure.
+    """
+
+    def __init__(self, state: NetworkState, on_change: Callable[[set[str]], None] | None = None):
+        self.state = state
+        self.on_change = on_change
+        self.error: str | None = None
+        self.connected = False
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="netlink-monitor", daemon=True)
+            self._thread.start()
+
+    def _open(self) -> socket.socket:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+        sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV6_IFADDR))
+        return sock
+
+    def _dump(self, sock: socket.socket, request_type: int, seq: int) -> list[tuple[int, bytes]]:
+        # rtgenmsg: family byte padded to 4
+        body = struct.pack("=Bxxx", socket.AF_UNSPEC)
+        sock.send(_NLMSGHDR.pack(_NLMSGHDR.size + len(body), request_type, NLM_F_REQUEST | NLM_F_DUMP, seq, 0) + body)
+        messages: list[tuple[int, bytes]] = []
+        while True:
+            for msg_type, payload in parse_messages(sock.recv(65536)):
+                if msg_type in (NLMSG_DONE, NLMSG_ERROR):
+                    return messages
+                messages.append((msg_type, payload))
+
+    def _resync(self, sock: socket.socket):
+        messages = self._dump(sock, RTM_GETLINK, 1) + self._dump(sock, RTM_GETADDR, 2)
+        self._notify(self.state.sync(messages))
+
+    def _notify(self, changed: set[str]):
+        if changed and self.on_change is not None:
+            try:
+                self.on_change(changed)
+            except Exception:
+                pass
+
+    def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                with self._open() as sock:
+                    self._resync(sock)
+                    self.connected = True
+                    self.error = None
+                    backoff = 1.0
+                    while True:
+                        changed: set[str] = set()
+                        for msg_type, payload in parse_messages(sock.recv(65536)):
+                            changed |= self.state.apply(msg_type, payload)
+                        self._notify(changed)
+            except Exception as exc:
+                self.connected = False
+                self.error = str(exc) or exc.__class__.__name__
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+
+class ReachabilityProbe:
+    """
+    Rate-limited internet reachability check using TCP connects (DNS port by default):
+    - check() returns the cached result until the next check is due, so it is cheap to call.
+    - While reachable, re-checks every `up_interval`; while unreachable, retries with
+      exponential backoff from `min_backoff` to `max_backoff`.
+    - reset() makes the next check due immediately (e.g. after a link change).
+    """
+
+    def __init__(self, targets: tuple[tuple[str, int], ...] = (("1.1.1.1", 53), ("9.9.9.9", 53)), *,
+                 timeout: float = 2.0, up_interval: float = 60.0, min_backoff: float = 5.0,
+                 max_backoff: float = 120.0, clock: Callable[[], float] | None = None,
+                 connect: Callable[..., Any] = socket.create_connection):
+        self._targets = targets
+        self._timeout = timeout
+        self._up_interval = up_interval
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock or time.monotonic
+        self._connect = connect
+        self._lock = threading.Lock()
+        self._backoff = min_backoff
+        self._next_due = 0.0
+        self._checking = False
+        self._result: dict[str, Any] = {"internet": False, "target": None, "latency_ms": None, "checked": False}
+
+    def reset(self):
+        with self._lock:
+            self._next_due = 0.0
+            self._backoff = self._min_backoff
+
+    def _attempt(self) -> dict[str, Any]:
+        for host, port in self._targets:
+            started = self._clock()
+            try:
+                self._connect((host, port), timeout=self._timeout).close()
+            except OSError:
+                continue
+            return {"internet": True, "target": f"{host}:{port}", "latency_ms": round((self._clock() - started) * 1000, 1), "checked": True}
+        return {"internet": False, "target": None, "latency_ms": None, "checked": True}
+
+    def check(self) -> dict[str, Any]:
+        with self._lock:
+            if self._checking or self._clock() < self._next_due:
+                return dict(self._result)
+            self._checking = True
+        try:
+            result = self._attempt()
+        finally:
+            with self._lock:
+                self._checking = False
+        with self._lock:
+            self._result = result
+            if result["internet"]:
+                self._backoff = self._min_backoff
+                self._next_due = self._clock() + self._up_interval
+            else:
+                self._next_due = self._clock() + self._backoff
+                self._backoff = min(self._backoff * 2, self._max_backoff)
+            return dict(self._result)
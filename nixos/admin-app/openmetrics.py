@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Any
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, Any] | None) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float | int | bool) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Histogram:
+    """
+    Cumulative latency histogram with one series per label set.
+    observe() is O(log buckets) and thread-safe; samples() snapshots every series.
+    """
+
+    def __init__(self, label_names: tuple[str, ...], buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, ...], list[Any]] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0, 0.0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    def samples(self) -> list[tuple[dict[str, str], list[int], int, float]]:
+        """(labels, cumulative bucket counts, count, sum) per series"""
+        with self._lock:
+            snapshot = [(labels, list(series[0]), series[1], series[2]) for labels, series in self._series.items()]
+        result = []
+        for labels, counts, count, total in sorted(snapshot):
+            cumulative, running = [], 0
+            for value in counts:
+                running += value
+                cumulative.append(running)
+            result.append((dict(zip(self.label_names, labels)), cumulative, count, total))
+        return result
+
+
+class MetricsWriter:
+    """Accumulate metric families and render them in OpenMetrics text format"""
+
+    def __init__(self, prefix: str = ""):
+        self._prefix = prefix
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> list[str]:
+        name = self._prefix + name
+        if name not in self._families:
+            self._families[name] = (kind, help_text, [])
+        return self._families[name][2]
+
+    def gauge(self, name: str, help_text: str, value: float | int | bool | None, labels: dict[str, Any] | None = None):
+        lines = self._family(name, "gauge", help_text)
+        if value is not None:
+            lines.append(f"{self._prefix}{name}{_labels(labels)} {_number(value)}")
+
+    def counter(self, name: str, help_text: str, value: float | int | None, labels: dict[str, Any] | None = None):
+        lines = self._family(name, "counter", help_text)
+        if value is not None:
+            lines.append(f"{self._prefix}{name}_total{_labels(labels)} {_number(value)}")
+
+    def histogram(self, name: str, help_text: str, histogram: Histogram):
+        lines = self._family(name, "histogram", help_text)
+        full_name = self._prefix + name
+        for labels, cumulative, count, total in histogram.samples():
+            for bound, bucket_count in zip(histogram.buckets, cumulative):
+                lines.append(f"{full_name}_bucket{_labels({**labels, 'le': _number(bound)})} {bucket_count}")
+            lines.append(f"{full_name}_bucket{_labels({**labels, 'le': '+Inf'})} {count}")
+            lines.append(f"{full_name}_count{_labels(labels)} {count}")
+            lines.append(f"{full_name}_sum{_labels(labels)} {_number(total)}")
+
+    def render(self) -> str:
+        out: list[str] = []
+        for name, (kind, help_text, lines) in self._families.items():
+            out.append(f"# TYPE {name} {kind}")
+            out.append(f"# HELP {name} {_escape(help_text)}")
+            out.extend(lines)
+        out.append("# EOF")
+        return "\n".join(out) + "\n"
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, Callable
+
+# Tools whose first positional argument names the operation (systemctl restart, ip addr, ...),
+# with the options that consume the following argument
+_SUBCOMMAND_TOOLS = {
+    "systemctl": set(),
+    "ip": set(),
+    "nmcli": set(),
+    "journalctl": {"-u", "-n", "-o", "-p"},
+    "wpa_cli": {"-p", "-i", "-g", "-G", "-P", "-a"},
+}
+
+
+def command_label(args: Any) -> str:
+    """Low-cardinality label for a subprocess command line"""
+    if isinstance(args, str):
+        args = args.split()
+    if not args:
+        return "unknown"
+    tool = os.path.basename(str(args[0]))
+    if tool in _SUBCOMMAND_TOOLS:
+        takes_value = _SUBCOMMAND_TOOLS[tool]
+        rest = iter(args[1:])
+        for arg in rest:
+            arg = str(arg)
+            if arg in takes_value:
+                next(rest, None)
+            elif not arg.startswith("-"):
+                return f"{tool} {arg}"
+    return tool
+
+
+class _Series:
+    __slots__ = ("count", "errors", "total", "max", "recent", "next")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = array("d", [0.0] * window)
+        self.next = 0
+
+
+class CallRecorder:
+    """
+    Counters and durations for routes, subprocesses and outbound HTTP calls:
+    - record(kind, name, seconds, error) keeps count, errors, total and max per (kind, name),
+      plus the last `window` durations for percentiles.
+    - time_call() wraps a callable and records it, counting raised exceptions as errors.
+    - begin()/end() bracket one request on the current thread and return the time spent per
+      kind inside it, for a Server-Timing header.
+    """
+
+    def __init__(self, window: int = 256):
+        self._window = window
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._local = threading.local()
+
+    def record(self, kind: str, name: str, seconds: float, error: bool = False):
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = self._series[(kind, name)] = _Series(self._window)
+            series.count += 1
+            series.errors += int(error)
+            series.total += seconds
+            series.max = max(series.max, seconds)
+            series.recent[series.next] = seconds
+            series.next = (series.next + 1) % self._window
+        spans = getattr(self._local, "spans", None)
+        if spans is not None and kind != "route":
+            total, calls = spans.get(kind, (0.0, 0))
+            spans[kind] = (total + seconds, calls + 1)
+
+    def time_call(self, kind: str, name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record(kind, name, time.perf_counter() - started, error=True)
+            raise
+        self.record(kind, name, time.perf_counter() - started)
+        return result
+
+    def begin(self):
+        self._local.spans = {}
+
+    def end(self) -> dict[str, tuple[float, int]]:
+        spans = getattr(self._local, "spans", None) or {}
+        self._local.spans = None
+        return spans
+
+    def summary(self) -> dict[str, list[dict[str, Any]]]:
+        """Per-kind rows sorted by total time spent, slowest first"""
+        with self._lock:
+            snapshot = [
+                (kind, name, series.count, series.errors, series.total, series.max,
+                 sorted(series.recent[:min(series.count, self._window)]))
+                for (kind, name), series in self._series.items()
+            ]
+        result: dict[str, list[dict[str, Any]]] = {}
+        for kind, name, count, errors, total, longest, recent in sorted(snapshot, key=lambda row: -row[4]):
+
+            def percentile(fraction: float) -> float | None:
+                if not recent:
+                    return None
+                return round(recent[min(len(recent) - 1, int(fraction * len(recent)))] * 1000, 1)
+
+            result.setdefault(kind, []).append({
+                "name": name,
+                "count": count,
+                "errors": errors,
+                "total_ms": round(total * 1000, 1),
+                "avg_ms": round(total / count * 1000, 1) if count else None,
+                "p50_ms": percentile(0.5),
+                "p95_ms": percentile(0.95),
+                "max_ms": round(longest * 1000, 1),
+            })
+        return result
+
+
+class LatencyWindow:
+    """Response times seen over the last `window` seconds, summarized as p50/p95/max"""
+
+    def __init__(self, window: float = 300.0, clock: Callable[[], float] | None = None):
+        self._window = window
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def add(self, milliseconds: float):
+        with self._lock:
+            self._samples.append((self._clock(), milliseconds))
+            self._trim()
+
+    def _trim(self):
+        cutoff = self._clock() - self._window
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            self._trim()
+            values = sorted(ms for _, ms in self._samples)
+        if not values:
+            return {"count": 0, "p50_ms": None, "p95_ms": None, "max_ms": None}
+        return {
+            "count": len(values),
+            "p50_ms": round(values[min(len(values) - 1, int(0.5 * len(values)))], 1),
+            "p95_ms": round(values[min(len(values) - 1, int(0.95 * len(values)))], 1),
+            "max_ms": round(values[-1], 1),
+        }
+
+
+def health_state(code: int | None, p95_ms: float | None, *, slow_ms: float, unit_active: bool = False,
+                 timed_out: bool = False, breaker_open: bool = False, previous: str | None = None) -> str:
+    """
+    Classify one HTTP health probe of a local service:
+    - An answer: 502/503 is "starting", other non-200 "error", a p95 above `slow_ms`
+      "slow", otherwise "running".
+    - No answer while the unit is inactive: "stopped".
+    - No answer while the unit is active: a timeout is "slow"; an open circuit breaker keeps
+      the state that tripped it ("starting", "slow" or "error"), defaulting to "slow".
+    """
+    if code is None:
+        if not unit_active:
+            return "stopped"
+        if breaker_open and previous in ("starting", "slow", "error"):
+            return previous
+        if timed_out or breaker_open:
+            return "slow"
+        return "stopped"
+    if code in (502, 503):
+        return "starting"
+    if code != 200:
+        return "error"
+    if p95_ms is not None and p95_ms > slow_ms:
+        return "slow"
+    return "running"
+
+
+def server_timing_header(total_seconds: float, spans: dict[str, tuple[float, int]]) -> str:
+    parts = [f"app;dur={total_seconds * 1000:.1f}"]
+    for kind, (seconds, calls) in sorted(spans.items()):
+        parts.append(f'{kind};dur={seconds * 1000:.1f};desc="{calls} call{"s" if calls != 1 else ""}"')
+    return ", ".join(parts)
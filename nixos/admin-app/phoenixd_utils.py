@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Channel states phoenixd reports for a usable channel
+ACTIVE_CHANNEL_STATES = {"normal"}
+
+
+def _int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def sats_from(data: dict[str, Any], sat_keys: tuple[str, ...], msat_keys: tuple[str, ...] = ()) -> int | None:
+    """First integer found under sat_keys, else under msat_keys converted to sats"""
+    for key in sat_keys:
+        value = _int(data.get(key))
+        if value is not None:
+            return value
+    for key in msat_keys:
+        value = _int(data.get(key))
+        if value is not None:
+            return value // 1000
+    return None
+
+
+def normalize_balance(data: Any) -> dict[str, Any] | None:
+    """getbalance response -> {"balance", "fee_credit", "raw"} in sats"""
+    if not isinstance(data, dict):
+        return None
+    return {
+        "balance": sats_from(data, ("balanceSat", "balance", "balance_sats")),
+        "fee_credit": sats_from(data, ("feeCreditSat", "feeCredit", "fee_credit_sat")),
+        "raw": data,
+    }
+
+
+def normalize_channel(raw: dict[str, Any]) -> dict[str, Any]:
+    """One channel from listchannels/getinfo with sat amounts under stable keys"""
+    state = str(raw.get("state") or raw.get("status") or "unknown")
+    capacity = sats_from(raw, ("capacitySat", "capacity"), ("capacityMsat",))
+    outbound = sats_from(raw, ("balanceSat",), ("toLocal", "toLocalMsat", "balanceMsat"))
+    inbound = sats_from(raw, ("inboundLiquiditySat",), ("toRemote", "toRemoteMsat"))
+    if inbound is None and capacity is not None and outbound is not None:
+        inbound = max(capacity - outbound, 0)
+    return {
+        "id": str(raw.get("channelId") or raw.get("id") or raw.get("txId") or raw.get("fundingTxId") or "channel"),
+        "state": state,
+        "active": state.lower() in ACTIVE_CHANNEL_STATES,
+        "capacity_sat": capacity,
+        "outbound_sat": outbound,
+        "inbound_sat": inbound,
+    }
+
+
+def _channel_list(data: Any) -> list[dict[str, Any]] | None:
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get("channels"), list):
+        return data["channels"]
+    return None
+
+
+def normalize_channels(listchannels: Any, getinfo: Any = None) -> list[dict[str, Any]]:
+    """Channels from listchannels, falling back to the list embedded in getinfo"""
+    channels = _channel_list(listchannels)
+    if channels is None:
+        channels = _channel_list(getinfo) or []
+    return [normalize_channel(channel) for channel in channels if isinstance(channel, dict)]
+
+
+def liquidity_summary(channels: list[dict[str, Any]]) -> dict[str, int]:
+    """Outbound/inbound totals over active channels"""
+    active = [channel for channel in channels if channel["active"]]
+    return {
+        "active_channels": len(active),
+        "outbound_sat": sum(channel["outbound_sat"] or 0 for channel in active),
+        "inbound_sat": sum(channel["inbound_sat"] or 0 for channel in active),
+        "capacity_sat": sum(channel["capacity_sat"] or 0 for channel in active),
+    }
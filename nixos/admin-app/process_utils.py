@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except (OSError, ValueError):
+        return None
+
+
+def read_cgroup_cpu_seconds(cgroup_dir: Path) -> float | None:
+    """Total CPU time of every task in a cgroup v2 group, from cpu.stat usage_usec"""
+    text = _read_text(cgroup_dir / "cpu.stat")
+    if not text:
+        return None
+    for line in text.splitlines():
+        key, _, value = line.partition(" ")
+        if key == "usage_usec":
+            try:
+                return int(value) / 1_000_000
+            except ValueError:
+                return None
+    return None
+
+
+def read_proc_cpu_seconds(proc_dir: Path, clock_ticks: int) -> float | None:
+    """utime + stime of one process from /proc/<pid>/stat"""
+    text = _read_text(proc_dir / "stat")
+    if not text:
+        return None
+    # Fields after the ")" closing comm start at field 3 (state); utime/stime are fields 14/15
+    fields = text.rpartition(")")[2].split()
+    try:
+        return (int(fields[11]) + int(fields[12])) / clock_ticks
+    except (IndexError, ValueError):
+        return None
+
+
+def read_proc_status(proc_dir: Path) -> dict[str, int | None]:
+    """RSS (bytes) and thread count from /proc/<pid>/status"""
+    rss = threads = None
+    for line in (_read_text(proc_dir / "status") or "").splitlines():
+        key, _, value = line.partition(":")
+        parts = value.split()
+        if key == "VmRSS" and parts:
+            rss = int(parts[0]) * 1024
+        elif key == "Threads" and parts:
+            threads = int(parts[0])
+    return {"rss": rss, "threads": threads}
+
+
+def count_open_fds(proc_dir: Path) -> int | None:
+    try:
+        return len(os.listdir(proc_dir / "fd"))
+    except OSError:
+        return None
+
+
+class ProcessSampler:
+    """
+    Per-service CPU, RSS, open file descriptor and thread accounting:
+    - CPU% is the delta of cgroup cpu.stat usage (falling back to the main PID's
+      /proc/<pid>/stat) between samples, as a share of all cores like psutil.cpu_percent().
+    - RSS, FDs and threads are read for the unit's MainPID.
+    - The first sample of a unit (or after its main PID changes) reports CPU% as None.
+    """
+
+    def __init__(self, *, proc_root: str | Path = "/proc", cgroup_root: str | Path = "/sys/fs/cgroup",
+                 clock: Callable[[], float] | None = None, cpu_count: int | None = None,
+                 clock_ticks: int | None = None):
+        self._proc_root = Path(proc_root)
+        self._cgroup_root = Path(cgroup_root)
+        self._clock = clock or time.monotonic
+        self._cpu_count = cpu_count or os.cpu_count() or 1
+        self._clock_ticks = clock_ticks or os.sysconf("SC_CLK_TCK")
+        self._lock = threading.Lock()
+        self._previous: dict[str, tuple[str, int | None, float, float]] = {}
+
+    def _cpu_seconds(self, pid: int | None, control_group: str | None) -> tuple[str, float | None]:
+        if control_group:
+            seconds = read_cgroup_cpu_seconds(self._cgroup_root / control_group.lstrip("/"))
+            if seconds is not None:
+                return "cgroup", seconds
+        if pid:
+            seconds = read_proc_cpu_seconds(self._proc_root / str(pid), self._clock_ticks)
+            if seconds is not None:
+                return "proc", seconds
+        return "none", None
+
+    def sample_unit(self, name: str, pid: int | None, control_group: str | None = None) -> dict[str, Any]:
+        now = self._clock()
+        source, cpu_seconds = self._cpu_seconds(pid, control_group)
+        cpu_percent = None
+        with self._lock:
+            previous = self._previous.get(name)
+            if cpu_seconds is None:
+                self._previous.pop(name, None)
+            else:
+                self._previous[name] = (source, pid, now, cpu_seconds)
+        if previous and cpu_seconds is not None:
+            prev_source, prev_pid, prev_time, prev_seconds = previous
+            same_process = prev_source == source and (source == "cgroup" or prev_pid == pid)
+            elapsed = now - prev_time
+            if same_process and elapsed > 0 and cpu_seconds >= prev_seconds:
+                cpu_percent = round((cpu_seconds - prev_seconds) / elapsed / self._cpu_count * 100, 1)
+
+        proc_dir = self._proc_root / str(pid) if pid else None
+        status = read_proc_status(proc_dir) if proc_dir else {"rss": None, "threads": None}
+        return {
+            "pid": pid,
+            "cpu_percent": cpu_percent,
+            "rss": status["rss"],
+            "fds": count_open_fds(proc_dir) if proc_dir else None,
+            "threads": status["threads"],
+            "source": source,
+        }
+
+    def sample(self, units: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Sample every unit from a name -> {"main_pid", "control_group"} mapping"""
+        return {
+            name: self.sample_unit(name, unit.get("main_pid"), unit.get("control_group"))
+            for name, unit in units.items()
+        }
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+
+class WaitressRunner:
+    """
+    Drives a waitress server's event loop so a shutdown flushes in-flight responses:
+    - run() polls the loop until stop() is called (from a signal handler).
+    - drain(timeout) closes the listening socket, calls `on_drain`, then keeps the loop
+      running, closing idle keep-alive channels once their output is written, until no
+      channels remain or `timeout` expires. The task dispatcher is shut down last.
+    - Both use waitress internals (server._map, server.adj, active_channels,
+      channel.requests, channel.close_when_flushed). When one is missing, run() falls back
+      to server.run() and drain() to a plain server.close(), so a waitress upgrade loses the
+      graceful drain instead of breaking shutdown.
+    """
+
+    def __init__(self, server: Any, *, loop: Callable[..., Any] | None = None,
+                 clock: Callable[[], float] | None = None, poll_interval: float = 0.1):
+        self.server = server
+        self._loop = loop
+        self._clock = clock or time.monotonic
+        self._poll_interval = poll_interval
+        self._stopping = threading.Event()
+
+    @property
+    def supported(self) -> bool:
+        adj = getattr(self.server, "adj", None)
+        return (
+            isinstance(getattr(self.server, "_map", None), dict)
+            and isinstance(getattr(self.server, "active_channels", None), dict)
+            and hasattr(adj, "asyncore_loop_timeout")
+            and hasattr(adj, "asyncore_use_poll")
+        )
+
+    def _event_loop(self) -> Callable[..., Any]:
+        if self._loop is None:
+            from waitress import wasyncore
+
+            self._loop = wasyncore.loop
+        return self._loop
+
+    def _poll(self, timeout: float):
+        self._event_loop()(
+            timeout=timeout, map=self.server._map, use_poll=self.server.adj.asyncore_use_poll, count=1,
+        )
+
+    def run(self):
+        if not self.supported:
+            try:
+                self.server.run()
+            except KeyboardInterrupt:
+                pass
+            return
+        while not self._stopping.is_set():
+            self._poll(self.server.adj.asyncore_loop_timeout)
+
+    def stop(self):
+        self._stopping.set()
+        if not self.supported:
+            # Interrupts server.run() on the fallback path
+            raise KeyboardInterrupt
+
+    def drain(self, timeout: float, on_drain: Callable[[], Any] | None = None) -> bool:
+        """Shut the server down; returns False if it had to close without draining"""
+        deadline = self._clock() + timeout
+        graceful = self.supported
+        if graceful:
+            try:
+                self.server.accepting = False
+                self.server.del_channel()
+                self.server.socket.close()
+            except Exception:
+                graceful = False
+        if on_drain is not None:
+            on_drain()
+        if graceful:
+            try:
+                self._flush(deadline)
+            except Exception:
+                graceful = False
+        self.server.close()
+        shutdown = getattr(getattr(self.server, "task_dispatcher", None), "shutdown", None)
+        if shutdown is not None:
+            try:
+                shutdown(timeout=max(0.0, deadline - self._clock()))
+            except TypeError:
+                shutdown()
+        return graceful
+
+    def _flush(self, deadline: float):
+        channels = self.server.active_channels
+        while channels and self._clock() < deadline:
+            for channel in list(channels.values()):
+                # A channel without the attributes is treated as busy and left to finish
+                if not getattr(channel, "requests", True) and hasattr(channel, "close_when_flushed"):
+                    channel.close_when_flushed = True
+            self._poll(self._poll_interval)
@@ -26,11 +26,19 @@
     if (event.key === 'Escape') closeSidebar();
   });
 
-  if (updateLinks.length) {
-    fetch('/box/api/update/check')
-      .then(function (resp) {
-        if (!resp.ok) return null;
-        return resp.json();
+  function checkForUpdate() {
+    // Page scripts load after the shell; share their bootstrap request when there is one
+    const dashboard = window.LNbitsBoxDashboard;
+    const fromBootstrap = dashboard && dashboard.bootstrapSection
+      ? dashboard.bootstrapSection('update_check')
+      : Promise.resolve(null);
+    fromBootstrap
+      .then(function (data) {
+        if (data) return data;
+        return fetch('/box/api/update/check').then(function (resp) {
+          if (!resp.ok) return null;
+          return resp.json();
+        });
       })
       .then(function (data) {
         if (!data || !data.update_available) return;
@@ -40,4 +48,12 @@
       })
       .catch(function () {});
   }
+
+  if (updateLinks.length) {
+    if (document.readyState === 'loading') {
+      document.addEventListener('DOMContentLoaded', checkForUpdate);
+    } else {
+      checkForUpdate();
+    }
+  }
 })();
@@ -98,7 +98,7 @@
       resetFlow();
       D.showNotice(data.message || 'Ark seed phrase updated. Arkade is restarting automatically.', 'Success');
       if (typeof D.fetchStats === 'function') {
-        setTimeout(D.fetchStats, 1200);
+        setTimeout(function () { D.fetchStats({ refresh: true }); }, 1200);
       }
     } catch (error) {
       closeModal('arkade-seed-backup-modal');
@@ -42,6 +42,51 @@
         if (modal) modal.classList.remove('hidden');
     };
 
+    // Polls /box/api/jobs/<id> until the job finishes; onProgress gets every update
+    D.waitForJob = async function (jobId, onProgress) {
+        for (;;) {
+            const resp = await fetch('/box/api/jobs/' + encodeURIComponent(jobId));
+            const data = await resp.json();
+            if (!resp.ok) throw new Error(data.message || 'Job status unavailable');
+            const job = data.job || data.data?.job;
+            if (onProgress) onProgress(job);
+            if (['succeeded', 'failed', 'interrupted'].indexOf(job.status) !== -1) return job;
+            await new Promise(function (resolve) { setTimeout(resolve, 1000); });
+        }
+    };
+
+    // First render data for every card in one /box/api/bootstrap request. Scripts ask for
+    // their section while the page loads; the request goes out once the document is parsed.
+    // Resolves to the section's payload, or null (failed, timed out on the server, asked for
+    // too late) so the caller falls back to its own endpoint.
+    D.bootstrapSection = function (name) {
+        let boot = D.state.bootstrap;
+        if (!boot) {
+            boot = D.state.bootstrap = { sections: [], sent: false };
+            boot.ready = new Promise(function (resolve) {
+                function send() {
+                    boot.sent = true;
+                    fetch('/box/api/bootstrap?sections=' + encodeURIComponent(boot.sections.join(',')))
+                        .then(function (resp) { return resp.ok ? resp.json() : null; })
+                        .then(function (data) { resolve((data && (data.sections || data.data?.sections)) || {}); })
+                        .catch(function () { resolve({}); });
+                }
+                function sendSoon() { setTimeout(send, 0); }
+                if (document.readyState === 'loading') {
+                    document.addEventListener('DOMContentLoaded', sendSoon);
+                } else {
+                    sendSoon();
+                }
+            });
+        }
+        if (boot.sent) return Promise.resolve(null);
+        if (boot.sections.indexOf(name) === -1) boot.sections.push(name);
+        return boot.ready.then(function (sections) {
+            const section = sections[name];
+            return section && section.status === 'ok' ? section.data : null;
+        });
+    };
+
     D.closeNoticeModal = function () {
         const modal = D.el('notice-modal');
         if (modal) modal.classList.add('hidden');
@@ -128,7 +173,7 @@
             const data = await resp.json();
             if (data.status === 'ok') {
                 if (typeof D.fetchStats === 'function') {
-                    setTimeout(D.fetchStats, 1200);
+                    setTimeout(function () { D.fetchStats({ refresh: true }); }, 1200);
                 }
                 if (action.startsWith('tunnel/') && typeof D.fetchTunnelStatus === 'function') {
                     setTimeout(D.fetchTunnelStatus, 1200);
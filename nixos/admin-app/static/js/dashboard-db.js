@@ -228,13 +228,17 @@
         });
     };
 
-    D.fetchRecoveryStatus = async function () {
+    D.fetchRecoveryStatus = async function (options) {
+        options = options || {};
         if (!hasRecoveryUi()) return;
         try {
-            const resp = await fetch('/box/api/recovery/status');
-            if (!resp.ok) return;
-            const payload = await resp.json();
-            const data = payload.data || payload;
+            let data = options.payload;
+            if (!data) {
+                const resp = await fetch('/box/api/recovery/status');
+                if (!resp.ok) return;
+                const payload = await resp.json();
+                data = payload.data || payload;
+            }
             const lastBackup = data.last_backup || null;
             const lastValidation = data.last_validation || null;
             const schedule = data.schedule || {};
@@ -259,39 +263,46 @@
         }
     };
 
-    D.downloadRecoveryBackup = function () {
+    function jobProgressText(prefix) {
+        return function (job) {
+            if (job.status === 'running') D.setRecoveryBusy(true, prefix + ' ' + job.progress + '% - ' + job.message);
+        };
+    }
+
+    D.downloadRecoveryBackup = async function () {
         const passphrase = el('recovery-passphrase')?.value || '';
         if (!passphrase) {
             D.showNotice('Enter a backup password first.', 'Validation');
             return;
         }
         D.setRecoveryBusy(true, 'Preparing encrypted backup for download...');
-        const iframe = document.createElement('iframe');
-        iframe.style.display = 'none';
-        document.body.appendChild(iframe);
-        const form = document.createElement('form');
-        form.method = 'POST';
-        form.action = '/box/api/recovery/backup/download';
-        form.target = 'recovery-download-frame-' + Date.now();
-        iframe.name = form.target;
-        [
-            ['csrf_token', document.querySelector('meta[name="csrf-token"]')?.content || ''],
-            ['passphrase', passphrase],
-        ].forEach(function (pair) {
-            const input = document.createElement('input');
-            input.type = 'hidden';
-            input.name = pair[0];
-            input.value = pair[1];
-            form.appendChild(input);
-        });
-        document.body.appendChild(form);
-        form.submit();
-        setTimeout(function () {
-            D.setRecoveryBusy(false);
-            form.remove();
-            setTimeout(function () { iframe.remove(); }, 5000);
+        try {
+            const resp = await fetch('/box/api/recovery/backup/download', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ passphrase: passphrase }),
+            });
+            const data = await resp.json();
+            if (!resp.ok || data.status !== 'ok') {
+                D.showNotice(data.message || 'Backup download failed.', 'Error');
+                return;
+            }
+            const job = await D.waitForJob(data.job_id, jobProgressText('Preparing encrypted backup...'));
+            if (job.status !== 'succeeded') {
+                D.showNotice(job.error || 'Backup download failed.', 'Error');
+                return;
+            }
+            const iframe = document.createElement('iframe');
+            iframe.style.display = 'none';
+            iframe.src = '/box/api/recovery/backup/download/' + encodeURIComponent(job.id);
+            document.body.appendChild(iframe);
+            setTimeout(function () { iframe.remove(); }, 60000);
             D.fetchRecoveryStatus();
-        }, 4000);
+        } catch (error) {
+            D.showNotice('Backup download failed: ' + error.message, 'Error');
+        } finally {
+            D.setRecoveryBusy(false);
+        }
     };
 
     D.saveRecoveryBackup = async function () {
@@ -310,12 +321,17 @@
                 }),
             });
             const data = await resp.json();
-            if (resp.ok && data.status === 'ok') {
-                D.showNotice(data.message, 'Backup Saved');
+            if (!resp.ok || data.status !== 'ok') {
+                D.showNotice(data.message || 'Backup save failed.', 'Error');
+                return;
+            }
+            const job = await D.waitForJob(data.job_id, jobProgressText('Saving encrypted backup...'));
+            if (job.status === 'succeeded') {
+                D.showNotice(job.result.message, 'Backup Saved');
                 D.fetchRecoveryStatus();
                 D.fetchSavedBackups();
             } else {
-                D.showNotice(data.message || 'Backup save failed.', 'Error');
+                D.showNotice(job.error || 'Backup save failed.', 'Error');
             }
         } catch (error) {
             D.showNotice('Backup save failed: ' + error.message, 'Error');
@@ -470,15 +486,20 @@
         try {
             const resp = await fetch('/box/api/recovery/restore', { method: 'POST', body: formData });
             const data = await resp.json();
+            const job = resp.ok && data.status === 'ok'
+                ? await D.waitForJob(data.job_id, function (update) {
+                    if (update.status === 'running') D.setText('restore-progress-text', update.message + '...');
+                })
+                : null;
             D.showRestoreView('restore-result');
             const icon = el('restore-result-icon');
             const text = el('restore-result-text');
             const details = el('restore-result-details');
-            if (resp.ok && data.status === 'ok') {
+            if (job && job.status === 'succeeded') {
                 icon.className = 'w-8 h-8 rounded-full mb-3 bg-emerald-400';
-                text.textContent = data.message;
+                text.textContent = job.result.message;
                 text.className = 'font-mono text-sm mb-1 text-emerald-400';
-                const report = data.report || data.data?.report || {};
+                const report = job.result.report || {};
                 const lines = [];
                 (report.checks || []).forEach(function (check) {
                     lines.push((check.ok ? 'OK' : 'WARN') + '  ' + (check.label || check.component));
@@ -488,9 +509,9 @@
                 D.fetchRecoveryStatus();
             } else {
                 icon.className = 'w-8 h-8 rounded-full mb-3 bg-red-400';
-                text.textContent = data.message || 'Restore failed';
+                text.textContent = (job ? job.error : data.message) || 'Restore failed';
                 text.className = 'font-mono text-sm mb-1 text-red-400';
-                details.textContent = (data.report?.compatibility?.message || '');
+                details.textContent = '';
             }
         } catch (error) {
             D.showRestoreView('restore-result');
@@ -541,7 +562,9 @@
         document.querySelectorAll('input[name="restore-source"]').forEach(function (input) {
             input.addEventListener('change', D.updateRestoreSourceUi);
         });
-        D.fetchRecoveryStatus();
-        D.fetchSavedBackups();
+        // The status payload carries the saved backups too
+        D.bootstrapSection('recovery').then(function (payload) {
+            D.fetchRecoveryStatus(payload ? { payload: payload } : undefined);
+        });
     }
 })();
@@ -55,7 +55,12 @@
         body: JSON.stringify({ acknowledged: true })
       });
       const data = await resp.json();
-      if (data.status === 'ok') {
+      const job = data.status === 'ok' ? await D.waitForJob(data.job_id) : null;
+      if (job && job.status !== 'succeeded') {
+        D.showNotice(job.error || 'Factory reset failed.', 'Error');
+        return;
+      }
+      if (job) {
         D.closeFactoryResetModals();
         D.showNotice(data.message, 'Factory Reset Started');
         const delay = data.data?.delay_ms || 3000;
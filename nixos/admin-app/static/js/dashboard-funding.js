@@ -16,19 +16,67 @@
             return;
         }
         list.innerHTML = channels.map(function (channel) {
-            const state = channel.state || channel.status || 'unknown';
-            const local = channel.toLocal || channel.toLocalMsat || channel.balanceMsat || null;
-            const remote = channel.toRemote || channel.toRemoteMsat || null;
-            const id = channel.channelId || channel.id || channel.txId || 'channel';
             return '<div class="px-3 py-3 grid grid-cols-1 md:grid-cols-4 gap-2 text-xs font-mono">' +
-                '<div class="text-ln-text break-all md:col-span-2">' + D.escapeHtml(id) + '</div>' +
-                '<div class="text-ln-muted">state: <span class="text-ln-text">' + D.escapeHtml(state) + '</span></div>' +
-                '<div class="text-ln-muted">local: <span class="text-ln-text">' + fmt(local !== null ? Math.floor(Number(local) / 1000) : null) + '</span> sats</div>' +
-                (remote !== null ? '<div class="text-ln-muted md:col-start-4">remote: <span class="text-ln-text">' + fmt(Math.floor(Number(remote) / 1000)) + '</span> sats</div>' : '') +
+                '<div class="text-ln-text break-all md:col-span-2">' + D.escapeHtml(channel.id || 'channel') + '</div>' +
+                '<div class="text-ln-muted">state: <span class="text-ln-text">' + D.escapeHtml(channel.state || 'unknown') + '</span></div>' +
+                '<div class="text-ln-muted">local: <span class="text-ln-text">' + fmt(channel.outbound_sat) + '</span> sats</div>' +
+                (channel.inbound_sat !== null && channel.inbound_sat !== undefined ? '<div class="text-ln-muted md:col-start-4">remote: <span class="text-ln-text">' + fmt(channel.inbound_sat) + '</span> sats</div>' : '') +
                 '</div>';
         }).join('');
     }
 
+    let liquidityChart = null;
+
+    function renderLiquidityHistory(history) {
+        const canvas = D.el('phoenixd-liquidity-chart');
+        if (!canvas || typeof Chart === 'undefined' || !history) return;
+        const labels = (history.timestamps || []).map(function (timestamp) {
+            const date = new Date(timestamp);
+            return date.toLocaleDateString([], { month: 'short', day: 'numeric' }) + ' ' +
+                date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+        });
+        const datasets = [
+            { label: 'Outbound', data: history.outbound || [], borderColor: '#FF1EE6', backgroundColor: 'rgba(255,30,230,0.08)', fill: true },
+            { label: 'Inbound', data: history.inbound || [], borderColor: '#22d3ee', backgroundColor: 'rgba(34,211,238,0.08)', fill: true },
+        ];
+        if (liquidityChart) {
+            liquidityChart.data.labels = labels;
+            liquidityChart.data.datasets.forEach(function (dataset, index) { dataset.data = datasets[index].data; });
+            liquidityChart.update('none');
+            return;
+        }
+        liquidityChart = new Chart(canvas, {
+            type: 'line',
+            data: { labels: labels, datasets: datasets },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                animation: false,
+                spanGaps: true,
+                interaction: { mode: 'index', intersect: false },
+                elements: { point: { radius: 0, hitRadius: 20 }, line: { tension: 0.3, borderWidth: 2 } },
+                plugins: {
+                    legend: { display: true, labels: { color: 'rgb(' + D.theme.muted + ')', font: { family: 'JetBrains Mono', size: 10 } } },
+                    tooltip: { callbacks: { label: function (ctx) { return ctx.dataset.label + ': ' + fmt(ctx.parsed.y) + ' sats'; } } },
+                },
+                scales: {
+                    x: { grid: { display: false }, ticks: { color: 'rgb(' + D.theme.muted + ')', font: { family: 'JetBrains Mono', size: 9 }, maxTicksLimit: 6 } },
+                    y: { beginAtZero: true, grid: { color: 'rgba(' + D.theme.border + ',0.5)' }, ticks: { color: 'rgb(' + D.theme.muted + ')', font: { family: 'JetBrains Mono', size: 10 } } },
+                },
+            },
+        });
+    }
+
+    D.fetchLiquidityHistory = async function () {
+        if (!D.el('phoenixd-liquidity-chart')) return;
+        try {
+            const resp = await fetch('/box/api/funding-sources/phoenixd/history?range=7d');
+            if (!resp.ok) return;
+            const payload = await resp.json();
+            renderLiquidityHistory(payload.data || payload);
+        } catch (error) {}
+    };
+
     function sourceSummary(source) {
         if (source === 'phoenixd') return 'Phoenixd is selected. LNbits uses the local Phoenixd API on port 9740.';
         if (source === 'ark') return 'Ark is selected. LNbits uses the local Arkade sidecar API on port 8765.';
@@ -60,7 +108,15 @@
         D.setText('phoenixd-balance', fmt(balance.balance));
         D.setText('phoenixd-fee-credit', fmt(balance.fee_credit));
         D.setText('phoenixd-channel-count', fmt(phoenixd.channel_count));
+        const liquidity = phoenixd.liquidity || {};
+        D.setText('phoenixd-outbound', fmt(liquidity.outbound_sat));
+        D.setText('phoenixd-inbound', fmt(liquidity.inbound_sat));
         renderChannels(phoenixd.channels || []);
+
+        const cache = payload.cache;
+        if (cache && cache.age !== null && cache.age !== undefined) {
+            D.setText('funding-updated', 'Updated ' + Math.round(cache.age) + 's ago' + (cache.refreshing ? ' · refreshing' : ''));
+        }
     };
 
     D.fetchFundingSources = async function () {
@@ -70,10 +126,33 @@
         D.renderFundingSources(payload.data || payload);
     };
 
+    D.refreshFundingSources = async function () {
+        const btn = D.el('funding-refresh-btn');
+        if (btn) btn.disabled = true;
+        D.setText('funding-updated', 'Refreshing...');
+        try {
+            const resp = await fetch('/box/api/funding-sources/refresh', { method: 'POST' });
+            const payload = await resp.json();
+            if (!resp.ok) {
+                D.setText('funding-updated', payload.message || 'Refresh failed');
+                return;
+            }
+            D.renderFundingSources(payload.data || payload);
+        } catch (error) {
+            D.setText('funding-updated', 'Refresh failed');
+        } finally {
+            if (btn) btn.disabled = false;
+        }
+    };
+
+    const refreshBtn = D.el('funding-refresh-btn');
+    if (refreshBtn) refreshBtn.addEventListener('click', function () { D.refreshFundingSources(); });
+
     const initial = D.el('initial-funding-sources');
     if (initial) {
         try {
             D.renderFundingSources(JSON.parse(initial.textContent || '{}'));
         } catch (error) {}
     }
+    D.fetchLiquidityHistory();
 })();
@@ -0,0 +1,62 @@
+(function () {
+  const D = window.LNbitsBoxDashboard;
+  if (!D) return;
+
+  const MAX_ROWS = 8;
+
+  function el(id) {
+    return D.el ? D.el(id) : document.getElementById(id);
+  }
+
+  function renderRows(id, rows) {
+    const list = el(id);
+    if (!list) return;
+    list.textContent = '';
+    if (!rows || !rows.length) {
+      const empty = document.createElement('div');
+      empty.className = 'text-ln-muted font-mono text-xs';
+      empty.textContent = 'No calls yet';
+      list.appendChild(empty);
+      return;
+    }
+    rows.slice(0, MAX_ROWS).forEach(function (row) {
+      const line = document.createElement('div');
+      line.className = 'flex items-center justify-between gap-3 font-mono text-xs';
+      const name = document.createElement('span');
+      name.className = 'truncate';
+      name.textContent = row.name;
+      name.title = row.name;
+      const timing = document.createElement('span');
+      timing.className = row.errors ? 'text-amber-400 shrink-0' : 'text-ln-muted shrink-0';
+      timing.textContent = row.count + '× · p95 ' + row.p95_ms + ' ms · max ' + row.max_ms + ' ms'
+        + (row.errors ? ' · ' + row.errors + ' err' : '');
+      line.appendChild(name);
+      line.appendChild(timing);
+      list.appendChild(line);
+    });
+  }
+
+  D.fetchPerf = async function () {
+    if (!el('perf-card')) return;
+    try {
+      const resp = await fetch('/box/api/debug/perf');
+      if (!resp.ok) return;
+      const data = await resp.json();
+      renderRows('perf-routes', data.routes);
+      renderRows('perf-subprocess', data.subprocess);
+      renderRows('perf-http', data.http);
+      const stale = Object.keys(data.probes || {}).filter(function (name) { return data.probes[name].stale; });
+      if (el('perf-summary')) {
+        el('perf-summary').textContent = stale.length
+          ? 'Late stats probes: ' + stale.join(', ')
+          : 'Slowest calls since the admin app started';
+      }
+    } catch (error) {
+      console.error('Performance fetch failed:', error);
+    }
+  };
+
+  const refreshBtn = el('perf-refresh-btn');
+  if (refreshBtn) refreshBtn.addEventListener('click', function () { D.fetchPerf(); });
+  D.fetchPerf();
+})();
@@ -17,6 +17,13 @@
         return (bytes / Math.pow(1024, i)).toFixed(1) + ' ' + units[i];
     };
 
+    D.formatEta = function (seconds) {
+        if (seconds === null || seconds === undefined) return null;
+        if (seconds < 3600) return Math.max(1, Math.round(seconds / 60)) + 'm';
+        if (seconds < 172800) return Math.round(seconds / 3600) + 'h';
+        return Math.round(seconds / 86400) + 'd';
+    };
+
     D.tempColor = function (temp) {
         if (temp === null) return 'text-ln-muted';
         if (temp < 55) return 'text-emerald-400';
@@ -62,11 +69,97 @@
         stopBtn.classList.toggle('hidden', !isActive);
     };
 
-    D.fetchStats = async function () {
+    D.processLabels = {
+        'lnbits': 'LNbits',
+        'spark-sidecar': 'Spark',
+        'arkade-sidecar': 'Arkade',
+        'phoenixd': 'Phoenixd',
+        'tor': 'Tor',
+        'caddy': 'Caddy',
+        'lnbitsbox-reverse-tunnel': 'Tunnel',
+    };
+
+    D.renderProcesses = function (processes) {
+        const list = D.el('svc-process-list');
+        if (!list || !processes) return;
+        const rows = Object.keys(processes).filter(function (svc) {
+            return processes[svc] && processes[svc].pid;
+        });
+        list.textContent = '';
+        if (!rows.length) {
+            const empty = document.createElement('div');
+            empty.className = 'text-ln-muted font-mono text-xs';
+            empty.textContent = 'No running services';
+            list.appendChild(empty);
+            return;
+        }
+        rows.forEach(function (svc) {
+            const p = processes[svc];
+            const row = document.createElement('div');
+            row.className = 'flex items-center justify-between gap-3 font-mono text-xs';
+            const name = document.createElement('span');
+            name.className = 'truncate';
+            name.textContent = D.processLabels[svc] || svc;
+            const usage = document.createElement('span');
+            usage.className = 'text-ln-muted';
+            usage.textContent = [
+                p.cpu_percent !== null ? p.cpu_percent + '% CPU' : '-- CPU',
+                p.rss !== null ? D.formatBytes(p.rss) : '--',
+                (p.fds !== null ? p.fds : '--') + ' fd',
+                (p.threads !== null ? p.threads : '--') + ' thr',
+            ].join(' · ');
+            row.appendChild(name);
+            row.appendChild(usage);
+            list.appendChild(row);
+        });
+    };
+
+    D.formatChartLabel = function (timestamp) {
+        const date = new Date(timestamp);
+        return date.getHours().toString().padStart(2, '0') + ':' + date.getMinutes().toString().padStart(2, '0');
+    };
+
+    D.applyStatsHistory = function (history) {
+        if (!history) return;
+        D.state.statsCursor = history.cursor || null;
+        if (!D.charts.cpu || !D.charts.ram || !D.charts.temp) return;
+        const labels = history.timestamps.map(D.formatChartLabel);
+        const maxPoints = history.size || 240;
+        [['cpu', history.cpu], ['ram', history.ram], ['temp', history.temp]].forEach(function (entry) {
+            const chart = D.charts[entry[0]];
+            if (history.reset) {
+                chart.data.labels = labels.slice();
+                chart.data.datasets[0].data = entry[1].slice();
+            } else {
+                if (!labels.length) return;
+                chart.data.labels.push.apply(chart.data.labels, labels);
+                chart.data.datasets[0].data.push.apply(chart.data.datasets[0].data, entry[1]);
+                const overflow = chart.data.labels.length - maxPoints;
+                if (overflow > 0) {
+                    chart.data.labels.splice(0, overflow);
+                    chart.data.datasets[0].data.splice(0, overflow);
+                }
+            }
+            chart.update('none');
+        });
+    };
+
+    D.fetchStats = async function (options) {
+        options = options || {};
         try {
-            const resp = await fetch('/box/api/stats');
-            if (!resp.ok) return;
-            const payload = await resp.json();
+            let payload = options.payload;
+            if (!payload) {
+                const params = new URLSearchParams();
+                if (options.refresh) params.set('refresh', '1');
+                if (D.state.statsCursor) params.set('since', D.state.statsCursor);
+                const headers = {};
+                if (D.state.statsEtag && !options.refresh) headers['If-None-Match'] = D.state.statsEtag;
+                const query = params.toString();
+                const resp = await fetch('/box/api/stats' + (query ? '?' + query : ''), { headers: headers });
+                if (resp.status === 304 || !resp.ok) return;
+                D.state.statsEtag = resp.headers.get('ETag');
+                payload = await resp.json();
+            }
             const s = payload.current;
 
             const balance = s.funding_source === 'phoenixd'
@@ -87,7 +180,16 @@
             D.setText('stat-disk', s.disk.percent + '%');
             const diskBar = D.el('stat-disk-bar');
             if (diskBar) diskBar.style.width = s.disk.percent + '%';
-            D.setText('stat-disk-detail', D.formatBytes(s.disk.used) + ' / ' + D.formatBytes(s.disk.total));
+            const diskEta = D.formatEta(s.disk.full_eta_seconds);
+            D.setText('stat-disk-detail', D.formatBytes(s.disk.used) + ' / ' + D.formatBytes(s.disk.total) + (diskEta ? ' · full in ~' + diskEta : ''));
+            const io = s.disk_io || {};
+            D.setText('stat-disk-io', io.write_bytes_per_s !== null && io.write_bytes_per_s !== undefined
+                ? 'R ' + D.formatBytes(io.read_bytes_per_s) + '/s · W ' + D.formatBytes(io.write_bytes_per_s) + '/s · ' + io.await_ms + ' ms'
+                : 'I/O: --');
+            const db = s.database || {};
+            D.setText('stat-db-size', db.total !== undefined
+                ? 'DB ' + D.formatBytes(db.total) + (db.wal ? ' (WAL ' + D.formatBytes(db.wal) + ')' : '')
+                : 'DB: --');
 
             D.setText('stat-ram', s.ram.percent + '%');
             const ramBar = D.el('stat-ram-bar');
@@ -117,6 +219,8 @@
                 D.setServiceActionVisibility(svc, status);
             });
 
+            D.renderProcesses(s.processes);
+
             if (typeof D.renderFundingSources === 'function') {
                 D.renderFundingSources(s.funding_sources);
             }
@@ -146,26 +250,49 @@
                 }
             }
 
-            if (D.charts.cpu && D.charts.ram && D.charts.temp) {
-                const labels = payload.history.timestamps.map(function (timestamp) {
-                    const date = new Date(timestamp);
-                    return date.getHours().toString().padStart(2, '0') + ':' + date.getMinutes().toString().padStart(2, '0');
-                });
-                D.charts.cpu.data.labels = labels;
-                D.charts.cpu.data.datasets[0].data = payload.history.cpu;
-                D.charts.cpu.update('none');
-                D.charts.ram.data.labels = labels;
-                D.charts.ram.data.datasets[0].data = payload.history.ram;
-                D.charts.ram.update('none');
-                D.charts.temp.data.labels = labels;
-                D.charts.temp.data.datasets[0].data = payload.history.temp;
-                D.charts.temp.update('none');
-            }
+            D.applyStatsHistory(payload.history);
         } catch (error) {
             console.error('Stats fetch failed:', error);
         }
     };
 
+    D.config.statsPollMs = 10000;
+    D.config.statsStreamRetryMs = 60000;
+
+    D.startStatsPolling = function () {
+        if (D.timers.statsPoll) return;
+        D.timers.statsPoll = setInterval(D.fetchStats, D.config.statsPollMs);
+    };
+
+    D.stopStatsPolling = function () {
+        clearInterval(D.timers.statsPoll);
+        D.timers.statsPoll = null;
+    };
+
+    D.startStatsStream = function () {
+        if (typeof EventSource === 'undefined') {
+            D.startStatsPolling();
+            return;
+        }
+        if (D.state.statsStream) D.state.statsStream.close();
+        const query = D.state.statsCursor ? '?since=' + encodeURIComponent(D.state.statsCursor) : '';
+        const source = new EventSource('/box/api/stats/stream' + query);
+        D.state.statsStream = source;
+        source.addEventListener('stats', function (event) {
+            D.stopStatsPolling();
+            D.fetchStats({ payload: JSON.parse(event.data) });
+        });
+        source.onerror = function () {
+            // EventSource reconnects on its own; a CLOSED stream (auth redirect, stream
+            // limit reached) falls back to polling and retries the stream later.
+            if (source.readyState !== EventSource.CLOSED) return;
+            D.state.statsStream = null;
+            D.startStatsPolling();
+            clearTimeout(D.timers.statsStreamRetry);
+            D.timers.statsStreamRetry = setTimeout(D.startStatsStream, D.config.statsStreamRetryMs);
+        };
+    };
+
     (function seedMockData() {
         if (!D.root || D.root.dataset.devMode !== 'true') return;
         const now = Date.now();
@@ -193,7 +320,8 @@
         D.charts.temp.update('none');
     })();
 
-    D.updateLnbitsStatus = async function () {
+    D.updateLnbitsStatus = async function (options) {
+        options = options || {};
         const statusDot = D.el('lnbits-status-dot');
         const statusText = D.el('lnbits-status-text');
         const statusBadge = D.el('lnbits-status-badge');
@@ -201,17 +329,29 @@
         const openLink = D.el('lnbits-open-link');
         if (!statusDot || !statusText || !statusBadge || !statusCard || !openLink) return;
         try {
-            const resp = await fetch('/box/api/lnbits-status');
-            if (!resp.ok) return;
-            const data = await resp.json();
+            let data = options.payload;
+            if (!data) {
+                const resp = await fetch('/box/api/lnbits-status');
+                if (!resp.ok) return;
+                data = await resp.json();
+            }
+            const p95 = data.p95_ms !== null && data.p95_ms !== undefined ? Math.round(data.p95_ms) + ' ms p95' : null;
             if (data.status === 'running') {
                 statusDot.className = 'w-2.5 h-2.5 rounded-full bg-emerald-400 animate-pulse transition-colors duration-300';
-                statusText.textContent = 'LNbits is running';
+                statusText.textContent = 'LNbits is running' + (p95 ? ' · ' + p95 : '');
                 statusText.className = 'text-emerald-400/70 text-sm transition-colors duration-300';
                 statusBadge.textContent = 'running';
                 statusBadge.className = 'text-xs font-mono uppercase tracking-wider px-2 py-0.5 rounded-full border transition-all duration-300 text-emerald-400 border-emerald-400/30 bg-emerald-400/5';
                 statusCard.className = 'bg-ln-surface border border-emerald-400/20 rounded-xl p-4 mb-6 transition-all duration-500';
                 openLink.classList.remove('opacity-50', 'pointer-events-none');
+            } else if (data.status === 'slow') {
+                statusDot.className = 'w-2.5 h-2.5 rounded-full bg-amber-400 animate-pulse transition-colors duration-300';
+                statusText.textContent = 'LNbits is slow · ' + p95;
+                statusText.className = 'text-amber-400/70 text-sm transition-colors duration-300';
+                statusBadge.textContent = 'slow';
+                statusBadge.className = 'text-xs font-mono uppercase tracking-wider px-2 py-0.5 rounded-full border transition-all duration-300 text-amber-400 border-amber-400/30 bg-amber-400/5';
+                statusCard.className = 'bg-ln-surface border border-amber-400/20 rounded-xl p-4 mb-6 transition-all duration-500';
+                openLink.classList.remove('opacity-50', 'pointer-events-none');
             } else if (data.status === 'starting') {
                 statusDot.className = 'w-2.5 h-2.5 rounded-full bg-amber-400 animate-pulse transition-colors duration-300';
                 statusText.textContent = 'LNbits is starting...';
@@ -241,15 +381,15 @@
         return document.hidden ? D.config.hiddenTabPollMs : D.config.lnbitsPollMs;
     };
 
-    D.runLnbitsPollLoop = async function () {
-        await D.updateLnbitsStatus();
+    D.runLnbitsPollLoop = async function (options) {
+        await D.updateLnbitsStatus(options);
         D.timers.lnbitsPollLoop = setTimeout(D.runLnbitsPollLoop, D.nextLnbitsPollDelay());
     };
 
-    D.restartLnbitsPollLoop = function () {
+    D.restartLnbitsPollLoop = function (options) {
         clearTimeout(D.timers.lnbitsPollLoop);
         D.timers.lnbitsPollLoop = null;
-        D.runLnbitsPollLoop();
+        D.runLnbitsPollLoop(options);
     };
 
     D.copyOnion = async function () {
@@ -274,8 +414,13 @@
         }
     };
 
-    D.fetchStats();
-    setInterval(D.fetchStats, 10000);
-    D.restartLnbitsPollLoop();
-    document.addEventListener('visibilitychange', D.restartLnbitsPollLoop);
+    D.bootstrapSection('stats').then(function (payload) {
+        return D.fetchStats(payload ? { payload: payload } : undefined);
+    }).then(D.startStatsStream);
+    if (D.el('lnbits-status-card')) {
+        D.bootstrapSection('lnbits').then(function (payload) {
+            D.restartLnbitsPollLoop(payload ? { payload: payload } : undefined);
+        });
+    }
+    document.addEventListener('visibilitychange', function () { D.restartLnbitsPollLoop(); });
 })();
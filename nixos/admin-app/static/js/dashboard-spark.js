@@ -98,7 +98,7 @@
       resetFlow();
       D.showNotice(data.message || 'Spark seed phrase updated. Spark is restarting automatically.', 'Success');
       if (typeof D.fetchStats === 'function') {
-        setTimeout(D.fetchStats, 1200);
+        setTimeout(function () { D.fetchStats({ refresh: true }); }, 1200);
       }
     } catch (error) {
       closeModal('spark-seed-backup-modal');
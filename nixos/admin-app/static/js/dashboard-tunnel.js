@@ -401,7 +401,11 @@
     };
 
     D.loadInitialTunnelStatus();
-    if (typeof D.fetchTunnelStatus === 'function') {
-        D.fetchTunnelStatus();
-    }
+    D.bootstrapSection('tunnel').then(function (payload) {
+        if (payload) {
+            D.renderTunnel(payload);
+        } else {
+            D.fetchTunnelStatus();
+        }
+    });
 })();
@@ -16,7 +16,7 @@
         btn.disabled = true;
         status.textContent = 'Checking...';
         try {
-            const resp = await fetch('/box/api/update/check');
+            const resp = await fetch('/box/api/update/check?refresh=1');
             if (!resp.ok) {
                 status.textContent = 'Check failed';
                 btn.disabled = false;
@@ -129,11 +129,19 @@
         }, 3000);
     };
 
+    async function initialSection(name, url) {
+        const payload = await D.bootstrapSection(name);
+        if (payload) return payload;
+        const resp = await fetch(url);
+        return resp.ok ? resp.json() : null;
+    }
+
     (async function initUpdateCard() {
+        const statusReady = initialSection('update_status', '/box/api/update/status');
+        const checkReady = initialSection('update_check', '/box/api/update/check');
         try {
-            const resp = await fetch('/box/api/update/status');
-            if (resp.ok) {
-                const data = await resp.json();
+            const data = await statusReady;
+            if (data) {
                 if (data.status === 'downloading' || data.status === 'activating') {
                     D.showUpdateSection('update-progress');
                     D.pollUpdateStatus();
@@ -152,11 +160,8 @@
             }
         } catch (error) {}
         try {
-            const resp = await fetch('/box/api/update/check');
-            if (resp.ok) {
-                const data = await resp.json();
-                D.el('update-current-version').textContent = 'v' + data.current_version;
-            }
+            const data = await checkReady;
+            if (data) D.el('update-current-version').textContent = 'v' + data.current_version;
         } catch (error) {}
     })();
 })();
@@ -2,7 +2,6 @@
     const D = window.LNbitsBoxDashboard;
     D.state.wifiSelectedSsid = '';
     D.state.wifiSelectedFlags = '';
-    D.timers.wifiConnectPoll = null;
 
     D.clearWifiScanList = function () {
         const container = D.el('wifi-scan-list');
@@ -152,26 +151,18 @@
                 D.showWifiResult(false, data.message, '');
                 return;
             }
+            const job = await D.waitForJob(data.job_id, function (update) {
+                if (update.status === 'running') D.el('wifi-connecting-text').textContent = update.message;
+            });
+            if (job.status === 'succeeded') {
+                D.showWifiResult(true, job.result.message, job.result.ip);
+                setTimeout(function () { D.fetchStats({ refresh: true }); }, 2000);
+            } else {
+                D.showWifiResult(false, job.error || 'Connection failed', '');
+            }
         } catch (error) {
             D.showWifiResult(false, 'Failed to start connection', '');
-            return;
         }
-        D.timers.wifiConnectPoll = setInterval(async function () {
-            try {
-                const resp = await fetch('/box/api/wifi/connect/status');
-                const data = await resp.json();
-                if (data.status === 'success') {
-                    clearInterval(D.timers.wifiConnectPoll);
-                    D.timers.wifiConnectPoll = null;
-                    D.showWifiResult(true, data.message, data.ip);
-                    setTimeout(D.fetchStats, 2000);
-                } else if (data.status === 'failed') {
-                    clearInterval(D.timers.wifiConnectPoll);
-                    D.timers.wifiConnectPoll = null;
-                    D.showWifiResult(false, data.message, '');
-                }
-            } catch (error) {}
-        }, 2000);
     };
 
     D.showWifiResult = function (success, message, ip) {
@@ -199,9 +190,5 @@
 
     D.closeWifiModal = function () {
         D.el('wifi-modal').classList.add('hidden');
-        if (D.timers.wifiConnectPoll) {
-            clearInterval(D.timers.wifiConnectPoll);
-            D.timers.wifiConnectPoll = null;
-        }
     };
 })();
@@ -0,0 +1,71 @@
+(function () {
+  const D = window.LNbitsBoxDashboard;
+  if (!D) return;
+
+  const HEALTH_CLASS = {
+    ok: 'text-emerald-400',
+    standby: 'text-ln-muted',
+    pending: 'text-ln-muted',
+    failing: 'text-amber-400',
+    stalled: 'text-amber-400',
+    crashed: 'text-red-400',
+  };
+
+  function el(id) {
+    return D.el ? D.el(id) : document.getElementById(id);
+  }
+
+  function ago(timestamp) {
+    if (!timestamp) return 'never';
+    const seconds = Math.max(0, Math.round(Date.now() / 1000 - timestamp));
+    if (seconds < 60) return seconds + 's ago';
+    if (seconds < 3600) return Math.round(seconds / 60) + 'm ago';
+    return Math.round(seconds / 3600) + 'h ago';
+  }
+
+  function renderWorkers(data) {
+    const list = el('workers-list');
+    if (!list) return;
+    list.textContent = '';
+    (data.workers || []).forEach(function (worker) {
+      const line = document.createElement('div');
+      line.className = 'flex items-center justify-between gap-3 font-mono text-xs';
+      const name = document.createElement('span');
+      name.className = 'truncate';
+      name.textContent = worker.name;
+      const detail = document.createElement('span');
+      detail.className = (HEALTH_CLASS[worker.health] || 'text-ln-muted') + ' shrink-0';
+      let text = worker.health + ' · last run ' + ago(worker.last_run);
+      if (worker.last_duration_ms !== null) text += ' (' + worker.last_duration_ms + ' ms)';
+      text += ' · ' + worker.runs + ' runs';
+      if (worker.errors) text += ' · ' + worker.errors + ' err';
+      if (worker.restarts) text += ' · ' + worker.restarts + ' restarts';
+      detail.textContent = text;
+      if (worker.last_error) detail.title = worker.last_error;
+      line.appendChild(name);
+      line.appendChild(detail);
+      list.appendChild(line);
+    });
+    if (el('workers-summary')) {
+      el('workers-summary').textContent = data.leader
+        ? 'Running in this process (pid ' + data.pid + ')'
+        : 'Standby: another admin process holds ' + data.lock_path;
+    }
+  }
+
+  D.fetchWorkers = async function () {
+    if (!el('workers-card')) return;
+    try {
+      const resp = await fetch('/box/api/workers');
+      if (!resp.ok) return;
+      const data = await resp.json();
+      renderWorkers(data.data || data);
+    } catch (error) {
+      console.error('Workers fetch failed:', error);
+    }
+  };
+
+  const refreshBtn = el('workers-refresh-btn');
+  if (refreshBtn) refreshBtn.addEventListener('click', function () { D.fetchWorkers(); });
+  D.fetchWorkers();
+})();
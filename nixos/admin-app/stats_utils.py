@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one execution:
+    - The first caller runs the function.
+    - Callers arriving while it runs wait and receive the same result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+
+class StaleWhileRevalidate:
+    """
+    Cached value served stale-while-revalidate:
+    - get() returns the cached value immediately; once it is older than `refresh_after`
+      a background refresh is started and the stale value is still returned.
+    - Values older than `max_age` (or a missing value) are refreshed before returning.
+    - refresh() reloads now; concurrent refreshes share one loader call.
+    - invalidate() marks the value stale without dropping it; clear() drops it, so the next
+      get() loads inline instead of serving a value that no longer applies.
+    - A failed refresh keeps the previous value and records the error.
+    """
+
+    def __init__(self, loader: Callable[[], Any], *, refresh_after: float, max_age: float,
+                 clock: Callable[[], float] | None = None,
+                 spawn: Callable[[Callable[[], None]], None] | None = None):
+        self._loader = loader
+        self._refresh_after = refresh_after
+        self._max_age = max_age
+        self._clock = clock or time.monotonic
+        self._spawn = spawn or (lambda fn: threading.Thread(target=fn, name="swr-refresh", daemon=True).start())
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._value: Any = None
+        self._loaded_at: float | None = None
+        self._stale = False
+        self._error: str | None = None
+        # Bumped by clear(); a load started before it neither stores nor answers later callers
+        self._generation = 0
+
+    def _load(self, generation: int) -> Any:
+        try:
+            value = self._loader()
+        except Exception as exc:
+            with self._lock:
+                self._error = str(exc) or exc.__class__.__name__
+            raise
+        with self._lock:
+            if generation == self._generation:
+                self._value = value
+                self._loaded_at = self._clock()
+                self._stale = False
+                self._error = None
+        return value
+
+    def _refresh_key(self) -> tuple[str, int]:
+        with self._lock:
+            return ("refresh", self._generation)
+
+    def refresh(self) -> Any:
+        key = self._refresh_key()
+        return self._flight.do(key, lambda: self._load(key[1]))
+
+    def _refresh_quietly(self):
+        try:
+            self.refresh()
+        except Exception:
+            pass
+
+    def invalidate(self):
+        with self._lock:
+            self._stale = True
+
+    def clear(self):
+        with self._lock:
+            self._value = None
+            self._loaded_at = None
+            self._stale = False
+            self._generation += 1
+
+    def get(self) -> Any:
+        with self._lock:
+            age = None if self._loaded_at is None else self._clock() - self._loaded_at
+            value, stale = self._value, self._stale
+        if age is None or age > self._max_age:
+            try:
+                return self.refresh()
+            except Exception:
+                if age is None:
+                    raise
+                return value
+        if (stale or age > self._refresh_after) and not self._flight.in_flight(self._refresh_key()):
+            self._spawn(self._refresh_quietly)
+        return value
+
+    def status(self) -> dict[str, Any]:
+        key = self._refresh_key()
+        with self._lock:
+            age = None if self._loaded_at is None else round(self._clock() - self._loaded_at, 1)
+            return {
+                "age": age,
+                "stale": self._stale or (age is not None and age > self._refresh_after),
+                "refreshing": self._flight.in_flight(key),
+                "error": self._error,
+            }
+
+
+def gather_sections(sections: dict[str, Callable[[], Any]], pool: Executor, timeout: float) -> dict[str, dict[str, Any]]:
+    """
+    Run independent sections concurrently on `pool`, waiting at most `timeout` for all of them.
+    Each name maps to {"status": "ok", "data": ...}, {"status": "error", "error": ...} or,
+    when it missed the deadline, {"status": "pending"}; pending sections finish in the background.
+    """
+    futures = {name: pool.submit(fn) for name, fn in sections.items()}
+    wait(futures.values(), timeout=timeout)
+    results: dict[str, dict[str, Any]] = {}
+    for name, future in futures.items():
+        if not future.done():
+            results[name] = {"status": "pending"}
+        elif future.exception() is not None:
+            exc = future.exception()
+            results[name] = {"status": "error", "error": str(exc) or exc.__class__.__name__}
+        else:
+            results[name] = {"status": "ok", "data": future.result()}
+    return results
+
+
+PROBE_COST_CLASSES = ("cheap", "moderate", "expensive")
+
+
+class Probe:
+    __slots__ = (
+        "name", "fn", "interval", "timeout", "cost",
+        "value", "last_run", "last_duration", "last_error", "runs",
+        "in_flight", "stale",
+    )
+
+    def __init__(self, name: str, fn: Callable[[], Any], *, interval: float, timeout: float, cost: str, default: Any = None):
+        if cost not in PROBE_COST_CLASSES:
+            raise ValueError(f"Unknown probe cost class: {cost}")
+        self.name = name
+        self.fn = fn
+        self.interval = float(interval)
+        self.timeout = float(timeout)
+        self.cost = cost
+        self.value = default
+        self.last_run: float | None = None
+        self.last_duration: float | None = None
+        self.last_error: str | None = None
+        self.runs = 0
+        self.in_flight = False
+        self.stale = False
+
+    def is_due(self, now: float) -> bool:
+        return self.last_run is None or (now - self.last_run) >= self.interval
+
+    def status(self, now: float) -> dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "timeout": self.timeout,
+            "cost": self.cost,
+            "runs": self.runs,
+            "last_duration_ms": round(self.last_duration * 1000, 1) if self.last_duration is not None else None,
+            "age_seconds": round(now - self.last_run, 1) if self.last_run is not None else None,
+            "over_budget": self.last_duration is not None and self.last_duration > self.timeout,
+            "in_flight": self.in_flight,
+            "stale": self.stale,
+            "error": self.last_error,
+        }
+
+
+class ProbeScheduler:
+    """
+    Registry of stats probes, each sampled on its own interval:
+    - run_due() only runs probes whose interval has elapsed (or all of them when forced).
+    - Due probes run concurrently on a bounded thread pool; run_due() waits at most
+      min(deadline, longest probe timeout), so a cycle costs max(probe) rather than sum(probe).
+    - A probe that misses the deadline keeps running in the background and is marked stale;
+      its last known value is served until it finishes. It is not resubmitted while in flight.
+    - Probes keep their last value, so a snapshot can always be assembled from memory.
+    - Failures keep the previous value and record the error; durations are recorded per run.
+    - observer(name, duration, error), if given, is called after every run (e.g. for histograms).
+    """
+
+    def __init__(self, clock: Callable[[], float] | None = None,
+                 observer: Callable[[str, float, str | None], None] | None = None,
+                 *, max_workers: int = 4, deadline: float | None = None) -> None:
+        self._clock = clock or time.monotonic
+        self._observer = observer
+        self._max_workers = max_workers
+        self._deadline = deadline
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._probes: dict[str, Probe] = {}
+
+    def register(self, name: str, fn: Callable[[], Any], *, interval: float, timeout: float, cost: str, default: Any = None) -> Probe:
+        probe = Probe(name, fn, interval=interval, timeout=timeout, cost=cost, default=default)
+        with self._lock:
+            self._probes[name] = probe
+        return probe
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return list(self._probes)
+
+    def due(self, now: float | None = None) -> list[str]:
+        now = self._clock() if now is None else now
+        with self._lock:
+            return [name for name, probe in self._probes.items() if probe.is_due(now)]
+
+    def _run_probe(self, probe: Probe) -> None:
+        started = self._clock()
+        try:
+            value = probe.fn()
+            error = None
+        except Exception as exc:
+            value = probe.value
+            error = str(exc) or exc.__class__.__name__
+        finished = self._clock()
+        with self._lock:
+            probe.value = value
+            probe.last_error = error
+            probe.last_run = finished
+            probe.last_duration = finished - started
+            probe.runs += 1
+            probe.in_flight = False
+            probe.stale = False
+        if self._observer is not None:
+            self._observer(probe.name, finished - started, error)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="stats-probe")
+            return self._executor
+
+    def run_due(self, *, force: bool | list[str] = False) -> list[str]:
+        """
+        Run due probes concurrently; force=True runs every probe, a list forces just those names.
+        Returns the names that finished within the deadline.
+        """
+        if force is True:
+            selected = self.names()
+        else:
+            selected = self.due()
+            if force:
+                selected.extend(name for name in force if name not in selected)
+        with self._lock:
+            probes = [
+                self._probes[name] for name in selected
+                if name in self._probes and not self._probes[name].in_flight
+            ]
+            for probe in probes:
+                probe.in_flight = True
+        if not probes:
+            return []
+
+        pool = self._pool()
+        futures = {pool.submit(self._run_probe, probe): probe for probe in probes}
+        budget = max(probe.timeout for probe in probes)
+        if self._deadline is not None:
+            budget = min(budget, self._deadline)
+        done, pending = wait(futures, timeout=budget)
+        with self._lock:
+            for future in pending:
+                futures[future].stale = True
+        return [futures[future].name for future in futures if future in done]
+
+    def expire(self, *names: str):
+        """Make the named probes due on the next run_due()"""
+        with self._lock:
+            for name in names:
+                if name in self._probes:
+                    self._probes[name].last_run = None
+
+    def stale(self) -> list[str]:
+        with self._lock:
+            return [name for name, probe in self._probes.items() if probe.stale]
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def values(self) -> dict[str, Any]:
+        with self._lock:
+            return {name: probe.value for name, probe in self._probes.items()}
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        now = self._clock()
+        with self._lock:
+            return {name: probe.status(now) for name, probe in self._probes.items()}
+
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(value: str | None) -> int | None:
+    """Parse '90', '15m', '24h', '7d' or '2w' into seconds; None/blank yields None"""
+    text = (value or "").strip().lower()
+    if not text:
+        return None
+    unit = text[-1]
+    if unit in _DURATION_UNITS:
+        number = text[:-1]
+        multiplier = _DURATION_UNITS[unit]
+    else:
+        number = text
+        multiplier = 1
+    try:
+        amount = float(number) * multiplier
+    except ValueError:
+        raise ValueError(f"Invalid duration: {value}") from None
+    # "inf", "nan" and "1e400h" parse as floats but are not durations
+    if not math.isfinite(amount):
+        raise ValueError(f"Invalid duration: {value}")
+    seconds = int(amount)
+    if seconds <= 0:
+        raise ValueError(f"Invalid duration: {value}")
+    return seconds
+
+
+class ColumnarHistory:
+    """
+    Fixed-size ring of samples stored as one typed array per column:
+    - append() writes one value per column in O(1), with None stored as NaN.
+    - columns() returns oldest-to-newest lists via two array slices per column.
+    - Not thread-safe; callers hold their own lock.
+    """
+
+    def __init__(self, columns: dict[str, str], size: int):
+        if size <= 0:
+            raise ValueError("History size must be positive")
+        self.size = size
+        self._columns = {name: array(typecode, [0] * size) for name, typecode in columns.items()}
+        self._head = 0
+        self._count = 0
+        self.appended = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, row: dict[str, float | int | None]):
+        for name, column in self._columns.items():
+            value = row.get(name)
+            column[self._head] = math.nan if value is None else value
+        self._head = (self._head + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+        self.appended += 1
+
+    def _ordered(self, column: array, last: int) -> list[float]:
+        start = (self._head - last) % self.size
+        if start + last <= self.size:
+            return column[start:start + last].tolist()
+        return column[start:].tolist() + column[:self._head].tolist()
+
+    def columns(self, names: list[str] | None = None, last: int | None = None) -> dict[str, list[float | None]]:
+        """Return the newest `last` samples (default: all) for the requested columns"""
+        count = self._count if last is None else max(0, min(last, self._count))
+        result: dict[str, list[float | None]] = {}
+        for name in names or list(self._columns):
+            values = self._ordered(self._columns[name], count) if count else []
+            if any(value != value for value in values):
+                values = [None if value != value else value for value in values]
+            result[name] = values
+        return result
+
+    def since(self, cursor: int | None, names: list[str] | None = None) -> tuple[dict[str, list[float | None]], bool]:
+        """
+        Return samples appended after `cursor` (a previous `appended` value).
+        The second item is True when the cursor is unknown or too old and the full window was returned.
+        """
+        if cursor is None:
+            return self.columns(names), True
+        new = self.appended - cursor
+        if new < 0 or new > self._count:
+            return self.columns(names), True
+        return self.columns(names, last=new), False
+
+    def latest(self) -> dict[str, float | None] | None:
+        if not self._count:
+            return None
+        return {name: values[0] for name, values in self.columns(last=1).items()}
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+SECTOR_SIZE = 512
+_WHOLE_DISK = re.compile(r"^(mmcblk\d+|sd[a-z]+|vd[a-z]+|nvme\d+n\d+)$")
+
+
+def parse_diskstats(text: str) -> dict[tuple[int, int], dict[str, Any]]:
+    """Parse /proc/diskstats into counters keyed by (major, minor)"""
+    devices: dict[tuple[int, int], dict[str, Any]] = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 14:
+            continue
+        try:
+            major, minor = int(fields[0]), int(fields[1])
+            counters = [int(value) for value in fields[3:14]]
+        except ValueError:
+            continue
+        devices[(major, minor)] = {
+            "name": fields[2],
+            "reads": counters[0],
+            "read_sectors": counters[2],
+            "read_ms": counters[3],
+            "writes": counters[4],
+            "write_sectors": counters[6],
+            "write_ms": counters[7],
+            "io_ms": counters[9],
+        }
+    return devices
+
+
+def parse_pressure(text: str) -> dict[str, dict[str, float]]:
+    """Parse a /proc/pressure/* file into {"some": {...}, "full": {...}}"""
+    result: dict[str, dict[str, float]] = {}
+    for line in text.splitlines():
+        kind, _, rest = line.partition(" ")
+        values: dict[str, float] = {}
+        for item in rest.split():
+            key, _, value = item.partition("=")
+            try:
+                values[key] = float(value)
+            except ValueError:
+                continue
+        if kind in {"some", "full"}:
+            result[kind] = values
+    return result
+
+
+def sqlite_file_sizes(db_path: Path) -> dict[str, int]:
+    """Sizes in bytes of an SQLite database and its -wal/-shm companions (0 when absent)"""
+    sizes: dict[str, int] = {}
+    for key, path in (
+        ("db", db_path),
+        ("wal", db_path.with_name(db_path.name + "-wal")),
+        ("shm", db_path.with_name(db_path.name + "-shm")),
+    ):
+        try:
+            sizes[key] = path.stat().st_size
+        except OSError:
+            sizes[key] = 0
+    sizes["total"] = sizes["db"] + sizes["wal"] + sizes["shm"]
+    return sizes
+
+
+def fill_eta(timestamps: list[float], used_percent: list[float | None], *, min_span: float = 3600) -> float | None:
+    """
+    Seconds until used_percent reaches 100, from a least-squares trend over the samples.
+    Returns None when the window is too short or usage is flat or shrinking.
+    """
+    points = [(ts, value) for ts, value in zip(timestamps, used_percent) if value is not None]
+    if len(points) < 3 or points[-1][0] - points[0][0] < min_span:
+        return None
+    count = len(points)
+    mean_t = sum(ts for ts, _ in points) / count
+    mean_v = sum(value for _, value in points) / count
+    variance = sum((ts - mean_t) ** 2 for ts, _ in points)
+    if variance <= 0:
+        return None
+    slope = sum((ts - mean_t) * (value - mean_v) for ts, value in points) / variance
+    if slope <= 0:
+        return None
+    current = mean_v + slope * (points[-1][0] - mean_t)
+    return max(0.0, (100 - current) / slope)
+
+
+class DiskIOSampler:
+    """
+    Read/write throughput, IOPS, average await and utilisation for one block device:
+    - The device backing `path` is found via st_dev; if it is not listed in diskstats
+      (overlay, btrfs subvolume) all whole disks are summed instead.
+    - Rates are deltas between consecutive samples; the first sample reports None.
+    """
+
+    def __init__(self, path: str | Path = "/", *, diskstats_path: str | Path = "/proc/diskstats",
+                 clock: Callable[[], float] | None = None):
+        self._device: tuple[int, int] | None = None
+        try:
+            st_dev = os.stat(path).st_dev
+            self._device = (os.major(st_dev), os.minor(st_dev))
+        except OSError:
+            pass
+        self._diskstats_path = Path(diskstats_path)
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._previous: tuple[float, dict[str, Any]] | None = None
+
+    def _counters(self) -> dict[str, Any] | None:
+        devices = parse_diskstats(self._diskstats_path.read_text())
+        if self._device in devices:
+            return devices[self._device]
+        disks = [device for device in devices.values() if _WHOLE_DISK.match(device["name"])]
+        if not disks:
+            return None
+        total = {key: sum(device[key] for device in disks) for key in disks[0] if key != "name"}
+        total["name"] = ",".join(device["name"] for device in disks)
+        return total
+
+    def sample(self) -> dict[str, Any]:
+        now = self._clock()
+        counters = self._counters()
+        with self._lock:
+            previous, self._previous = self._previous, (now, counters) if counters else None
+        result: dict[str, Any] = {
+            "device": counters["name"] if counters else None,
+            "read_bytes_per_s": None,
+            "write_bytes_per_s": None,
+            "read_iops": None,
+            "write_iops": None,
+            "await_ms": None,
+            "util_percent": None,
+        }
+        if not counters or not previous or previous[1] is None:
+            return result
+        elapsed = now - previous[0]
+        prev = previous[1]
+        if elapsed <= 0 or counters["reads"] < prev["reads"] or counters["writes"] < prev["writes"]:
+            return result
+        reads = counters["reads"] - prev["reads"]
+        writes = counters["writes"] - prev["writes"]
+        io_wait = (counters["read_ms"] - prev["read_ms"]) + (counters["write_ms"] - prev["write_ms"])
+        result.update({
+            "read_bytes_per_s": round((counters["read_sectors"] - prev["read_sectors"]) * SECTOR_SIZE / elapsed),
+            "write_bytes_per_s": round((counters["write_sectors"] - prev["write_sectors"]) * SECTOR_SIZE / elapsed),
+            "read_iops": round(reads / elapsed, 1),
+            "write_iops": round(writes / elapsed, 1),
+            "await_ms": round(io_wait / (reads + writes), 1) if reads + writes else 0.0,
+            "util_percent": round(min(100.0, (counters["io_ms"] - prev["io_ms"]) / (elapsed * 10)), 1),
+        })
+        return result
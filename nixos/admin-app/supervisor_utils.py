@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+class LeaderLock:
+    """Non-blocking exclusive flock on a file; only one process holds it at a time"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+
+class Worker:
+    """
+    A periodic background job run by the Supervisor:
+    - tick() runs every `interval` seconds (sooner when `wakeup` is set).
+    - setup() runs once per (re)start before the first tick.
+    - A tick that raises is recorded and the loop continues.
+    """
+
+    def __init__(self, name: str, tick: Callable[[], Any], *, interval: float,
+                 setup: Callable[[], Any] | None = None, wakeup: threading.Event | None = None,
+                 initial_delay: float = 0.0):
+        self.name = name
+        self.tick = tick
+        self.interval = interval
+        self.setup = setup
+        self.wakeup = wakeup
+        self.initial_delay = initial_delay
+        self.thread: threading.Thread | None = None
+        self.runs = 0
+        self.errors = 0
+        self.restarts = 0
+        self.started_at: float | None = None
+        self.tick_started_at: float | None = None
+        self.last_run: float | None = None
+        self.last_duration: float | None = None
+        self.last_error: str | None = None
+        self.last_ok: float | None = None
+
+
+class Supervisor:
+    """
+    Runs Workers in threads of the process holding the leader lock:
+    - Processes that fail to get the lock keep retrying, so another process takes over
+      when the leader exits.
+    - A watchdog restarts worker threads that died (with `restart_delay` between attempts).
+    - stop() signals the workers, waits for the current ticks and releases the lock.
+    - status() reports leadership plus per-worker health and last-run details.
+    """
+
+    def __init__(self, lock: LeaderLock, *, check_interval: float = 5.0, restart_delay: float = 5.0,
+                 clock: Callable[[], float] | None = None):
+        self._lock_file = lock
+        self._check_interval = check_interval
+        self._restart_delay = restart_delay
+        self._clock = clock or time.time
+        self._workers: dict[str, Worker] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._watchdog: threading.Thread | None = None
+
+    def add(self, worker: Worker) -> Worker:
+        self._workers[worker.name] = worker
+        return worker
+
+    @property
+    def leader(self) -> bool:
+        return self._lock_file.held
+
+    def _run_worker(self, worker: Worker):
+        try:
+            self._loop(worker)
+        except BaseException as exc:
+            # The thread ends here; the watchdog restarts it
+            worker.errors += 1
+            worker.last_error = f"crashed: {exc!r}"
+
+    def _loop(self, worker: Worker):
+        if worker.setup is not None:
+            worker.setup()
+        if self._stop.wait(worker.initial_delay):
+            return
+        while not self._stop.is_set():
+            worker.tick_started_at = self._clock()
+            started = time.perf_counter()
+            try:
+                worker.tick()
+            except Exception as exc:
+                worker.errors += 1
+                worker.last_error = str(exc) or exc.__class__.__name__
+            else:
+                worker.last_ok = self._clock()
+                worker.last_error = None
+            finally:
+                worker.runs += 1
+                worker.last_run = worker.tick_started_at
+                worker.last_duration = time.perf_counter() - started
+                worker.tick_started_at = None
+            if worker.wakeup is not None:
+                worker.wakeup.wait(worker.interval)
+                worker.wakeup.clear()
+            else:
+                self._stop.wait(worker.interval)
+
+    def _start_worker(self, worker: Worker):
+        worker.started_at = self._clock()
+        worker.thread = threading.Thread(target=self._run_worker, args=(worker,), name=f"worker-{worker.name}", daemon=True)
+        worker.thread.start()
+
+    def check(self):
+        """Take leadership if free and (re)start dead workers; called by the watchdog"""
+        with self._lock:
+            if self._stop.is_set() or not self._lock_file.acquire():
+                return
+            now = self._clock()
+            for worker in self._workers.values():
+                if worker.thread is None:
+                    self._start_worker(worker)
+                elif not worker.thread.is_alive() and now - (worker.started_at or 0) >= self._restart_delay:
+                    worker.restarts += 1
+                    self._start_worker(worker)
+
+    def _watch(self):
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception:
+                pass
+            self._stop.wait(self._check_interval)
+
+    def start(self):
+        if self._watchdog is None:
+            self._watchdog = threading.Thread(target=self._watch, name="worker-supervisor", daemon=True)
+            self._watchdog.start()
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for worker in self._workers.values():
+            if worker.wakeup is not None:
+                worker.wakeup.set()
+            if worker.thread is not None:
+                worker.thread.join(max(0.0, deadline - time.monotonic()))
+        with self._lock:
+            self._lock_file.release()
+
+    def _health(self, worker: Worker, now: float) -> str:
+        if not self.leader:
+            return "standby"
+        if worker.thread is None:
+            return "pending"
+        if not worker.thread.is_alive():
+            return "crashed"
+        if worker.tick_started_at is not None and now - worker.tick_started_at > max(worker.interval * 3, 60):
+            return "stalled"
+        if worker.last_error is not None:
+            return "failing"
+        return "ok"
+
+    def status(self) -> dict[str, Any]:
+        now = self._clock()
+        return {
+            "leader": self.leader,
+            "pid": os.getpid(),
+            "lock_path": str(self._lock_file.path),
+            "workers": [
+                {
+                    "name": worker.name,
+                    "health": self._health(worker, now),
+                    "interval": worker.interval,
+                    "runs": worker.runs,
+                    "errors": worker.errors,
+                    "restarts": worker.restarts,
+                    "running_for": round(now - worker.tick_started_at, 1) if worker.tick_started_at else None,
+                    "last_run": worker.last_run,
+                    "last_ok": worker.last_ok,
+                    "last_duration_ms": round(worker.last_duration * 1000, 1) if worker.last_duration is not None else None,
+                    "last_error": worker.last_error,
+                }
+                for worker in self._workers.values()
+            ],
+        }
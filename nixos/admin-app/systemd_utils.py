@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+UNIT_PROPERTIES = ("Id", "LoadState", "ActiveState", "SubState", "MainPID", "NRestarts", "ControlGroup")
+
+
+def _unit_name(unit: str) -> str:
+    return unit if "." in unit else f"{unit}.service"
+
+
+def _int_or_none(value: str | None) -> int | None:
+    try:
+        return int(value) if value not in (None, "", "[not set]") else None
+    except ValueError:
+        return None
+
+
+def unknown_unit_state() -> dict[str, Any]:
+    return {
+        "load_state": "unknown",
+        "active_state": "unknown",
+        "sub_state": "unknown",
+        "main_pid": None,
+        "n_restarts": None,
+        "control_group": None,
+    }
+
+
+def parse_systemctl_show(output: str) -> dict[str, dict[str, Any]]:
+    """
+    Parse `systemctl show --property=... unit...` output into per-unit states.
+    Units are separated by blank lines and keyed by their Id property.
+    """
+    units: dict[str, dict[str, Any]] = {}
+    for block in output.strip().split("\n\n"):
+        props = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+        unit_id = props.get("Id")
+        if not unit_id:
+            continue
+        main_pid = _int_or_none(props.get("MainPID"))
+        units[unit_id] = {
+            "load_state": props.get("LoadState") or "unknown",
+            "active_state": props.get("ActiveState") or "unknown",
+            "sub_state": props.get("SubState") or "unknown",
+            "main_pid": main_pid or None,
+            "n_restarts": _int_or_none(props.get("NRestarts")),
+            "control_group": props.get("ControlGroup") or None,
+        }
+    return units
+
+
+class UnitStateCache:
+    """
+    Short-lived cache of systemd unit states fetched with one query for every tracked unit:
+    - runner(units) returns `systemctl show` output for all units in a single process spawn.
+    - Concurrent readers of an expired cache share one refresh.
+    - invalidate() drops the cache after start/stop/restart so the next read is fresh.
+    """
+
+    def __init__(self, units: list[str], runner: Callable[[list[str]], str], *, ttl: float = 5.0, clock: Callable[[], float] | None = None):
+        self._units = [_unit_name(unit) for unit in units]
+        self._runner = runner
+        self._ttl = ttl
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._states: dict[str, dict[str, Any]] = {}
+        self._fetched_at: float | None = None
+
+    def invalidate(self):
+        with self._lock:
+            self._fetched_at = None
+
+    def states(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            now = self._clock()
+            if self._fetched_at is None or now - self._fetched_at >= self._ttl:
+                try:
+                    parsed = parse_systemctl_show(self._runner(list(self._units)))
+                except Exception:
+                    parsed = {}
+                self._states = {unit: parsed.get(unit) or unknown_unit_state() for unit in self._units}
+                self._fetched_at = now
+            return dict(self._states)
+
+    def get(self, unit: str) -> dict[str, Any]:
+        name = _unit_name(unit)
+        with self._lock:
+            if name not in self._units:
+                self._units.append(name)
+                self._fetched_at = None
+        return self.states()[name]
+
+    def active_state(self, unit: str) -> str:
+        return self.get(unit)["active_state"]
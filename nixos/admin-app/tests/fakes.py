@@ -0,0 +1,8 @@
+class FakeClock:
+    """Stand-in for time.monotonic/time.time; tests advance it by changing `now`"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
@@ -0,0 +1,67 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from asset_utils import build_assets, load_manifest, minify_css, minify_js
+
+
+class MinifyTest(unittest.TestCase):
+    def test_js_drops_comments_and_indentation_but_keeps_literals(self):
+        source = (
+            "(function () {\n"
+            "    // fetch wrapper\n"
+            "    const url = '/box/api // not a comment';\n"
+            "    /* block\n"
+            "       comment */\n"
+            "    const ratio = total / 2 / count;\n"
+            "    const re = /\\/\\/[a-z/]+/g;\n"
+            "    if (x) return /  spaced  /.test(url);\n"
+            "})();\n"
+        )
+        self.assertEqual(minify_js(source), (
+            "(function () {\n"
+            "const url = '/box/api // not a comment';\n"
+            "const ratio = total / 2 / count;\n"
+            "const re = /\\/\\/[a-z/]+/g;\n"
+            "if (x) return /  spaced  /.test(url);\n"
+            "})();\n"
+        ))
+
+    def test_inline_block_comment_still_separates_tokens(self):
+        self.assertEqual(minify_js("return/* x */value;"), "return value;\n")
+
+    def test_css(self):
+        source = "/* reset */\n.a ,\n.b > .c {\n    color: red;\n    --tw-pan-x: ;\n}\n.d :hover { content: \"a  b\"; }\n"
+        self.assertEqual(minify_css(source), '.a,.b>.c{color:red;--tw-pan-x: }.d :hover{content:"a  b"}')
+
+
+class BuildAssetsTest(unittest.TestCase):
+    def test_writes_hashed_precompressed_bundles_and_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            static, out = Path(tmp) / "static", Path(tmp) / "dist"
+            (static / "js").mkdir(parents=True)
+            (static / "js" / "a.js").write_text("(function () {\n    window.a = 1;\n})()")
+            (static / "js" / "b.js").write_text("(function () {\n    window.b = 2;\n})();\n")
+            out.mkdir()
+            (out / "page.000000000000.js").write_text("stale")
+
+            manifest = build_assets(static, out, {"page.js": ("js/a.js", "js/b.js")})
+            filename = manifest["page.js"]
+            self.assertRegex(filename, r"^page\.[0-9a-f]{12}\.js$")
+            content = (out / filename).read_text()
+            self.assertEqual(content, "(function () {\nwindow.a = 1;\n})()\n;(function () {\nwindow.b = 2;\n})();\n")
+            self.assertEqual(gzip.decompress((out / f"{filename}.gz").read_bytes()).decode(), content)
+            self.assertFalse((out / "page.000000000000.js").exists())
+            self.assertEqual(load_manifest(out), manifest)
+
+            (static / "js" / "b.js").write_text("window.b = 3;\n")
+            self.assertNotEqual(build_assets(static, out, {"page.js": ("js/a.js", "js/b.js")})["page.js"], filename)
+
+    def test_missing_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(load_manifest(Path(tmp)))
+
+
+if __name__ == "__main__":
+    unittest.main()
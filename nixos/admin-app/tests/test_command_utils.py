@@ -0,0 +1,135 @@
+import subprocess
+import threading
+import time
+import unittest
+
+from command_utils import CommandRunner
+from perf_utils import CallRecorder
+
+from fakes import FakeClock
+
+
+class FakeRun:
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, args, **kwargs):
+        with self._lock:
+            self.calls.append(list(args))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return subprocess.CompletedProcess(args, 0, stdout=f"out {len(self.calls)}", stderr="")
+
+
+WPA_STATUS = ["wpa_cli", "-p", "/run/wpa_supplicant", "-i", "wlan0", "status"]
+
+
+class CommandRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.run = FakeRun()
+        self.runner = CommandRunner(run=self.run, clock=self.clock)
+
+    def test_read_results_are_cached_for_their_ttl(self):
+        first = self.runner.run(WPA_STATUS, capture_output=True, text=True, timeout=5)
+        self.assertIs(self.runner.run(WPA_STATUS, capture_output=True, text=True, timeout=5), first)
+        self.clock.now += 1
+        self.runner.run(WPA_STATUS, capture_output=True, text=True, timeout=5)
+        self.assertEqual(len(self.run.calls), 2)
+
+    def test_mutation_invalidates_tool_reads_and_notifies(self):
+        notified = []
+        self.runner.on_invalidate(notified.append)
+        self.runner.run(["systemctl", "show", "lnbits.service"], timeout=5)
+        self.runner.run(["ip", "-j", "addr", "show"], timeout=5)
+        self.runner.run(["wpa_cli", "-i", "wlan0", "select_network", "1"], timeout=5)
+        self.runner.run(["systemctl", "show", "lnbits.service"], timeout=5)
+        self.runner.run(["ip", "-j", "addr", "show"], timeout=5)
+        self.assertEqual(len(self.run.calls), 4)
+        self.assertEqual(notified, ["wpa_cli", "ip"])
+
+        self.runner.run(["systemctl", "restart", "lnbits.service"], timeout=5)
+        self.runner.run(["systemctl", "show", "lnbits.service"], timeout=5)
+        self.assertEqual(len(self.run.calls), 6)
+
+    def test_uncached_commands_always_run(self):
+        self.runner.run(["ping", "-c", "1", "1.1.1.1"], timeout=5)
+        self.runner.run(["ping", "-c", "1", "1.1.1.1"], timeout=5)
+        self.runner.run(WPA_STATUS, cache_ttl=0, timeout=5)
+        self.runner.run(WPA_STATUS, cache_ttl=0, timeout=5)
+        self.assertEqual(len(self.run.calls), 4)
+
+    def run_concurrently(self, runner, args, count=4):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(runner.run(args, timeout=5)))
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+        return results
+
+    def test_identical_in_flight_reads_are_joined(self):
+        run = FakeRun(delay=0.2)
+        results = self.run_concurrently(CommandRunner(run=run), ["systemctl", "show", "lnbits.service"])
+        self.assertEqual(len(run.calls), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_identical_mutations_each_run(self):
+        run = FakeRun(delay=0.1)
+        self.run_concurrently(CommandRunner(run=run), ["systemctl", "restart", "lnbits.service"], count=3)
+        self.assertEqual(len(run.calls), 3)
+
+    def test_waiting_for_a_slot_counts_against_the_timeout(self):
+        timeouts = []
+
+        def run(args, **kwargs):
+            timeouts.append(kwargs["timeout"])
+            time.sleep(0.3)
+            return subprocess.CompletedProcess(args, 0)
+
+        runner = CommandRunner(run=run, max_concurrent=1)
+        first = threading.Thread(target=runner.run, args=(["ping", "a"],), kwargs={"timeout": 5})
+        first.start()
+        time.sleep(0.05)
+        runner.run(["ping", "b"], timeout=1)
+        first.join(2)
+        self.assertAlmostEqual(timeouts[0], 5, places=1)
+        self.assertLess(timeouts[1], 0.8)
+        with self.assertRaises(subprocess.TimeoutExpired):
+            blocker = threading.Thread(target=runner.run, args=(["ping", "c"],), kwargs={"timeout": 5})
+            blocker.start()
+            time.sleep(0.05)
+            try:
+                runner.run(["ping", "d"], timeout=0.1)
+            finally:
+                blocker.join(2)
+
+    def test_concurrency_is_capped_and_timed(self):
+        run = FakeRun(delay=0.05)
+        recorder = CallRecorder()
+        runner = CommandRunner(run=run, recorder=recorder, max_concurrent=2)
+        threads = [
+            threading.Thread(target=runner.run, args=(["ping", "-c", "1", f"10.0.0.{index}"],), kwargs={"timeout": 5})
+            for index in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(len(run.calls), 6)
+        self.assertLessEqual(run.peak, 2)
+        self.assertEqual(recorder.summary()["subprocess"][0]["count"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
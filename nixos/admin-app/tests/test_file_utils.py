@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from file_utils import FileCache
+
+
+def parse_upper(raw):
+    return raw.strip().upper()
+
+
+def parse_int(raw):
+    return int(raw)
+
+
+class FileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "selected"
+        self.cache = FileCache()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_serves_cached_value_until_the_file_changes(self):
+        self.path.write_text("spark\n")
+        self.assertEqual(self.cache.read(self.path, parse_upper), "SPARK")
+        self.assertEqual(self.cache.read(self.path, parse_upper), "SPARK")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        self.path.write_text("phoenixd\n")
+        self.assertEqual(self.cache.read(self.path, parse_upper), "PHOENIXD")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_atomic_replace_is_detected_by_inode(self):
+        self.path.write_text("spark")
+        stat = self.path.stat()
+        self.cache.read(self.path, parse_upper)
+        replacement = Path(self.tmp.name) / ".selected.tmp"
+        replacement.write_text("arkad")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        replacement.replace(self.path)
+        self.assertEqual(self.cache.read(self.path, parse_upper), "ARKAD")
+
+    def test_invalidate_catches_same_size_rewrite_within_mtime_tick(self):
+        self.path.write_text("spark")
+        stat = self.path.stat()
+        self.cache.read(self.path, parse_upper)
+        with open(self.path, "w") as handle:
+            handle.write("arkad")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self.cache.read(self.path, parse_upper), "SPARK")
+        self.cache.invalidate(self.path)
+        self.assertEqual(self.cache.read(self.path, parse_upper), "ARKAD")
+
+    def test_missing_files_and_parse_errors_return_default(self):
+        self.assertEqual(self.cache.read(self.path, parse_upper, default="none"), "none")
+        self.path.write_text("not a number")
+        self.assertIsNone(self.cache.read(self.path, parse_int))
+        self.assertEqual(self.cache.status()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
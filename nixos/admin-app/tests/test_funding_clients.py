@@ -0,0 +1,111 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+from fake_funding_server import FakeFundingServer
+from funding_clients import ArkadeClient, EventLoopThread, PhoenixdClient, SparkClient, gather_funding
+
+
+class UrllibResponse:
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self._body = body
+
+    def json(self):
+        return json.loads(self._body)
+
+
+def urllib_request(upstream, method, url, headers=None, auth=None, timeout=5):
+    req = urllib.request.Request(url, method=method, headers=headers or {}, data=b"" if method == "POST" else None)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return UrllibResponse(resp.status, resp.read())
+    except urllib.error.HTTPError as exc:
+        return UrllibResponse(exc.code, exc.read())
+
+
+class FundingClientsTest(unittest.TestCase):
+    def setUp(self):
+        self.servers = {
+            backend: FakeFundingServer(backend, latency=0.1).start()
+            for backend in ("spark", "ark", "phoenixd")
+        }
+        self.clients = {
+            "spark": SparkClient(self.servers["spark"].url, urllib_request),
+            "ark": ArkadeClient(self.servers["ark"].url, urllib_request),
+            "phoenixd": PhoenixdClient(self.servers["phoenixd"].url, urllib_request, password=lambda: "secret"),
+        }
+
+    def tearDown(self):
+        for server in self.servers.values():
+            server.stop()
+
+    def test_status_and_health_are_gathered_concurrently(self):
+        started = time.perf_counter()
+        status, health = asyncio.run(gather_funding(self.clients, "phoenixd", ["spark", "ark", "phoenixd"]))
+        self.assertLess(time.perf_counter() - started, 0.35)
+        self.assertEqual(status["balance"]["balance"], 245000)
+        self.assertEqual(status["channel_count"], 1)
+        self.assertEqual(status["liquidity"]["inbound_sat"], 1755000)
+        # getbalance, listchannels and getinfo; its health comes from those calls
+        self.assertEqual(self.servers["phoenixd"].requests, 3)
+        self.assertEqual(set(health), {"spark", "ark", "phoenixd"})
+        self.assertTrue(all(entry["ok"] and entry["latency_ms"] >= 100 for entry in health.values()))
+
+    def test_selected_sidecar_is_called_once_per_refresh(self):
+        status, health = asyncio.run(gather_funding(self.clients, "spark", ["spark", "ark"]))
+        self.assertEqual(status, {"balance": {"balance": 125000}})
+        self.assertEqual(self.servers["spark"].requests, 1)
+        self.assertEqual(self.servers["ark"].requests, 1)
+        self.assertTrue(health["spark"]["ok"])
+
+    def test_failed_status_call_marks_selected_backend_unhealthy(self):
+        url = self.servers["spark"].url
+        self.servers["spark"].stop()
+        clients = {**self.clients, "spark": SparkClient(url, urllib_request)}
+        status, health = asyncio.run(gather_funding(clients, "spark", ["spark"]))
+        self.assertEqual(status, {"balance": None})
+        self.assertFalse(health["spark"]["ok"])
+        self.assertIsNotNone(health["spark"]["error"])
+
+    def test_sidecar_balances(self):
+        self.assertEqual(asyncio.run(self.clients["spark"].balance()), {"balance": 125000})
+        self.assertEqual(asyncio.run(self.clients["ark"].status()), {
+            "balance": {"balance": 98000, "status": "ready"}, "mnemonic_missing": False,
+        })
+
+    def test_unreachable_backend_reports_unhealthy(self):
+        url = self.servers["spark"].url
+        self.servers["spark"].stop()
+        client = SparkClient(url, urllib_request)
+        self.assertIsNone(asyncio.run(client.balance()))
+        self.assertFalse(asyncio.run(client.health())["ok"])
+
+
+class EventLoopThreadTest(unittest.TestCase):
+    def test_reuses_one_loop_and_executor(self):
+        runner = EventLoopThread(name="test-loop", max_workers=2)
+
+        async def where():
+            return asyncio.get_running_loop(), await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        first_loop, first_thread = runner.run(where())
+        second_loop, second_thread = runner.run(where())
+        self.assertIs(first_loop, second_loop)
+        self.assertTrue(first_thread.startswith("test-loop-io"))
+        self.assertTrue(second_thread.startswith("test-loop-io"))
+
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            runner.run(fail())
+
+
+if __name__ == "__main__":
+    unittest.main()
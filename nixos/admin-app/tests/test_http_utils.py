@@ -0,0 +1,97 @@
+import unittest
+
+from http_utils import CircuitBreaker, CircuitOpenError, UpstreamClients
+from perf_utils import CallRecorder
+
+from fakes import FakeClock
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+        self.status_code = 200
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if self.fail:
+            raise ConnectionError("connection refused")
+        return FakeResponse(self.status_code)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_after_consecutive_failures_and_recovers_through_half_open(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=10, clock=clock)
+        breaker.record_failure("timeout")
+        self.assertTrue(breaker.allow())
+        breaker.record_failure("timeout")
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.status()["state"], "open")
+        self.assertEqual(breaker.status()["retry_in"], 10)
+
+        clock.now = 10
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_failure("timeout")
+        self.assertEqual(breaker.status()["state"], "open")
+
+        clock.now = 20
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.status(), {
+            "state": "closed", "failures": 0, "rejected": 2, "retry_in": None, "last_error": None,
+        })
+
+
+class UpstreamClientsTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sessions = []
+
+        def factory():
+            session = FakeSession()
+            self.sessions.append(session)
+            return session
+
+        self.recorder = CallRecorder()
+        self.clients = UpstreamClients(
+            self.recorder, session_factory=factory, failure_threshold=2, cooldown=30, clock=self.clock,
+        )
+        self.clients.configure("spark", timeout=(1, 5), breaker=True)
+
+    def test_reuses_one_session_per_upstream_with_default_timeout(self):
+        self.clients.request("spark", "POST", "http://127.0.0.1:8765/v1/balance")
+        self.clients.request("spark", "POST", "http://127.0.0.1:8765/v1/balance", timeout=2)
+        self.clients.request("github", "GET", "https://api.github.com/")
+        self.assertEqual(len(self.sessions), 2)
+        self.assertEqual([call[2]["timeout"] for call in self.sessions[0].calls], [(1, 5), 2])
+        self.assertEqual(self.recorder.summary()["http"][0]["count"], 2)
+
+    def test_fails_fast_while_open(self):
+        self.clients.request("spark", "GET", "http://127.0.0.1:8765/")
+        session = self.sessions[0]
+        session.fail = True
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                self.clients.request("spark", "GET", "http://127.0.0.1:8765/")
+        with self.assertRaises(CircuitOpenError):
+            self.clients.request("spark", "GET", "http://127.0.0.1:8765/")
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(self.clients.breakers()["spark"]["state"], "open")
+
+        session.fail = False
+        session.status_code = 503
+        self.clock.now = 30
+        self.clients.request("spark", "GET", "http://127.0.0.1:8765/")
+        self.assertEqual(self.clients.breakers("spark")["spark"]["last_error"], "HTTP 503")
+        self.assertEqual(self.clients.breakers("github"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from job_utils import JobConflictError, JobQueue
+
+
+class JobQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "jobs.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reports_progress_and_result(self):
+        release = threading.Event()
+        reported = threading.Event()
+
+        def backup(report):
+            report(40, "Archiving database")
+            reported.set()
+            release.wait(2)
+            return {"path": "/var/backups/box.zip"}
+
+        queue = JobQueue(self.path)
+        job = queue.submit("backup", backup, title="Backup")
+        self.assertTrue(reported.wait(2))
+        running = queue.get(job["id"])
+        self.assertEqual((running["status"], running["progress"], running["message"]), ("running", 40, "Archiving database"))
+
+        release.set()
+        done = queue.wait(job["id"], timeout=2)
+        self.assertEqual(done["status"], "succeeded")
+        self.assertEqual(done["progress"], 100)
+        self.assertEqual(done["result"], {"path": "/var/backups/box.zip"})
+
+    def test_failures_are_recorded(self):
+        def restore(report):
+            raise ValueError("Backup validation failed")
+
+        queue = JobQueue(self.path)
+        job = queue.wait(queue.submit("restore", restore)["id"], timeout=2)
+        self.assertEqual(job["status"], "failed")
+        self.assertEqual(job["error"], "Backup validation failed")
+
+    def test_limits_concurrency_per_kind(self):
+        release = threading.Event()
+        queue = JobQueue(self.path, limits={"backup": 1})
+        first = queue.submit("backup", lambda report: release.wait(2))
+        second = queue.submit("backup", lambda report: "second")
+        other = queue.submit("wifi_connect", lambda report: "other")
+
+        self.assertEqual(queue.wait(other["id"], timeout=2)["status"], "succeeded")
+        self.assertEqual(queue.get(second["id"])["status"], "queued")
+        release.set()
+        self.assertEqual(queue.wait(second["id"], timeout=2)["result"], "second")
+        self.assertEqual(queue.get(first["id"])["status"], "succeeded")
+
+    def test_exclusive_submit_conflicts_while_busy(self):
+        release = threading.Event()
+        queue = JobQueue(self.path)
+        job = queue.submit("update", lambda report: release.wait(2), exclusive=True)
+        with self.assertRaises(JobConflictError):
+            queue.submit("update", lambda report: None, exclusive=True)
+        release.set()
+        queue.wait(job["id"], timeout=2)
+        queue.wait(queue.submit("update", lambda report: None, exclusive=True)["id"], timeout=2)
+
+    def test_state_persists_and_running_jobs_load_as_interrupted(self):
+        release = threading.Event()
+        queue = JobQueue(self.path)
+        done = queue.wait(queue.submit("backup", lambda report: {"ok": True})["id"], timeout=2)
+        running = queue.submit("restore", lambda report: release.wait(2))
+
+        reloaded = JobQueue(self.path)
+        self.assertEqual(reloaded.get(done["id"])["result"], {"ok": True})
+        interrupted = reloaded.get(running["id"])
+        self.assertEqual(interrupted["status"], "interrupted")
+        self.assertIsNotNone(interrupted["finished_at"])
+        release.set()
+        queue.wait(running["id"], timeout=2)
+
+    def test_keeps_newest_finished_jobs(self):
+        queue = JobQueue(self.path, keep=2)
+        ids = [queue.wait(queue.submit("backup", lambda report: None)["id"], timeout=2)["id"] for _ in range(4)]
+        self.assertEqual([job["id"] for job in queue.jobs()], ids[:1:-1])
+        self.assertEqual(len(json.loads(self.path.read_text())["jobs"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
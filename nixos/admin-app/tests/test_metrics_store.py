@@ -0,0 +1,103 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from metrics_store import MetricsStore
+
+TIERS = (("raw", 30, 10), ("5m", 300, 10), ("1h", 3600, 10))
+
+
+class MetricsStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "metrics.ring"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_and_query_rollups(self):
+        store = MetricsStore(self.path, ("cpu", "temp"), TIERS)
+        start = 36000
+        for offset, cpu in ((0, 10), (30, 20), (60, 60)):
+            store.append(start + offset, {"cpu": cpu, "temp": None})
+
+        raw = store.query(start, start + 60, "raw")
+        self.assertEqual(raw["timestamps"], [36000, 36030, 36060])
+        self.assertEqual(raw["metrics"]["cpu"]["avg"], [10.0, 20.0, 60.0])
+        self.assertEqual(raw["metrics"]["temp"]["avg"], [None, None, None])
+
+        rollup = store.query(start, start + 60, "5m")
+        self.assertEqual(rollup["timestamps"], [36000])
+        self.assertEqual(rollup["metrics"]["cpu"]["min"], [10.0])
+        self.assertEqual(rollup["metrics"]["cpu"]["avg"], [30.0])
+        self.assertEqual(rollup["metrics"]["cpu"]["max"], [60.0])
+        store.close()
+
+    def test_intermittent_metric_averages_only_its_own_samples(self):
+        store = MetricsStore(self.path, ("a", "b"), TIERS)
+        start = 36000
+        for offset in range(10):
+            store.append(start + offset * 30, {"a": 1, "b": None})
+        store.append(start + 300, {"a": 1, "b": 100})
+        store.append(start + 330, {"a": 1, "b": 0})
+
+        rollup = store.query(start, start + 330, "1h")
+        self.assertEqual(rollup["metrics"]["a"]["avg"], [1.0])
+        self.assertEqual(rollup["metrics"]["b"]["min"], [0.0])
+        self.assertEqual(rollup["metrics"]["b"]["avg"], [50.0])
+        self.assertEqual(rollup["metrics"]["b"]["max"], [100.0])
+        store.close()
+
+    def test_version_1_file_is_migrated(self):
+        store = MetricsStore(self.path, ("cpu",), TIERS, format_version=1)
+        store.append(3600, {"cpu": 10})
+        store.append(3630, {"cpu": 20})
+        store.close()
+
+        migrated = MetricsStore(self.path, ("cpu",), TIERS)
+        migrated.append(3660, {"cpu": 60})
+        self.assertEqual(migrated.query(3600, 3660, "5m")["metrics"]["cpu"]["avg"], [30.0])
+        migrated.close()
+
+    def test_data_survives_reopen(self):
+        store = MetricsStore(self.path, ("cpu",), TIERS)
+        store.append(7200, {"cpu": 42})
+        store.close()
+
+        reopened = MetricsStore(self.path, ("cpu",), TIERS)
+        self.assertEqual(reopened.query(7200, 7200, "raw")["metrics"]["cpu"]["avg"], [42.0])
+        reopened.close()
+
+    def test_ring_overwrites_oldest_slot_at_constant_size(self):
+        store = MetricsStore(self.path, ("cpu",), TIERS)
+        size = self.path.stat().st_size
+        for index in range(15):
+            store.append(index * 30, {"cpu": index})
+        result = store.query(0, 14 * 30, "raw")
+        self.assertEqual(result["timestamps"], [index * 30 for index in range(5, 15)])
+        self.assertEqual(self.path.stat().st_size, size)
+        store.close()
+
+    def test_reopen_with_new_metric_migrates_existing_series(self):
+        store = MetricsStore(self.path, ("cpu",), TIERS)
+        store.append(3600, {"cpu": 5})
+        store.close()
+
+        migrated = MetricsStore(self.path, ("cpu", "ram"), TIERS)
+        result = migrated.query(3600, 3600, "raw")
+        self.assertEqual(result["metrics"]["cpu"]["avg"], [5.0])
+        self.assertEqual(result["metrics"]["ram"]["avg"], [None])
+        migrated.close()
+
+    def test_auto_resolution_picks_coarser_tier_for_long_ranges(self):
+        store = MetricsStore(self.path, ("cpu",), TIERS)
+        self.assertEqual(store.tier_for(0, 200)[0], "raw")
+        self.assertEqual(store.tier_for(0, 2000)[0], "5m")
+        self.assertEqual(store.tier_for(0, 20000)[0], "1h")
+        with self.assertRaises(ValueError):
+            store.tier_for(0, 10, "1d")
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import socket
+import struct
+import unittest
+
+from netlink_utils import (
+    IFA_LOCAL,
+    IFF_LOWER_UP,
+    IFF_UP,
+    IFLA_IFNAME,
+    IFLA_OPERSTATE,
+    NLMSG_DONE,
+    RTM_DELADDR,
+    RTM_NEWADDR,
+    RTM_NEWLINK,
+    NetlinkMonitor,
+    NetworkState,
+    ReachabilityProbe,
+    parse_messages,
+)
+
+from fakes import FakeClock
+
+
+def rtattr(attr_type: int, value: bytes) -> bytes:
+    raw = struct.pack("=HH", 4 + len(value), attr_type) + value
+    return raw + b"\0" * ((4 - len(raw) % 4) % 4)
+
+
+def nlmsg(msg_type: int, payload: bytes) -> bytes:
+    raw = struct.pack("=IHHII", 16 + len(payload), msg_type, 0, 0, 0) + payload
+    return raw + b"\0" * ((4 - len(raw) % 4) % 4)
+
+
+def link_payload(index: int, name: str, flags: int, operstate: int) -> bytes:
+    return (
+        struct.pack("=BxHiII", socket.AF_UNSPEC, 1, index, flags, 0)
+        + rtattr(IFLA_IFNAME, name.encode() + b"\0")
+        + rtattr(IFLA_OPERSTATE, bytes([operstate]))
+    )
+
+
+def addr_payload(index: int, address: str, prefixlen: int = 24) -> bytes:
+    return struct.pack("=BBBBI", socket.AF_INET, prefixlen, 0, 0, index) + rtattr(IFA_LOCAL, socket.inet_aton(address))
+
+
+class NetworkStateTest(unittest.TestCase):
+    def test_applies_link_and_address_events(self):
+        state = NetworkState()
+        datagram = (
+            nlmsg(RTM_NEWLINK, link_payload(2, "eth0", IFF_UP | IFF_LOWER_UP, 6))
+            + nlmsg(RTM_NEWADDR, addr_payload(2, "192.168.1.50"))
+        )
+        changed = set()
+        for msg_type, payload in parse_messages(datagram):
+            changed |= state.apply(msg_type, payload)
+        self.assertEqual(changed, {"eth0"})
+        self.assertEqual(state.interfaces()["eth0"], {
+            "index": 2, "name": "eth0", "up": True, "carrier": True, "operstate": "up",
+            "ipv4": ["192.168.1.50"], "ipv6": [],
+        })
+
+        version = state.version
+        self.assertEqual(state.apply(RTM_NEWADDR, addr_payload(2, "192.168.1.50")), set())
+        self.assertEqual(state.version, version)
+
+        self.assertEqual(state.apply(RTM_NEWLINK, link_payload(2, "eth0", IFF_UP, 2)), {"eth0"})
+        self.assertEqual(state.apply(RTM_DELADDR, addr_payload(2, "192.168.1.50")), {"eth0"})
+        self.assertEqual(state.interfaces()["eth0"]["carrier"], False)
+        self.assertEqual(state.interfaces()["eth0"]["ipv4"], [])
+
+    def test_sync_replaces_tables_with_the_dump(self):
+        state = NetworkState()
+        state.apply(RTM_NEWLINK, link_payload(2, "eth0", IFF_UP | IFF_LOWER_UP, 6))
+        state.apply(RTM_NEWADDR, addr_payload(2, "192.168.1.50"))
+        state.apply(RTM_NEWLINK, link_payload(3, "wlan0", IFF_UP | IFF_LOWER_UP, 6))
+
+        # While disconnected: eth0 moved to a new address and wlan0 disappeared
+        changed = state.sync([
+            (RTM_NEWLINK, link_payload(2, "eth0", IFF_UP | IFF_LOWER_UP, 6)),
+            (RTM_NEWADDR, addr_payload(2, "192.168.1.77")),
+        ])
+        self.assertEqual(changed, {"eth0", "wlan0"})
+        self.assertEqual(list(state.interfaces()), ["eth0"])
+        self.assertEqual(state.interfaces()["eth0"]["ipv4"], ["192.168.1.77"])
+
+        version = state.version
+        self.assertEqual(state.sync([
+            (RTM_NEWLINK, link_payload(2, "eth0", IFF_UP | IFF_LOWER_UP, 6)),
+            (RTM_NEWADDR, addr_payload(2, "192.168.1.77")),
+        ]), set())
+        self.assertEqual(state.version, version)
+
+
+class FakeNetlinkSocket:
+    def __init__(self, datagrams):
+        self.datagrams = list(datagrams)
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def recv(self, size):
+        return self.datagrams.pop(0)
+
+
+class NetlinkMonitorTest(unittest.TestCase):
+    def test_resync_rebuilds_state_from_link_and_address_dumps(self):
+        state = NetworkState()
+        state.apply(RTM_NEWLINK, link_payload(3, "wlan0", IFF_UP | IFF_LOWER_UP, 6))
+        notified = []
+        monitor = NetlinkMonitor(state, on_change=notified.append)
+        sock = FakeNetlinkSocket([
+            nlmsg(RTM_NEWLINK, link_payload(2, "eth0", IFF_UP | IFF_LOWER_UP, 6)) + nlmsg(NLMSG_DONE, b""),
+            nlmsg(RTM_NEWADDR, addr_payload(2, "10.0.0.5")),
+            nlmsg(NLMSG_DONE, b""),
+        ])
+        monitor._resync(sock)
+        self.assertEqual(len(sock.sent), 2)
+        self.assertEqual(notified, [{"eth0", "wlan0"}])
+        self.assertEqual(state.interfaces()["eth0"]["ipv4"], ["10.0.0.5"])
+        self.assertNotIn("wlan0", state.interfaces())
+
+
+class ReachabilityProbeTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.reachable = True
+        self.attempts = []
+
+        def connect(address, timeout):
+            self.attempts.append(address)
+            if not self.reachable:
+                raise OSError("unreachable")
+            return socket.socket()
+
+        self.probe = ReachabilityProbe(
+            (("1.1.1.1", 53), ("9.9.9.9", 53)), clock=self.clock, connect=connect,
+            up_interval=60, min_backoff=5, max_backoff=20,
+        )
+
+    def test_results_are_cached_until_due(self):
+        self.assertTrue(self.probe.check()["internet"])
+        self.clock.now += 30
+        self.probe.check()
+        self.assertEqual(len(self.attempts), 1)
+        self.clock.now += 30
+        self.probe.check()
+        self.assertEqual(len(self.attempts), 2)
+
+    def test_failures_back_off_and_reset_rechecks(self):
+        self.reachable = False
+        self.assertFalse(self.probe.check()["internet"])
+        self.assertEqual(self.attempts, [("1.1.1.1", 53), ("9.9.9.9", 53)])
+        self.clock.now += 5
+        self.probe.check()
+        self.clock.now += 5
+        self.probe.check()
+        self.assertEqual(len(self.attempts), 4)
+        self.clock.now += 5
+        self.probe.check()
+        self.assertEqual(len(self.attempts), 6)
+
+        self.reachable = True
+        self.probe.reset()
+        self.assertTrue(self.probe.check()["internet"])
+
+
+if __name__ == "__main__":
+    unittest.main()
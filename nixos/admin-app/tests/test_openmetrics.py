@@ -0,0 +1,52 @@
+import unittest
+
+from openmetrics import Histogram, MetricsWriter
+
+
+class HistogramTest(unittest.TestCase):
+    def test_buckets_are_cumulative_per_label_set(self):
+        histogram = Histogram(("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            histogram.observe(("/box/api/stats",), value)
+        histogram.observe(("/box/metrics",), 0.01)
+        samples = histogram.samples()
+        self.assertEqual(samples[0][0], {"route": "/box/api/stats"})
+        self.assertEqual(samples[0][1], [1, 2])
+        self.assertEqual(samples[0][2], 3)
+        self.assertAlmostEqual(samples[0][3], 2.55)
+        self.assertEqual(samples[1][1:3], ([1, 1], 1))
+
+
+class MetricsWriterTest(unittest.TestCase):
+    def test_render_families(self):
+        writer = MetricsWriter(prefix="lnbitsbox_")
+        writer.gauge("cpu_percent", "CPU usage", 12.5)
+        writer.gauge("unit_active", "Unit is active", True, {"unit": "lnbits"})
+        writer.gauge("unit_active", "Unit is active", None, {"unit": "tor"})
+        writer.counter("unit_restarts", "Restarts", 3, {"unit": 'we"ird'})
+        histogram = Histogram(("probe",), buckets=(0.5,))
+        histogram.observe(("cpu",), 0.25)
+        writer.histogram("probe_duration_seconds", "Probe duration", histogram)
+
+        self.assertEqual(writer.render(), "\n".join([
+            "# TYPE lnbitsbox_cpu_percent gauge",
+            "# HELP lnbitsbox_cpu_percent CPU usage",
+            "lnbitsbox_cpu_percent 12.5",
+            "# TYPE lnbitsbox_unit_active gauge",
+            "# HELP lnbitsbox_unit_active Unit is active",
+            'lnbitsbox_unit_active{unit="lnbits"} 1',
+            "# TYPE lnbitsbox_unit_restarts counter",
+            "# HELP lnbitsbox_unit_restarts Restarts",
+            'lnbitsbox_unit_restarts_total{unit="we\\"ird"} 3',
+            "# TYPE lnbitsbox_probe_duration_seconds histogram",
+            "# HELP lnbitsbox_probe_duration_seconds Probe duration",
+            'lnbitsbox_probe_duration_seconds_bucket{probe="cpu",le="0.5"} 1',
+            'lnbitsbox_probe_duration_seconds_bucket{probe="cpu",le="+Inf"} 1',
+            'lnbitsbox_probe_duration_seconds_count{probe="cpu"} 1',
+            'lnbitsbox_probe_duration_seconds_sum{probe="cpu"} 0.25',
+            "# EOF",
+        ]) + "\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from perf_utils import CallRecorder, LatencyWindow, command_label, health_state, server_timing_header
+
+
+class CommandLabelTest(unittest.TestCase):
+    def test_labels(self):
+        self.assertEqual(command_label(["systemctl", "--no-pager", "restart", "lnbits.service"]), "systemctl restart")
+        self.assertEqual(command_label(["/run/current-system/sw/bin/ip", "-j", "addr", "show"]), "ip addr")
+        self.assertEqual(command_label(["wpa_cli", "-p", "/run/wpa_supplicant", "-i", "wlan0", "status"]), "wpa_cli status")
+        self.assertEqual(command_label(["journalctl", "--no-pager", "-u", "lnbits.service", "-n", "50"]), "journalctl")
+        self.assertEqual(command_label("ping -c 1 1.1.1.1"), "ping")
+        self.assertEqual(command_label([]), "unknown")
+
+
+class CallRecorderTest(unittest.TestCase):
+    def test_summary_counts_errors_and_percentiles(self):
+        recorder = CallRecorder(window=4)
+        for seconds in (0.01, 0.02, 0.03, 0.04, 0.05):
+            recorder.record("http", "spark", seconds)
+        recorder.record("subprocess", "ping", 0.001, error=True)
+
+        summary = recorder.summary()
+        spark = summary["http"][0]
+        self.assertEqual((spark["name"], spark["count"], spark["errors"]), ("spark", 5, 0))
+        self.assertEqual(spark["max_ms"], 50.0)
+        self.assertEqual(spark["p50_ms"], 40.0)
+        self.assertEqual(summary["subprocess"][0]["errors"], 1)
+
+    def test_time_call_records_exceptions(self):
+        recorder = CallRecorder()
+
+        def broken():
+            raise TimeoutError("sidecar")
+
+        with self.assertRaises(TimeoutError):
+            recorder.time_call("http", "arkade", broken)
+        self.assertEqual(recorder.time_call("http", "arkade", lambda value: value, 3), 3)
+        row = recorder.summary()["http"][0]
+        self.assertEqual((row["count"], row["errors"]), (2, 1))
+
+    def test_request_spans_exclude_routes(self):
+        recorder = CallRecorder()
+        recorder.record("subprocess", "ping", 0.5)
+        recorder.begin()
+        recorder.record("subprocess", "systemctl show", 0.25)
+        recorder.record("route", "/box/api/stats", 1.0)
+        spans = recorder.end()
+        self.assertEqual(spans, {"subprocess": (0.25, 1)})
+        self.assertEqual(
+            server_timing_header(0.3, spans),
+            'app;dur=300.0, subprocess;dur=250.0;desc="1 call"',
+        )
+
+
+class HealthStateTest(unittest.TestCase):
+    def test_answered_probes(self):
+        self.assertEqual(health_state(200, 50, slow_ms=1000), "running")
+        self.assertEqual(health_state(200, 1500, slow_ms=1000), "slow")
+        self.assertEqual(health_state(503, None, slow_ms=1000), "starting")
+        self.assertEqual(health_state(500, None, slow_ms=1000), "error")
+
+    def test_timeout_is_slow_only_while_the_unit_is_active(self):
+        self.assertEqual(health_state(None, None, slow_ms=1000, unit_active=True, timed_out=True), "slow")
+        self.assertEqual(health_state(None, None, slow_ms=1000, unit_active=False, timed_out=True), "stopped")
+        self.assertEqual(health_state(None, None, slow_ms=1000, unit_active=True), "stopped")
+
+    def test_open_breaker_keeps_the_state_that_tripped_it(self):
+        states = []
+        previous = None
+        for code, timed_out, breaker_open in ((503, False, False),) * 3 + ((None, False, True),) * 2:
+            previous = health_state(code, None, slow_ms=1000, unit_active=code is None,
+                                    timed_out=timed_out, breaker_open=breaker_open, previous=previous)
+            states.append(previous)
+        self.assertEqual(states, ["starting"] * 5)
+
+        self.assertEqual(health_state(None, None, slow_ms=1000, unit_active=True, breaker_open=True, previous="slow"), "slow")
+        self.assertEqual(health_state(None, None, slow_ms=1000, unit_active=True, breaker_open=True, previous="running"), "slow")
+        self.assertEqual(health_state(None, None, slow_ms=1000, unit_active=False, breaker_open=True, previous="slow"), "stopped")
+
+
+class LatencyWindowTest(unittest.TestCase):
+    def test_percentiles_cover_only_the_window(self):
+        now = [0.0]
+        window = LatencyWindow(60, clock=lambda: now[0])
+        self.assertEqual(window.summary()["p95_ms"], None)
+        window.add(5000)
+        now[0] = 61
+        for ms in range(1, 21):
+            window.add(ms * 10)
+        self.assertEqual(window.summary(), {"count": 20, "p50_ms": 110, "p95_ms": 200, "max_ms": 200})
+
+
+if __name__ == "__main__":
+    unittest.main()
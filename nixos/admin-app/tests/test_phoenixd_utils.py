@@ -0,0 +1,27 @@
+import unittest
+
+from phoenixd_utils import liquidity_summary, normalize_channels
+
+
+class NormalizeChannelsTest(unittest.TestCase):
+    def test_normalizes_sat_and_msat_fields_and_sums_active_liquidity(self):
+        channels = normalize_channels([
+            {"channelId": "abc", "state": "Normal", "balanceSat": 40000, "inboundLiquiditySat": 60000, "capacitySat": 100000},
+            {"id": "def", "state": "NORMAL", "toLocal": 5000000, "capacitySat": 20000},
+            {"channelId": "ghi", "state": "Closing", "balanceSat": 1000, "capacitySat": 2000},
+        ])
+        self.assertEqual(channels[1], {
+            "id": "def", "state": "NORMAL", "active": True,
+            "capacity_sat": 20000, "outbound_sat": 5000, "inbound_sat": 15000,
+        })
+        self.assertEqual(liquidity_summary(channels), {
+            "active_channels": 2, "outbound_sat": 45000, "inbound_sat": 75000, "capacity_sat": 120000,
+        })
+
+    def test_falls_back_to_getinfo_channels(self):
+        channels = normalize_channels(None, {"nodeId": "02ab", "channels": [{"channelId": "x", "state": "Normal"}]})
+        self.assertEqual([channel["id"] for channel in channels], ["x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
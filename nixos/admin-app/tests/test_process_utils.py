@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from process_utils import ProcessSampler, read_proc_cpu_seconds
+
+from fakes import FakeClock
+
+
+def proc_stat(utime: int, stime: int) -> str:
+    # comm may contain spaces and parentheses; fields after it start with state
+    return f"812 (python3 (lnbits)) S 1 812 812 0 -1 4194560 1 0 0 0 {utime} {stime} 0 0 20 0 4 0\n"
+
+
+class ProcessSamplerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.proc = root / "proc"
+        self.cgroup = root / "cgroup"
+        pid_dir = self.proc / "812"
+        (pid_dir / "fd").mkdir(parents=True)
+        for fd in range(3):
+            (pid_dir / "fd" / str(fd)).write_text("")
+        (pid_dir / "status").write_text("Name:\tpython3\nVmRSS:\t  2048 kB\nThreads:\t4\n")
+        (pid_dir / "stat").write_text(proc_stat(100, 50))
+        self.unit_cgroup = self.cgroup / "system.slice" / "lnbits.service"
+        self.unit_cgroup.mkdir(parents=True)
+        self.clock = FakeClock(50.0)
+        self.sampler = ProcessSampler(
+            proc_root=self.proc, cgroup_root=self.cgroup, clock=self.clock, cpu_count=2, clock_ticks=100
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reads_proc_stat_after_comm_with_parentheses(self):
+        self.assertEqual(read_proc_cpu_seconds(self.proc / "812", 100), 1.5)
+
+    def test_cgroup_cpu_delta_as_share_of_all_cores(self):
+        (self.unit_cgroup / "cpu.stat").write_text("usage_usec 1000000\nuser_usec 800000\n")
+        first = self.sampler.sample_unit("lnbits", 812, "/system.slice/lnbits.service")
+        self.assertIsNone(first["cpu_percent"])
+        self.assertEqual(first["source"], "cgroup")
+        self.assertEqual((first["rss"], first["fds"], first["threads"]), (2048 * 1024, 3, 4))
+
+        self.clock.now += 10
+        (self.unit_cgroup / "cpu.stat").write_text("usage_usec 6000000\n")
+        second = self.sampler.sample_unit("lnbits", 812, "/system.slice/lnbits.service")
+        self.assertEqual(second["cpu_percent"], 25.0)
+
+    def test_proc_fallback_resets_when_main_pid_changes(self):
+        self.sampler.sample_unit("lnbits", 812)
+        self.clock.now += 1
+        (self.proc / "812" / "stat").write_text(proc_stat(150, 50))
+        self.assertEqual(self.sampler.sample_unit("lnbits", 812)["cpu_percent"], 25.0)
+        self.clock.now += 1
+        restarted = self.sampler.sample_unit("lnbits", 999)
+        self.assertIsNone(restarted["cpu_percent"])
+        self.assertEqual(restarted["source"], "none")
+
+    def test_stopped_unit_reports_empty_sample(self):
+        sample = self.sampler.sample({"tor": {"main_pid": None, "control_group": None}})["tor"]
+        self.assertEqual(sample, {
+            "pid": None, "cpu_percent": None, "rss": None, "fds": None, "threads": None, "source": "none",
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
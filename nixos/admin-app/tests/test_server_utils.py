@@ -0,0 +1,127 @@
+import unittest
+from types import SimpleNamespace
+
+from fakes import FakeClock
+from server_utils import WaitressRunner
+
+
+class FakeChannel:
+    def __init__(self, pending_polls=0):
+        self.requests = ["request"] if pending_polls else []
+        self.pending_polls = pending_polls
+        self.close_when_flushed = False
+
+
+class FakeServer:
+    """Just the waitress internals WaitressRunner touches"""
+
+    def __init__(self, channels=()):
+        self._map = {}
+        self.adj = SimpleNamespace(asyncore_loop_timeout=1, asyncore_use_poll=True)
+        self.active_channels = {index: channel for index, channel in enumerate(channels)}
+        self.accepting = True
+        self.listener_closed = False
+        self.closed = False
+        self.shutdown_timeout = None
+        self.socket = SimpleNamespace(close=self._close_listener)
+        self.task_dispatcher = SimpleNamespace(shutdown=self._shutdown)
+
+    def _close_listener(self):
+        self.listener_closed = True
+
+    def _shutdown(self, timeout=5):
+        self.shutdown_timeout = timeout
+
+    def del_channel(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeLoop:
+    """Each poll finishes one step of every busy channel and closes flushed idle ones"""
+
+    def __init__(self, server, clock, step=0.5):
+        self.server = server
+        self.clock = clock
+        self.step = step
+        self.polls = 0
+
+    def __call__(self, timeout, map, use_poll, count):
+        self.polls += 1
+        self.clock.now += self.step
+        for key, channel in list(self.server.active_channels.items()):
+            if channel.requests:
+                channel.pending_polls -= 1
+                if channel.pending_polls <= 0:
+                    channel.requests = []
+            elif channel.close_when_flushed:
+                del self.server.active_channels[key]
+
+
+class WaitressRunnerTest(unittest.TestCase):
+    def test_drain_flushes_busy_channels_before_closing(self):
+        clock = FakeClock()
+        server = FakeServer([FakeChannel(), FakeChannel(pending_polls=3)])
+        loop = FakeLoop(server, clock)
+        drained = []
+        runner = WaitressRunner(server, loop=loop, clock=clock)
+
+        self.assertTrue(runner.drain(10, on_drain=lambda: drained.append(server.listener_closed)))
+        self.assertEqual(drained, [True])
+        self.assertFalse(server.accepting)
+        self.assertEqual(server.active_channels, {})
+        self.assertEqual(loop.polls, 4)
+        self.assertTrue(server.closed)
+        self.assertEqual(server.shutdown_timeout, 8.0)
+
+    def test_drain_gives_up_at_the_timeout(self):
+        clock = FakeClock()
+        server = FakeServer([FakeChannel(pending_polls=100)])
+        runner = WaitressRunner(server, loop=FakeLoop(server, clock), clock=clock)
+
+        self.assertTrue(runner.drain(2))
+        self.assertEqual(len(server.active_channels), 1)
+        self.assertTrue(server.closed)
+        self.assertEqual(server.shutdown_timeout, 0.0)
+
+    def test_missing_internals_fall_back_to_a_plain_close(self):
+        server = FakeServer([FakeChannel(pending_polls=1)])
+        del server._map
+        runs = []
+        server.run = lambda: runs.append(True)
+        drained = []
+        runner = WaitressRunner(server, loop=lambda **kwargs: self.fail("loop must not be used"), clock=FakeClock())
+
+        self.assertFalse(runner.supported)
+        runner.run()
+        self.assertEqual(runs, [True])
+        with self.assertRaises(KeyboardInterrupt):
+            runner.stop()
+        self.assertFalse(runner.drain(5, on_drain=lambda: drained.append(True)))
+        self.assertEqual(drained, [True])
+        self.assertFalse(server.listener_closed)
+        self.assertTrue(server.closed)
+
+    def test_channel_without_request_attributes_is_left_to_finish(self):
+        clock = FakeClock()
+        server = FakeServer([SimpleNamespace()])
+
+        def loop(**kwargs):
+            clock.now += 0.5
+
+        runner = WaitressRunner(server, loop=loop, clock=clock)
+        self.assertTrue(runner.drain(1))
+        self.assertFalse(hasattr(server.active_channels[0], "close_when_flushed"))
+        self.assertTrue(server.closed)
+
+    def test_run_polls_until_stopped(self):
+        server = FakeServer()
+        runner = WaitressRunner(server, loop=lambda **kwargs: runner.stop(), clock=FakeClock())
+        runner.run()
+        self.assertTrue(runner._stopping.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
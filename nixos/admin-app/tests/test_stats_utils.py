@@ -0,0 +1,296 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from stats_utils import (
+    ColumnarHistory, ProbeScheduler, SingleFlight, StaleWhileRevalidate, gather_sections,
+    parse_duration,
+)
+
+from fakes import FakeClock
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_callers_share_one_run(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def probe():
+            calls.append(1)
+            release.wait(2)
+            return {"ok": True}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("stats", probe))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        self.assertTrue(flight.in_flight("stats"))
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"ok": True}] * 5)
+        self.assertFalse(flight.in_flight("stats"))
+
+    def test_error_propagates_and_next_call_reruns(self):
+        flight = SingleFlight()
+
+        def broken():
+            raise RuntimeError("probe failed")
+
+        with self.assertRaises(RuntimeError):
+            flight.do("stats", broken)
+        self.assertEqual(flight.do("stats", lambda: 2), 2)
+
+
+class ProbeSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(1000.0)
+        self.scheduler = ProbeScheduler(clock=self.clock)
+        self.counts = {"cpu": 0, "network": 0}
+
+        def cpu():
+            self.counts["cpu"] += 1
+            return 12.5
+
+        def network():
+            self.counts["network"] += 1
+            return {"internet": True}
+
+        self.scheduler.register("cpu", cpu, interval=5, timeout=1, cost="cheap", default=0)
+        self.scheduler.register("network", network, interval=60, timeout=10, cost="expensive")
+
+    def test_probes_run_on_their_own_interval(self):
+        self.assertEqual(sorted(self.scheduler.run_due()), ["cpu", "network"])
+        self.clock.now += 5
+        self.assertEqual(self.scheduler.run_due(), ["cpu"])
+        self.clock.now += 55
+        self.assertEqual(sorted(self.scheduler.run_due()), ["cpu", "network"])
+        self.assertEqual(self.counts, {"cpu": 3, "network": 2})
+        self.assertEqual(self.scheduler.values(), {"cpu": 12.5, "network": {"internet": True}})
+
+    def test_force_runs_selected_or_all_probes(self):
+        self.scheduler.run_due()
+        self.clock.now += 1
+        self.assertEqual(self.scheduler.run_due(force=["network"]), ["network"])
+        self.assertEqual(sorted(self.scheduler.run_due(force=True)), ["cpu", "network"])
+
+    def test_expire_makes_probe_due(self):
+        self.scheduler.run_due()
+        self.scheduler.expire("network", "unknown")
+        self.assertEqual(self.scheduler.run_due(), ["network"])
+
+    def test_failure_keeps_previous_value_and_records_error(self):
+        self.scheduler.run_due()
+
+        def broken():
+            raise RuntimeError("sidecar down")
+
+        self.scheduler.register("balance", broken, interval=60, timeout=5, cost="expensive", default={"balance": 1})
+        self.scheduler.run_due(force=["balance"])
+        status = self.scheduler.status()["balance"]
+        self.assertEqual(self.scheduler.values()["balance"], {"balance": 1})
+        self.assertEqual(status["error"], "sidecar down")
+        self.assertEqual(status["runs"], 1)
+        self.assertEqual(status["cost"], "expensive")
+        self.assertIsNotNone(status["last_duration_ms"])
+
+    def test_observer_sees_every_run(self):
+        runs = []
+        scheduler = ProbeScheduler(clock=self.clock, observer=lambda *args: runs.append(args))
+        scheduler.register("cpu", lambda: 1, interval=5, timeout=1, cost="cheap")
+        scheduler.run_due()
+        self.assertEqual(runs, [("cpu", 0.0, None)])
+
+    def test_rejects_unknown_cost_class(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.register("x", lambda: 1, interval=1, timeout=1, cost="free")
+
+
+class ConcurrentProbeTest(unittest.TestCase):
+    def test_probes_run_in_parallel(self):
+        scheduler = ProbeScheduler(deadline=2)
+        for name in ("a", "b", "c"):
+            scheduler.register(name, lambda name=name: time.sleep(0.2) or name, interval=60, timeout=1, cost="moderate")
+        started = time.monotonic()
+        self.assertEqual(sorted(scheduler.run_due()), ["a", "b", "c"])
+        self.assertLess(time.monotonic() - started, 0.5)
+        scheduler.shutdown()
+
+    def test_late_probe_keeps_last_value_marked_stale(self):
+        scheduler = ProbeScheduler(deadline=0.1)
+        release = threading.Event()
+        scheduler.register("cpu", lambda: 5, interval=60, timeout=1, cost="cheap")
+        scheduler.register("balance", lambda: release.wait(2) and 100, interval=60, timeout=15,
+                           cost="expensive", default=42)
+
+        self.assertEqual(scheduler.run_due(), ["cpu"])
+        self.assertEqual(scheduler.values(), {"cpu": 5, "balance": 42})
+        self.assertEqual(scheduler.stale(), ["balance"])
+        self.assertTrue(scheduler.status()["balance"]["in_flight"])
+        self.assertEqual(scheduler.run_due(force=True), ["cpu"])
+
+        release.set()
+        for _ in range(100):
+            if not scheduler.stale():
+                break
+            time.sleep(0.01)
+        self.assertEqual(scheduler.values()["balance"], 100)
+        self.assertFalse(scheduler.status()["balance"]["stale"])
+        scheduler.shutdown()
+
+
+class StaleWhileRevalidateTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(1000.0)
+        self.loads = 0
+        self.fail = False
+        self.spawned = []
+
+        def loader():
+            self.loads += 1
+            if self.fail:
+                raise RuntimeError("sidecar down")
+            return self.loads
+
+        self.cache = StaleWhileRevalidate(
+            loader, refresh_after=10, max_age=30, clock=self.clock, spawn=self.spawned.append,
+        )
+
+    def test_serves_stale_value_while_refreshing_in_background(self):
+        self.assertEqual(self.cache.get(), 1)
+        self.clock.now += 15
+        self.assertEqual(self.cache.get(), 1)
+        self.assertEqual(len(self.spawned), 1)
+        self.spawned.pop()()
+        self.assertEqual(self.cache.get(), 2)
+        self.assertEqual(self.cache.status()["age"], 0)
+
+        self.cache.invalidate()
+        self.assertEqual(self.cache.get(), 2)
+        self.assertEqual(len(self.spawned), 1)
+
+    def test_too_old_values_refresh_inline_and_failures_keep_previous(self):
+        self.cache.get()
+        self.clock.now += 31
+        self.assertEqual(self.cache.get(), 2)
+        self.fail = True
+        self.clock.now += 31
+        self.assertEqual(self.cache.get(), 2)
+        self.assertEqual(self.cache.status()["error"], "sidecar down")
+        with self.assertRaises(RuntimeError):
+            self.cache.refresh()
+
+    def test_clear_loads_inline_on_next_get(self):
+        self.assertEqual(self.cache.get(), 1)
+        self.cache.clear()
+        self.assertEqual(self.cache.get(), 2)
+        self.assertEqual(self.spawned, [])
+
+    def test_clear_discards_a_load_that_started_before_it(self):
+        release, started = threading.Event(), threading.Event()
+        sources = ["spark"]
+
+        def loader():
+            source = sources[0]
+            if source == "spark":
+                started.set()
+                release.wait(2)
+            return source
+
+        cache = StaleWhileRevalidate(loader, refresh_after=10, max_age=30)
+        old = threading.Thread(target=cache.refresh)
+        old.start()
+        self.assertTrue(started.wait(2))
+        sources[0] = "phoenixd"
+        cache.clear()
+        self.assertEqual(cache.get(), "phoenixd")
+        release.set()
+        old.join(2)
+        self.assertEqual(cache.get(), "phoenixd")
+
+class GatherSectionsTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.pool.shutdown(wait=True)
+
+    def test_sections_run_concurrently(self):
+        def section(name):
+            return lambda: (time.sleep(0.2), name)[1]
+
+        started = time.monotonic()
+        results = gather_sections({name: section(name) for name in ("stats", "tunnel", "recovery")}, self.pool, 2)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(results["tunnel"], {"status": "ok", "data": "tunnel"})
+        self.assertEqual(results["stats"]["data"], "stats")
+
+    def test_errors_and_late_sections_are_reported_per_section(self):
+        release = threading.Event()
+
+        def broken():
+            raise RuntimeError("github unreachable")
+
+        results = gather_sections({"ok": lambda: 1, "broken": broken, "slow": lambda: release.wait(2)}, self.pool, 0.1)
+        release.set()
+        self.assertEqual(results, {
+            "ok": {"status": "ok", "data": 1},
+            "broken": {"status": "error", "error": "github unreachable"},
+            "slow": {"status": "pending"},
+        })
+
+
+class ParseDurationTest(unittest.TestCase):
+    def test_units(self):
+        self.assertIsNone(parse_duration(""))
+        self.assertEqual(parse_duration("90"), 90)
+        self.assertEqual(parse_duration("15m"), 900)
+        self.assertEqual(parse_duration("24h"), 86400)
+        self.assertEqual(parse_duration("7d"), 604800)
+
+    def test_rejects_garbage(self):
+        for value in ("abc", "-5m", "0", "inf", "nan", "1e400h"):
+            with self.assertRaises(ValueError):
+                parse_duration(value)
+
+
+class ColumnarHistoryTest(unittest.TestCase):
+    def test_columns_are_ordered_oldest_first_after_wraparound(self):
+        history = ColumnarHistory({"timestamp": "d", "cpu": "d"}, 3)
+        self.assertEqual(history.columns(), {"timestamp": [], "cpu": []})
+        for index in range(5):
+            history.append({"timestamp": 100 + index, "cpu": index * 10})
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.appended, 5)
+        self.assertEqual(history.columns(), {"timestamp": [102.0, 103.0, 104.0], "cpu": [20.0, 30.0, 40.0]})
+        self.assertEqual(history.columns(["cpu"], last=2), {"cpu": [30.0, 40.0]})
+        self.assertEqual(history.latest(), {"timestamp": 104.0, "cpu": 40.0})
+
+    def test_since_returns_only_new_samples_or_resets(self):
+        history = ColumnarHistory({"cpu": "d"}, 3)
+        for value in (1, 2):
+            history.append({"cpu": value})
+        cursor = history.appended
+        self.assertEqual(history.since(cursor), ({"cpu": []}, False))
+        history.append({"cpu": 3})
+        self.assertEqual(history.since(cursor), ({"cpu": [3.0]}, False))
+        self.assertEqual(history.since(None), ({"cpu": [1.0, 2.0, 3.0]}, True))
+        self.assertEqual(history.since(99), ({"cpu": [1.0, 2.0, 3.0]}, True))
+        for value in (4, 5, 6):
+            history.append({"cpu": value})
+        self.assertEqual(history.since(cursor), ({"cpu": [4.0, 5.0, 6.0]}, True))
+
+    def test_missing_values_round_trip_as_none(self):
+        history = ColumnarHistory({"temp": "d"}, 4)
+        history.append({"temp": 41.5})
+        history.append({"temp": None})
+        self.assertEqual(history.columns(), {"temp": [41.5, None]})
+
+
+if __name__ == "__main__":
+    unittest.main()
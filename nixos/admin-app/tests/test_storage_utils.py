@@ -0,0 +1,69 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from storage_utils import DiskIOSampler, fill_eta, parse_diskstats, parse_pressure, sqlite_file_sizes
+
+from fakes import FakeClock
+
+
+def diskstats_line(name, minor, reads, read_sectors, read_ms, writes, write_sectors, write_ms, io_ms):
+    return f" 179 {minor} {name} {reads} 0 {read_sectors} {read_ms} {writes} 0 {write_sectors} {write_ms} 0 {io_ms} 0\n"
+
+
+class ParseTest(unittest.TestCase):
+    def test_parse_diskstats_keys_by_device_number(self):
+        devices = parse_diskstats(diskstats_line("mmcblk0p2", 2, 10, 80, 5, 20, 160, 40, 30) + "garbage\n")
+        self.assertEqual(list(devices), [(179, 2)])
+        self.assertEqual(devices[(179, 2)]["name"], "mmcblk0p2")
+        self.assertEqual(devices[(179, 2)]["write_sectors"], 160)
+
+    def test_parse_pressure(self):
+        text = "some avg10=1.50 avg60=0.80 avg300=0.20 total=12345\nfull avg10=0.40 avg60=0.10 avg300=0.00 total=999\n"
+        pressure = parse_pressure(text)
+        self.assertEqual(pressure["some"]["avg10"], 1.5)
+        self.assertEqual(pressure["full"]["total"], 999)
+
+    def test_sqlite_file_sizes_include_wal_and_shm(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "database.sqlite3"
+            db.write_bytes(b"x" * 100)
+            Path(f"{db}-wal").write_bytes(b"x" * 40)
+            self.assertEqual(sqlite_file_sizes(db), {"db": 100, "wal": 40, "shm": 0, "total": 140})
+
+
+class FillEtaTest(unittest.TestCase):
+    def test_linear_growth_projects_time_to_full(self):
+        timestamps = [0, 1800, 3600, 5400, 7200]
+        used = [50, 51, 52, 53, 54]
+        self.assertAlmostEqual(fill_eta(timestamps, used), 46 * 1800)
+
+    def test_flat_short_or_shrinking_usage_has_no_eta(self):
+        self.assertIsNone(fill_eta([0, 1800, 3600], [50, 50, 50]))
+        self.assertIsNone(fill_eta([0, 60, 120], [50, 60, 70]))
+        self.assertIsNone(fill_eta([0, 1800, 3600], [60, 55, 50]))
+
+
+class DiskIOSamplerTest(unittest.TestCase):
+    def test_rates_from_consecutive_samples_of_whole_disks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = Path(tmp) / "diskstats"
+            clock = FakeClock(10.0)
+            sampler = DiskIOSampler(tmp, diskstats_path=stats, clock=clock)
+            stats.write_text(diskstats_line("mmcblk0", 0, 100, 800, 50, 200, 1600, 400, 300))
+            first = sampler.sample()
+            self.assertEqual(first["device"], "mmcblk0")
+            self.assertIsNone(first["write_bytes_per_s"])
+
+            clock.now += 10
+            stats.write_text(diskstats_line("mmcblk0", 0, 110, 880, 60, 290, 3648, 580, 1300))
+            second = sampler.sample()
+            self.assertEqual(second["read_bytes_per_s"], 80 * 512 // 10)
+            self.assertEqual(second["write_bytes_per_s"], round(2048 * 512 / 10))
+            self.assertEqual(second["write_iops"], 9.0)
+            self.assertEqual(second["await_ms"], 1.9)
+            self.assertEqual(second["util_percent"], 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
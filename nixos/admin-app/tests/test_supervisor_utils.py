@@ -0,0 +1,91 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from supervisor_utils import LeaderLock, Supervisor, Worker
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class LeaderLockTest(unittest.TestCase):
+    def test_only_one_holder(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "workers.lock"
+            first, second = LeaderLock(path), LeaderLock(path)
+            self.assertTrue(first.acquire())
+            self.assertFalse(second.acquire())
+            first.release()
+            self.assertTrue(second.acquire())
+            second.release()
+
+
+class SupervisorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lock_path = Path(self.tmp.name) / "workers.lock"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_runs_ticks_records_errors_and_restarts_dead_threads(self):
+        calls = []
+
+        def tick():
+            calls.append(len(calls))
+            if len(calls) == 2:
+                raise RuntimeError("backup failed")
+            if len(calls) == 3:
+                raise SystemExit
+            return None
+
+        supervisor = Supervisor(LeaderLock(self.lock_path), check_interval=0.02, restart_delay=0)
+        supervisor.add(Worker("backup", tick, interval=0.01))
+        supervisor.start()
+        self.assertTrue(wait_for(lambda: len(calls) >= 5))
+        supervisor.stop(timeout=1)
+
+        status = supervisor.status()
+        worker = status["workers"][0]
+        self.assertEqual(worker["errors"], 2)
+        self.assertEqual(worker["restarts"], 1)
+        self.assertIsNone(worker["last_error"])
+        self.assertFalse(status["leader"])
+
+    def test_second_supervisor_stands_by_until_leader_stops(self):
+        ticks = {"a": 0, "b": 0}
+
+        def make_tick(key):
+            def tick():
+                ticks[key] += 1
+            return tick
+
+        wakeup = threading.Event()
+        first = Supervisor(LeaderLock(self.lock_path), check_interval=0.02)
+        first.add(Worker("stats", make_tick("a"), interval=10, wakeup=wakeup))
+        second = Supervisor(LeaderLock(self.lock_path), check_interval=0.02)
+        second.add(Worker("stats", make_tick("b"), interval=10))
+        first.start()
+        self.assertTrue(wait_for(lambda: ticks["a"] == 1))
+        second.start()
+        time.sleep(0.1)
+        self.assertEqual(second.status()["workers"][0]["health"], "standby")
+
+        wakeup.set()
+        self.assertTrue(wait_for(lambda: ticks["a"] == 2))
+        first.stop(timeout=1)
+        self.assertTrue(wait_for(lambda: ticks["b"] == 1))
+        self.assertTrue(second.status()["leader"])
+        second.stop(timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
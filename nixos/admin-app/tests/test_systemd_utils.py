@@ -0,0 +1,81 @@
+import unittest
+
+from systemd_utils import UnitStateCache, parse_systemctl_show
+
+from fakes import FakeClock
+
+SHOW_OUTPUT = """Id=lnbits.service
+LoadState=loaded
+ActiveState=active
+SubState=running
+MainPID=812
+NRestarts=2
+ControlGroup=/system.slice/lnbits.service
+
+Id=phoenixd.service
+LoadState=loaded
+ActiveState=inactive
+SubState=dead
+MainPID=0
+NRestarts=0
+"""
+
+
+class ParseSystemctlShowTest(unittest.TestCase):
+    def test_parses_each_unit_block(self):
+        units = parse_systemctl_show(SHOW_OUTPUT)
+        self.assertEqual(units["lnbits.service"], {
+            "load_state": "loaded",
+            "active_state": "active",
+            "sub_state": "running",
+            "main_pid": 812,
+            "n_restarts": 2,
+            "control_group": "/system.slice/lnbits.service",
+        })
+        self.assertIsNone(units["phoenixd.service"]["main_pid"])
+        self.assertEqual(units["phoenixd.service"]["active_state"], "inactive")
+
+    def test_ignores_blocks_without_id(self):
+        self.assertEqual(parse_systemctl_show("ActiveState=active\n\n"), {})
+
+
+class UnitStateCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(100.0)
+        self.calls = []
+
+        def runner(units):
+            self.calls.append(list(units))
+            return SHOW_OUTPUT
+
+        self.cache = UnitStateCache(["lnbits", "phoenixd"], runner, ttl=5, clock=self.clock)
+
+    def test_one_query_serves_all_units_until_ttl(self):
+        self.assertEqual(self.cache.active_state("lnbits"), "active")
+        self.assertEqual(self.cache.active_state("phoenixd.service"), "inactive")
+        self.assertEqual(self.calls, [["lnbits.service", "phoenixd.service"]])
+        self.clock.now += 5
+        self.cache.states()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_invalidate_forces_refresh(self):
+        self.cache.states()
+        self.cache.invalidate()
+        self.cache.states()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_untracked_unit_is_added_to_the_batch(self):
+        self.cache.states()
+        self.assertEqual(self.cache.active_state("tor"), "unknown")
+        self.assertEqual(self.calls[-1], ["lnbits.service", "phoenixd.service", "tor.service"])
+
+    def test_runner_failure_reports_unknown(self):
+        def broken(units):
+            raise OSError("systemctl missing")
+
+        cache = UnitStateCache(["lnbits"], broken, clock=self.clock)
+        self.assertEqual(cache.active_state("lnbits"), "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,8 @@ let
     psutil
     qrcode
     requests
+    waitress  # production WSGI server
+    brotli  # .br variants of the static asset bundles
   ]);
 in
 pkgs.stdenv.mkDerivation {
@@ -18,14 +20,17 @@ pkgs.stdenv.mkDerivation {
 
   src = ./admin-app;
 
-  dontBuild = true;
+  # Bundle, minify, hash and precompress static/js + static/css into static/dist
+  buildPhase = ''
+    ${python}/bin/python asset_utils.py
+  '';
 
   installPhase = ''
     mkdir -p $out/lib/lnbitspi-admin
     mkdir -p $out/bin
 
-    # Copy application files
-    cp -r $src/* $out/lib/lnbitspi-admin/
+    # Copy application files (including the static/dist bundles built above)
+    cp -r ./* $out/lib/lnbitspi-admin/
 
     # Create wrapper script
     cat > $out/bin/lnbitspi-admin << EOF
@@ -29,6 +29,10 @@ in
       Restart = "on-failure";
       RestartSec = 5;
 
+      # app.py drains in-flight requests for up to 10s on SIGTERM
+      KillSignal = "SIGTERM";
+      TimeoutStopSec = 20;
+
       # PrivateTmp must be off: wpa_cli creates response sockets in /tmp
       # that wpa_supplicant (in a different unit) needs to reach.
       PrivateTmp = false;
@@ -51,7 +51,9 @@ let
     chmod 600 ${keyFile}
   '';
 
-  # Script to generate Caddyfile based on system state
+  # Script to generate Caddyfile based on system state.
+  # Everything is no-store except the admin app's content-hashed /box/assets/*, which the
+  # app serves with Cache-Control: immutable
   generate-caddy-config = pkgs.writeShellScript "generate-caddy-config" ''
     if [ -f ${markerFile} ]; then
       BACKEND="127.0.0.1:5000"
@@ -68,7 +70,8 @@ let
       "" \
       'https:// {' \
       '	tls ${certFile} ${keyFile}' \
-      '	header Cache-Control "no-store"' \
+      '	@no-store not path /box/assets/*' \
+      '	header @no-store Cache-Control "no-store"' \
       "" \
       '	handle /health {' \
       '		respond "ok" 200' \
@@ -93,7 +96,8 @@ let
       '}' \
       "" \
       'http:// {' \
-      '	header Cache-Control "no-store"' \
+      '	@no-store not path /box/assets/*' \
+      '	header @no-store Cache-Control "no-store"' \
       "" \
       '	@onion-box-redir {' \
       '		host *.onion' \